@@ -3,13 +3,17 @@ from __future__ import annotations
 from fastapi import APIRouter, Header, HTTPException
 from pydantic import BaseModel, Field
 
+from app.cache import bump_generation
 from app.db import SessionLocal, init_db
 from app.models.audit_log import AuditLog
 from app.models.commitment import Commitment
 from app.models.ingestion_job import IngestionJob
 from app.models.meeting import Meeting
+from app.models.meeting_context_summary import MeetingContextSummary
 from app.models.meeting_participant import MeetingParticipant
+from app.models.payload_blob import PayloadBlob
 from app.models.person import Person
+from app.models.person_interaction_day import PersonInteractionDay
 from app.models.risk_flag import RiskFlag
 from app.models.source_record import SourceRecord
 from app.scripts.seed_data import seed
@@ -90,11 +94,16 @@ def reset_demo_data(x_api_key: str | None = Header(default=None, alias="X-API-Ke
         session.query(AuditLog).delete(synchronize_session=False)
         session.query(RiskFlag).delete(synchronize_session=False)
         session.query(Commitment).delete(synchronize_session=False)
+        session.query(MeetingContextSummary).delete(synchronize_session=False)
         session.query(SourceRecord).delete(synchronize_session=False)
         session.query(MeetingParticipant).delete(synchronize_session=False)
         session.query(IngestionJob).delete(synchronize_session=False)
+        session.query(PayloadBlob).delete(synchronize_session=False)
         session.query(Meeting).delete(synchronize_session=False)
+        session.query(PersonInteractionDay).delete(synchronize_session=False)
         session.query(Person).delete(synchronize_session=False)
+        # Bulk deletes skip the flush hooks, so invalidate cached responses explicitly.
+        bump_generation(session.connection())
         session.commit()
     finally:
         session.close()
@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.db import get_db
+from app.models.audit_log import AuditLog
+
+router = APIRouter(prefix="/api/audit", tags=["audit"])
+
+AUDIT_DEFAULT_LIMIT = 100
+AUDIT_MAX_LIMIT = 1000
+
+
+def _encode_cursor(entry: AuditLog) -> str:
+    values = [entry.created_at.isoformat(), entry.id]
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, entry_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(entry_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+@router.get("")
+def audit_history(
+    entity_type: str | None = Query(None),
+    entity_id: str | None = Query(None),
+    action: str | None = Query(None),
+    limit: int = Query(AUDIT_DEFAULT_LIMIT),
+    cursor: str | None = Query(None),
+    db: Session = Depends(get_db),
+) -> dict:
+    if limit < 1 or limit > AUDIT_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {AUDIT_MAX_LIMIT}")
+    if entity_id and not entity_type:
+        raise HTTPException(status_code=400, detail="entity_id requires entity_type")
+
+    # Newest first; served by ix_audit_log_entity or ix_audit_log_created_at_id.
+    query = db.query(AuditLog)
+    if entity_type:
+        query = query.filter(AuditLog.entity_type == entity_type)
+    if entity_id:
+        query = query.filter(AuditLog.entity_id == entity_id)
+    if action:
+        query = query.filter(AuditLog.action == action)
+    if cursor:
+        created_at, entry_id = _decode_cursor(cursor)
+        query = query.filter(tuple_(AuditLog.created_at, AuditLog.id) < tuple_(created_at, entry_id))
+    entries = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit + 1).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    return {
+        "items": [
+            {
+                "id": entry.id,
+                "actor": entry.actor,
+                "action": entry.action,
+                "entity_type": entry.entity_type,
+                "entity_id": entry.entity_id,
+                "payload": entry.payload,
+                "created_at": entry.created_at.isoformat(),
+            }
+            for entry in entries
+        ],
+        "next_cursor": _encode_cursor(entries[-1]) if has_more else None,
+    }
@@ -1,12 +1,13 @@
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
+from app.cache import cached_response
 from app.db import get_db
 from app.models.commitment import Commitment
 from app.models.meeting import Meeting
+from app.models.meeting_context_summary import MeetingContextSummary
 from app.models.source_record import SourceRecord
 from app.models.meeting_participant import MeetingParticipant
 from app.models.person import Person
@@ -26,11 +27,16 @@ def _status_for(last_source_at: datetime | None, now: datetime) -> str:
 
 @router.get("/today")
 def get_today_briefings(
+    request: Request,
     db: Session = Depends(get_db),
     cached: bool = Query(False),
     offline: bool = Query(False),
     cached_at: datetime | None = Query(None),
-) -> dict:
+) -> Response:
+    return cached_response(request, db, lambda: _today_briefings(db, cached, offline, cached_at))
+
+
+def _today_briefings(db: Session, cached: bool, offline: bool, cached_at: datetime | None) -> dict:
     now = cached_at or datetime.utcnow()
     start = datetime(now.year, now.month, now.day)
     end = start + timedelta(days=1)
@@ -42,22 +48,21 @@ def get_today_briefings(
         .all()
     )
 
+    meeting_ids = [meeting.id for meeting in meetings]
+    summaries: dict[str, MeetingContextSummary] = {}
+    if meeting_ids:
+        summaries = {
+            summary.meeting_id: summary
+            for summary in db.query(MeetingContextSummary)
+            .filter(MeetingContextSummary.meeting_id.in_(meeting_ids))
+            .all()
+        }
+
     results = []
     for meeting in meetings:
-        source = (
-            db.query(SourceRecord)
-            .filter(SourceRecord.meeting_id == meeting.id)
-            .order_by(SourceRecord.captured_at.desc())
-            .first()
-        )
-        last_source_at = source.captured_at if source else None
+        summary = summaries.get(meeting.id)
+        last_source_at = summary.last_captured_at if summary else None
         status = _status_for(last_source_at, now)
-        commitments_count = (
-            db.query(func.count(Commitment.id))
-            .join(SourceRecord, Commitment.source_id == SourceRecord.id)
-            .filter(SourceRecord.meeting_id == meeting.id)
-            .scalar()
-        )
         results.append(
             {
                 "id": meeting.id,
@@ -65,7 +70,7 @@ def get_today_briefings(
                 "starts_at": meeting.starts_at,
                 "status": status,
                 "last_source_at": last_source_at,
-                "open_commitments": commitments_count or 0,
+                "open_commitments": summary.commitment_count if summary else 0,
             }
         )
 
@@ -80,11 +85,16 @@ def get_today_briefings(
 
 @router.get("/next")
 def get_next_briefing(
+    request: Request,
     db: Session = Depends(get_db),
     cached: bool = Query(False),
     offline: bool = Query(False),
     cached_at: datetime | None = Query(None),
-) -> dict:
+) -> Response:
+    return cached_response(request, db, lambda: _next_briefing(db, cached, offline, cached_at))
+
+
+def _next_briefing(db: Session, cached: bool, offline: bool, cached_at: datetime | None) -> dict:
     now = cached_at or datetime.utcnow()
     meeting = (
         db.query(Meeting)
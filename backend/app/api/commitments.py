@@ -1,7 +1,10 @@
+import base64
+import json
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
+from sqlalchemy import and_, or_, select, tuple_
 from sqlalchemy.orm import Session
 
 from app.models.meeting import Meeting
@@ -9,9 +12,9 @@ from app.models.meeting_participant import MeetingParticipant
 from app.models.person import Person
 from app.models.source_record import SourceRecord
 
+from app.cache import cached_response
 from app.db import get_db
 from app.models.commitment import Commitment
-from app.models.ingestion_job import IngestionJob
 
 router = APIRouter(prefix="/api/commitments", tags=["commitments"])
 
@@ -24,19 +27,100 @@ class CommitmentUpdateRequest(BaseModel):
     relevant_by: datetime | None = None
 
 
-@router.get("/closure")
-def commitment_closure(db: Session = Depends(get_db)) -> dict:
-    now = datetime.utcnow()
-    commitments = (
-        db.query(Commitment, SourceRecord, Meeting)
-        .join(SourceRecord, Commitment.source_id == SourceRecord.id)
-        .join(Meeting, SourceRecord.meeting_id == Meeting.id)
-        .order_by(Commitment.due_at.asc().nulls_last(), Commitment.created_at.asc())
-        .all()
+CLOSURE_DEFAULT_LIMIT = 200
+CLOSURE_MAX_LIMIT = 1000
+
+
+def _encode_cursor(commitment: Commitment) -> str:
+    values = [
+        commitment.due_at.isoformat() if commitment.due_at else None,
+        commitment.created_at.isoformat(),
+        commitment.id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime | None, datetime, str]:
+    try:
+        due_at, created_at, commitment_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return (
+            datetime.fromisoformat(due_at) if due_at else None,
+            datetime.fromisoformat(created_at),
+            str(commitment_id),
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def _after_cursor(cursor: tuple[datetime | None, datetime, str]):
+    # Mirrors the due_at NULLS LAST, created_at, id ordering.
+    due_at, created_at, commitment_id = cursor
+    tail = tuple_(Commitment.created_at, Commitment.id) > tuple_(created_at, commitment_id)
+    if due_at is None:
+        return and_(Commitment.due_at.is_(None), tail)
+    return or_(
+        Commitment.due_at > due_at,
+        and_(Commitment.due_at == due_at, tail),
+        Commitment.due_at.is_(None),
     )
 
+
+@router.get("/closure")
+def commitment_closure(
+    request: Request,
+    limit: int = Query(CLOSURE_DEFAULT_LIMIT),
+    cursor: str | None = Query(None),
+    acknowledged: bool | None = Query(None),
+    due_before: datetime | None = Query(None),
+    due_after: datetime | None = Query(None),
+    created_after: datetime | None = Query(None),
+    meeting_id: str | None = Query(None),
+    person_id: str | None = Query(None),
+    db: Session = Depends(get_db),
+) -> Response:
+    if limit < 1 or limit > CLOSURE_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {CLOSURE_MAX_LIMIT}")
+    position = _decode_cursor(cursor) if cursor else None
+
+    def build() -> dict:
+        query = (
+            db.query(Commitment, SourceRecord, Meeting)
+            .join(SourceRecord, Commitment.source_id == SourceRecord.id)
+            .join(Meeting, SourceRecord.meeting_id == Meeting.id)
+        )
+        if acknowledged is not None:
+            query = query.filter(Commitment.acknowledged.is_(acknowledged))
+        if due_before:
+            query = query.filter(Commitment.due_at < due_before)
+        if due_after:
+            query = query.filter(Commitment.due_at >= due_after)
+        if created_after:
+            query = query.filter(Commitment.created_at >= created_after)
+        if meeting_id:
+            query = query.filter(SourceRecord.meeting_id == meeting_id)
+        if person_id:
+            query = query.filter(
+                SourceRecord.meeting_id.in_(
+                    select(MeetingParticipant.meeting_id).where(MeetingParticipant.person_id == person_id)
+                )
+            )
+        if position:
+            query = query.filter(_after_cursor(position))
+        rows = (
+            query.order_by(
+                Commitment.due_at.asc().nulls_last(), Commitment.created_at.asc(), Commitment.id.asc()
+            )
+            .limit(limit + 1)
+            .all()
+        )
+        return _commitment_closure(db, rows[:limit], has_more=len(rows) > limit)
+
+    return cached_response(request, db, build)
+
+
+def _commitment_closure(db: Session, commitments: list, has_more: bool) -> dict:
+    now = datetime.utcnow()
     meeting_ids = {meeting.id for (_, _, meeting) in commitments}
-    source_ids = {source.id for (_, source, _) in commitments}
     participants = (
         db.query(MeetingParticipant.meeting_id, Person.id, Person.name, Person.type)
         .join(Person, MeetingParticipant.person_id == Person.id)
@@ -49,26 +133,10 @@ def commitment_closure(db: Session = Depends(get_db)) -> dict:
             {"id": person_id, "name": name, "type": person_type}
         )
 
-    job_payloads: dict[str, str] = {}
-    if source_ids:
-        jobs = (
-            db.query(IngestionJob.source_id, IngestionJob.payload, IngestionJob.capture_type)
-            .filter(IngestionJob.source_id.in_(source_ids))
-            .all()
-        )
-        for source_id, payload, capture_type in jobs:
-            if not source_id:
-                continue
-            job_payloads[source_id] = payload or ""
-
     items = []
     for commitment, source, meeting in commitments:
         due_at = commitment.due_at
         needs_attention = bool(due_at and due_at < now and not commitment.acknowledged)
-        excerpt = None
-        if source.id in job_payloads:
-            raw = job_payloads[source.id].strip()
-            excerpt = raw[:240] if raw else None
         items.append(
             {
                 "id": commitment.id,
@@ -85,18 +153,23 @@ def commitment_closure(db: Session = Depends(get_db)) -> dict:
                     "id": source.id,
                     "capture_type": source.capture_type,
                     "captured_at": source.captured_at,
-                    "excerpt": excerpt,
+                    "excerpt": source.excerpt,
                 },
                 "people": people_by_meeting.get(meeting.id, []),
                 "needs_attention": needs_attention,
             }
         )
 
-    return {"updated_at": now.isoformat(), "items": items}
+    next_cursor = _encode_cursor(commitments[-1][0]) if has_more else None
+    return {"updated_at": now.isoformat(), "items": items, "next_cursor": next_cursor}
 
 
 @router.get("/threads")
-def unresolved_threads(db: Session = Depends(get_db)) -> dict:
+def unresolved_threads(request: Request, db: Session = Depends(get_db)) -> Response:
+    return cached_response(request, db, lambda: _unresolved_threads(db))
+
+
+def _unresolved_threads(db: Session) -> dict:
     now = datetime.utcnow()
     commitments = (
         db.query(Commitment, SourceRecord, Meeting)
@@ -110,7 +183,6 @@ def unresolved_threads(db: Session = Depends(get_db)) -> dict:
         return {"updated_at": now.isoformat(), "threads": []}
 
     meeting_ids = {meeting.id for (_, _, meeting) in commitments}
-    source_ids = {source.id for (_, source, _) in commitments}
 
     participants = (
         db.query(MeetingParticipant.meeting_id, Person.id, Person.name, Person.type)
@@ -124,18 +196,6 @@ def unresolved_threads(db: Session = Depends(get_db)) -> dict:
             {"id": person_id, "name": name, "type": person_type}
         )
 
-    job_payloads: dict[str, str] = {}
-    if source_ids:
-        jobs = (
-            db.query(IngestionJob.source_id, IngestionJob.payload, IngestionJob.capture_type)
-            .filter(IngestionJob.source_id.in_(source_ids))
-            .all()
-        )
-        for source_id, payload, _capture_type in jobs:
-            if not source_id:
-                continue
-            job_payloads[source_id] = payload or ""
-
     threads = {}
     for commitment, source, meeting in commitments:
         thread = threads.setdefault(
@@ -160,13 +220,12 @@ def unresolved_threads(db: Session = Depends(get_db)) -> dict:
             }
         )
         if source.id not in {ex["source_id"] for ex in thread["excerpts"]}:
-            raw = job_payloads.get(source.id, "").strip()
             thread["excerpts"].append(
                 {
                     "source_id": source.id,
                     "capture_type": source.capture_type,
                     "captured_at": source.captured_at,
-                    "excerpt": raw[:240] if raw else None,
+                    "excerpt": source.excerpt,
                 }
             )
 
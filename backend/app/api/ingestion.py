@@ -3,16 +3,20 @@ import hashlib
 from uuid import uuid4
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 import json
 
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session, defer
+from starlette.concurrency import run_in_threadpool
 
 from app.db import get_db
+from app.ingestion.wakeup import notify_worker
 from app.models.ingestion_job import IngestionJob
 from app.models.meeting import Meeting
 from app.models.person import Person
+from app.models.source_record import SourceRecord
+from app.ops.payload_store import load_payloads, payload_digest, store_payloads
 
 router = APIRouter(prefix="/api/ingestion", tags=["ingestion"])
 
@@ -31,6 +35,20 @@ class IngestionResponse(BaseModel):
     job_id: str
 
 
+class BulkIngestionItem(BaseModel):
+    index: int
+    status: str
+    job_id: str | None = None
+    error: str | None = None
+
+
+class BulkIngestionResponse(BaseModel):
+    queued: int
+    deduped: int
+    rejected: int
+    items: list[BulkIngestionItem]
+
+
 class IngestionStatusResponse(BaseModel):
     id: str
     status: str
@@ -55,12 +73,17 @@ class RecentCapture(BaseModel):
     id: str
     source_id: str | None
     capture_type: str
-    payload: str
+    payload: str | None = None
+    excerpt: str | None = None
+    payload_length: int | None = None
+    line_count: int | None = None
     captured_at: datetime
     meeting: RecentCaptureMeeting
     people: list[RecentCapturePerson]
 
 DEDUP_WINDOW_SECONDS = 120
+BULK_MAX_ITEMS = 5000
+CAPTURE_TYPES = {"notes", "transcript", "decision", "follow-up", "reflection"}
 
 
 def _normalize_payload(payload: str | None) -> str:
@@ -89,72 +112,238 @@ def _normalize_relevant_at(value: datetime | None) -> datetime | None:
     return value
 
 
-@router.post("", response_model=IngestionResponse, status_code=status.HTTP_202_ACCEPTED)
-def create_ingestion(request: IngestionRequest, db: Session = Depends(get_db)) -> IngestionResponse:
-    if request.capture_type not in {"notes", "transcript", "decision", "follow-up", "reflection"}:
-        raise HTTPException(status_code=400, detail="Invalid capture_type")
-    meeting = db.get(Meeting, request.meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+def _people_json(people_ids: list[str] | None, existing_ids: set[str]) -> str | None:
+    if not people_ids:
+        return None
+    cleaned = [pid.strip() for pid in people_ids if pid.strip()]
+    # Sorted, as the people lookup used to return them, so dedupe keys stay stable.
+    linked = sorted(set(cleaned) & existing_ids)
+    return json.dumps(linked) if linked else None
 
-    people_json = None
-    if request.people_ids:
-        people_ids = [pid.strip() for pid in request.people_ids if pid.strip()]
-        if people_ids:
-            existing = db.query(Person.id).filter(Person.id.in_(people_ids)).all()
-            existing_ids = [pid for (pid,) in existing]
-            if existing_ids:
-                people_json = json.dumps(existing_ids)
-    normalized_payload = _normalize_payload(request.payload)
+
+def _requested_people_ids(request: IngestionRequest) -> list[str]:
+    return [pid.strip() for pid in request.people_ids or [] if pid.strip()]
+
+
+def _build_job(request: IngestionRequest, people_json: str | None) -> IngestionJob:
     relevant_at = _normalize_relevant_at(request.relevant_at)
     index_in_memory = (
         request.index_in_memory
         if request.index_in_memory is not None
         else request.capture_type == "reflection"
     )
-    dedupe_key = _dedupe_key(request.meeting_id, request.capture_type, normalized_payload, people_json, relevant_at)
-    if normalized_payload:
-        cutoff = datetime.utcnow() - timedelta(seconds=DEDUP_WINDOW_SECONDS)
-        candidates = (
-            db.query(IngestionJob)
-            .filter(IngestionJob.meeting_id == request.meeting_id)
-            .filter(IngestionJob.capture_type == request.capture_type)
-            .filter(IngestionJob.created_at >= cutoff)
-            .filter(IngestionJob.people_ids == people_json)
-            .filter(IngestionJob.relevant_at == relevant_at)
-            .filter(IngestionJob.dedupe_key == dedupe_key)
-            .order_by(IngestionJob.created_at.desc())
-            .all()
-        )
-        for candidate in candidates:
-            if _normalize_payload(candidate.payload) == normalized_payload:
-                return IngestionResponse(job_id=candidate.id)
-    job_id = f"j_{uuid4().hex}"
-    job = IngestionJob(
-        id=job_id,
+    normalized_payload = _normalize_payload(request.payload)
+    return IngestionJob(
+        id=f"j_{uuid4().hex}",
         meeting_id=request.meeting_id,
-        payload=request.payload,
+        payload_digest=payload_digest(request.payload),
         capture_type=request.capture_type,
         people_ids=people_json,
         relevant_at=relevant_at,
         commitment_relevant_by=request.commitment_relevant_by,
         index_in_memory=index_in_memory,
-        dedupe_key=dedupe_key,
+        dedupe_key=_dedupe_key(request.meeting_id, request.capture_type, normalized_payload, people_json, relevant_at),
         status="queued",
     )
+
+
+def _existing_dedupe_keys(db: Session, keys: set[str | None]) -> dict[str, tuple[str, datetime]]:
+    keys.discard(None)
+    if not keys:
+        return {}
+    rows = (
+        db.query(IngestionJob.dedupe_key, IngestionJob.id, IngestionJob.created_at)
+        .filter(IngestionJob.dedupe_key.in_(keys))
+        .all()
+    )
+    return {key: (job_id, created_at) for key, job_id, created_at in rows}
+
+
+def _dedupe_job(db: Session, job: IngestionJob, payload: str, existing: dict[str, tuple[str, datetime]]) -> str | None:
+    """Return the job a capture dedupes onto, or give `job` the capture's dedupe key.
+
+    Only non-empty captures repeated within DEDUP_WINDOW_SECONDS are deduped. dedupe_key
+    is unique per job, so an older job holding the key gives it up to the repeat.
+    """
+    if not _normalize_payload(payload):
+        # Empty captures never dedupe, so they do not hold a key either.
+        job.dedupe_key = None
+        return None
+    holder = existing.get(job.dedupe_key)
+    if holder:
+        holder_id, created_at = holder
+        if created_at >= datetime.utcnow() - timedelta(seconds=DEDUP_WINDOW_SECONDS):
+            return holder_id
+        db.query(IngestionJob).filter(IngestionJob.id == holder_id).update(
+            {IngestionJob.dedupe_key: None}, synchronize_session=False
+        )
+    existing[job.dedupe_key] = (job.id, datetime.utcnow())
+    return None
+
+
+@router.post("", response_model=IngestionResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_ingestion(request: IngestionRequest, db: Session = Depends(get_db)) -> IngestionResponse:
+    if request.capture_type not in CAPTURE_TYPES:
+        raise HTTPException(status_code=400, detail="Invalid capture_type")
+    meeting = db.get(Meeting, request.meeting_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    existing_ids: set[str] = set()
+    requested_ids = _requested_people_ids(request)
+    if requested_ids:
+        existing = db.query(Person.id).filter(Person.id.in_(requested_ids)).all()
+        existing_ids = {pid for (pid,) in existing}
+    job = _build_job(request, _people_json(requested_ids, existing_ids))
+    existing = _existing_dedupe_keys(db, {job.dedupe_key})
+    duplicate_id = _dedupe_job(db, job, request.payload, existing)
+    if duplicate_id:
+        return IngestionResponse(job_id=duplicate_id)
+    store_payloads(db, [request.payload])
     db.add(job)
     db.commit()
-    return IngestionResponse(job_id=job_id)
+    notify_worker()
+    return IngestionResponse(job_id=job.id)
+
+
+def _parse_bulk_line(index: int, line: bytes, parsed: list) -> None:
+    if not line.strip():
+        return
+    try:
+        parsed.append((index, json.loads(line)))
+    except json.JSONDecodeError:
+        parsed.append((index, None))
+
+
+async def _read_bulk_items(request: Request) -> list[tuple[int, object]]:
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        try:
+            body = json.loads(await request.body())
+        except json.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        if not isinstance(body, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        if len(body) > BULK_MAX_ITEMS:
+            raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_ITEMS} items per request")
+        return list(enumerate(body))
+
+    # NDJSON is parsed line by line as the body streams in.
+    parsed: list[tuple[int, object]] = []
+    buffer = b""
+    index = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            _parse_bulk_line(index, line, parsed)
+            index += 1
+            if len(parsed) > BULK_MAX_ITEMS:
+                raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_ITEMS} items per request")
+    _parse_bulk_line(index, buffer, parsed)
+    if len(parsed) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_ITEMS} items per request")
+    return parsed
+
+
+def _enqueue_bulk(raw_items: list[tuple[int, object]], db: Session) -> BulkIngestionResponse:
+    results: dict[int, BulkIngestionItem] = {}
+    requests: list[tuple[int, IngestionRequest]] = []
+    for index, raw in raw_items:
+        if raw is None:
+            results[index] = BulkIngestionItem(index=index, status="rejected", error="Invalid JSON")
+            continue
+        try:
+            item = IngestionRequest.model_validate(raw)
+        except ValidationError:
+            results[index] = BulkIngestionItem(index=index, status="rejected", error="Invalid capture")
+            continue
+        if item.capture_type not in CAPTURE_TYPES:
+            results[index] = BulkIngestionItem(index=index, status="rejected", error="Invalid capture_type")
+            continue
+        requests.append((index, item))
+
+    # One query per batch for meetings, people and existing dedupe keys.
+    meeting_ids = {item.meeting_id for _, item in requests}
+    known_meetings: set[str] = set()
+    if meeting_ids:
+        known_meetings = {mid for (mid,) in db.query(Meeting.id).filter(Meeting.id.in_(meeting_ids)).all()}
+    people_ids = {pid for _, item in requests for pid in _requested_people_ids(item)}
+    known_people: set[str] = set()
+    if people_ids:
+        known_people = {pid for (pid,) in db.query(Person.id).filter(Person.id.in_(people_ids)).all()}
+
+    jobs: list[tuple[int, IngestionRequest, IngestionJob]] = []
+    for index, item in requests:
+        if item.meeting_id not in known_meetings:
+            results[index] = BulkIngestionItem(index=index, status="rejected", error="Meeting not found")
+            continue
+        jobs.append((index, item, _build_job(item, _people_json(_requested_people_ids(item), known_people))))
+
+    # Same rule as the single endpoint; captures earlier in the batch count as recent.
+    existing = _existing_dedupe_keys(db, {job.dedupe_key for _, _, job in jobs})
+    queued_payloads: list[str] = []
+    for index, item, job in jobs:
+        duplicate_id = _dedupe_job(db, job, item.payload, existing)
+        if duplicate_id:
+            results[index] = BulkIngestionItem(index=index, status="deduped", job_id=duplicate_id)
+            continue
+        db.add(job)
+        queued_payloads.append(item.payload)
+        results[index] = BulkIngestionItem(index=index, status="queued", job_id=job.id)
+    if queued_payloads:
+        store_payloads(db, queued_payloads)
+        db.commit()
+        notify_worker()
+
+    items = [results[index] for index in sorted(results)]
+    return BulkIngestionResponse(
+        queued=len(queued_payloads),
+        deduped=sum(1 for item in items if item.status == "deduped"),
+        rejected=sum(1 for item in items if item.status == "rejected"),
+        items=items,
+    )
+
+
+@router.post("/bulk", response_model=BulkIngestionResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_bulk_ingestion(request: Request, db: Session = Depends(get_db)) -> BulkIngestionResponse:
+    raw_items = await _read_bulk_items(request)
+    return await run_in_threadpool(_enqueue_bulk, raw_items, db)
+
+
+def _capture_query(db: Session, full: bool):
+    query = db.query(IngestionJob)
+    if not full:
+        # Transcripts can be large; listings show the precomputed source excerpt instead.
+        query = query.options(defer(IngestionJob.payload))
+    return query
+
+
+def _capture_sources(db: Session, jobs: list[IngestionJob]) -> dict:
+    source_ids = {job.source_id for job in jobs if job.source_id}
+    if not source_ids:
+        return {}
+    rows = (
+        db.query(SourceRecord.id, SourceRecord.excerpt, SourceRecord.payload_length, SourceRecord.line_count)
+        .filter(SourceRecord.id.in_(source_ids))
+        .all()
+    )
+    return {row.id: row for row in rows}
+
+
+def _full_payloads(db: Session, jobs: list[IngestionJob]) -> dict[str, str | None]:
+    blobs = load_payloads(db, [job.payload_digest for job in jobs])
+    return {job.id: job.payload if job.payload is not None else blobs.get(job.payload_digest) for job in jobs}
 
 
 @router.get("/recent", response_model=list[RecentCapture])
-def get_recent_ingestion(limit: int = 5, db: Session = Depends(get_db)) -> list[RecentCapture]:
+def get_recent_ingestion(limit: int = 5, full: bool = False, db: Session = Depends(get_db)) -> list[RecentCapture]:
     if limit < 1:
         raise HTTPException(status_code=400, detail="limit must be >= 1")
     if limit > 20:
         raise HTTPException(status_code=400, detail="limit must be <= 20")
     jobs = (
-        db.query(IngestionJob)
+        _capture_query(db, full)
         .filter(IngestionJob.status == "succeeded")
         .filter((IngestionJob.error == None) | (IngestionJob.error != "deduped"))  # noqa: E711
         .order_by(IngestionJob.completed_at.desc(), IngestionJob.created_at.desc())
@@ -186,6 +375,8 @@ def get_recent_ingestion(limit: int = 5, db: Session = Depends(get_db)) -> list[
         people = db.query(Person).filter(Person.id.in_(people_ids)).all()
         people_map = {person.id: person for person in people}
 
+    sources = _capture_sources(db, jobs)
+    payloads = _full_payloads(db, jobs) if full else {}
     results: list[RecentCapture] = []
     for job in jobs:
         meeting = meeting_map.get(job.meeting_id)
@@ -197,12 +388,16 @@ def get_recent_ingestion(limit: int = 5, db: Session = Depends(get_db)) -> list[
             for pid in job_people.get(job.id, [])
             if pid in people_map
         ]
+        source = sources.get(job.source_id)
         results.append(
             RecentCapture(
                 id=job.id,
                 source_id=job.source_id,
                 capture_type=job.capture_type,
-                payload=job.payload,
+                payload=payloads.get(job.id) if full else None,
+                excerpt=source.excerpt if source else None,
+                payload_length=source.payload_length if source else None,
+                line_count=source.line_count if source else None,
                 captured_at=captured_at,
                 meeting=RecentCaptureMeeting(
                     id=meeting.id,
@@ -219,6 +414,7 @@ def get_recent_ingestion(limit: int = 5, db: Session = Depends(get_db)) -> list[
 def get_recent_decisions(
     days: int = 7,
     limit: int = 5,
+    full: bool = False,
     db: Session = Depends(get_db),
 ) -> list[RecentCapture]:
     if days < 1 or days > 30:
@@ -228,7 +424,7 @@ def get_recent_decisions(
     cutoff = datetime.utcnow() - timedelta(days=days)
     fetch_limit = min(max(limit * 5, limit), 200)
     jobs = (
-        db.query(IngestionJob)
+        _capture_query(db, full)
         .filter(IngestionJob.status == "succeeded")
         .filter(IngestionJob.capture_type == "decision")
         .filter(IngestionJob.created_at >= cutoff)
@@ -272,6 +468,8 @@ def get_recent_decisions(
         people = db.query(Person).filter(Person.id.in_(people_ids)).all()
         people_map = {person.id: person for person in people}
 
+    sources = _capture_sources(db, jobs)
+    payloads = _full_payloads(db, jobs) if full else {}
     results: list[RecentCapture] = []
     for job in jobs:
         meeting = meeting_map.get(job.meeting_id)
@@ -283,12 +481,16 @@ def get_recent_decisions(
             for pid in job_people.get(job.id, [])
             if pid in people_map
         ]
+        source = sources.get(job.source_id)
         results.append(
             RecentCapture(
                 id=job.id,
                 source_id=job.source_id,
                 capture_type=job.capture_type,
-                payload=job.payload,
+                payload=payloads.get(job.id) if full else None,
+                excerpt=source.excerpt if source else None,
+                payload_length=source.payload_length if source else None,
+                line_count=source.line_count if source else None,
                 captured_at=captured_at,
                 meeting=RecentCaptureMeeting(
                     id=meeting.id,
@@ -323,4 +525,5 @@ def retry_ingestion(job_id: str, db: Session = Depends(get_db)) -> dict:
     job.status = "queued"
     job.error = None
     db.commit()
+    notify_worker()
     return {"queued": True}
@@ -4,10 +4,11 @@ from datetime import datetime, timedelta
 from typing import Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from app.cache import cached_response
 from app.db import get_db
 from app.models.meeting import Meeting
 
@@ -79,9 +80,14 @@ def update_meeting(meeting_id: str, payload: MeetingUpdateRequest, db: Session =
 
 @router.get("")
 def list_meetings(
+    request: Request,
     range: Literal["today", "upcoming"] = Query("upcoming"),
     db: Session = Depends(get_db),
-) -> dict:
+) -> Response:
+    return cached_response(request, db, lambda: _list_meetings(db, range))
+
+
+def _list_meetings(db: Session, range: str) -> dict:
     now = datetime.utcnow()
     if range == "today":
         start = datetime(now.year, now.month, now.day)
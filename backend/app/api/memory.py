@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.db import get_db
 from app.models.ingestion_job import IngestionJob
+from app.ops.payload_store import load_payload
 from app.ops.qdrant_store import query_documents
 
 router = APIRouter(prefix="/api/memory", tags=["memory"])
@@ -19,11 +20,12 @@ def surface_memory(db: Session = Depends(get_db), limit: int = 5) -> dict:
         .order_by(IngestionJob.completed_at.desc().nulls_last(), IngestionJob.created_at.desc())
         .first()
     )
-    if not reflection or not reflection.payload:
+    query_text = load_payload(db, reflection) if reflection else None
+    if not query_text:
         return {"query": None, "items": [], "why": "No reflections captured yet."}
 
     try:
-        results = query_documents(reflection.payload, limit=limit)
+        results = query_documents(query_text, limit=limit)
     except RuntimeError as exc:
         return {
             "query": None,
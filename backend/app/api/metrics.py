@@ -0,0 +1,35 @@
+import time
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.db import get_db
+from app.metrics import CONTENT_TYPE, REGISTRY, ingestion_queue_depth
+from app.models.ingestion_job import IngestionJob
+
+router = APIRouter(tags=["metrics"])
+
+QUEUE_DEPTH_TTL_SECONDS = 30
+QUEUE_STATUSES = ("queued", "running", "failed", "succeeded")
+
+_queue_depth_checked_at = 0.0
+
+
+def _refresh_queue_depth(db: Session) -> None:
+    # The queue lives in the database and is shared with the worker process, so it is
+    # sampled at most once per TTL instead of on every scrape.
+    global _queue_depth_checked_at
+    now = time.monotonic()
+    if _queue_depth_checked_at and now - _queue_depth_checked_at < QUEUE_DEPTH_TTL_SECONDS:
+        return
+    counts = dict(db.query(IngestionJob.status, func.count(IngestionJob.id)).group_by(IngestionJob.status).all())
+    for status in QUEUE_STATUSES:
+        ingestion_queue_depth.set(counts.get(status, 0), status=status)
+    _queue_depth_checked_at = now
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(db: Session = Depends(get_db)) -> Response:
+    _refresh_queue_depth(db)
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -1,19 +1,24 @@
+import base64
+import json
 from datetime import datetime
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import desc, func
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.db import get_db
 from app.models.meeting import Meeting
+from app.models.meeting_context_summary import MeetingContextSummary
 from app.models.meeting_participant import MeetingParticipant
 from app.models.person import Person
-from app.models.source_record import SourceRecord
 
 router = APIRouter(prefix="/api/people", tags=["people"])
 
+TIMELINE_DEFAULT_LIMIT = 50
+TIMELINE_MAX_LIMIT = 200
+
 
 class PersonCreateRequest(BaseModel):
     name: str = Field(min_length=1)
@@ -81,36 +86,87 @@ def create_person(request: PersonCreateRequest, db: Session = Depends(get_db)) -
     )
 
 
+def _latest_source_ids(db: Session, meeting_ids: list[str]) -> dict[str, str]:
+    if not meeting_ids:
+        return {}
+    rows = (
+        db.query(MeetingContextSummary.meeting_id, MeetingContextSummary.last_source_id)
+        .filter(MeetingContextSummary.meeting_id.in_(meeting_ids))
+        .filter(MeetingContextSummary.last_source_id != None)  # noqa: E711
+        .all()
+    )
+    return {meeting_id: source_id for meeting_id, source_id in rows}
+
+
+def _encode_cursor(meeting: Meeting) -> str:
+    values = [meeting.starts_at.isoformat(), meeting.id]
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        starts_at, meeting_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(starts_at), str(meeting_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
 @router.get("/{person_id}/timeline")
-def person_timeline(person_id: str, db: Session = Depends(get_db)) -> dict:
+def person_timeline(
+    person_id: str,
+    before: str | None = Query(None),
+    after: str | None = Query(None),
+    limit: int = Query(TIMELINE_DEFAULT_LIMIT),
+    db: Session = Depends(get_db),
+) -> dict:
+    if limit < 1 or limit > TIMELINE_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {TIMELINE_MAX_LIMIT}")
+    if before and after:
+        raise HTTPException(status_code=400, detail="Use either before or after, not both")
     person = db.get(Person, person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
 
-    meetings = (
+    query = (
         db.query(Meeting)
         .join(MeetingParticipant, MeetingParticipant.meeting_id == Meeting.id)
         .filter(MeetingParticipant.person_id == person_id)
-        .order_by(desc(Meeting.starts_at), Meeting.id.asc())
-        .all()
     )
-
+    # Newest first, ties by id ascending. The (starts_at, id) cursor keeps meetings that
+    # share a start time from falling between pages; the two columns sort in opposite
+    # directions, so the keyset predicate is spelled out rather than a tuple comparison.
+    if after:
+        starts_at, meeting_id = _decode_cursor(after)
+        # Walk forward from the cursor, then present newest first like every other page.
+        query = query.filter(
+            or_(Meeting.starts_at > starts_at, and_(Meeting.starts_at == starts_at, Meeting.id < meeting_id))
+        )
+        query = query.order_by(Meeting.starts_at.asc(), Meeting.id.desc())
+    else:
+        if before:
+            starts_at, meeting_id = _decode_cursor(before)
+            query = query.filter(
+                or_(Meeting.starts_at < starts_at, and_(Meeting.starts_at == starts_at, Meeting.id > meeting_id))
+            )
+        query = query.order_by(Meeting.starts_at.desc(), Meeting.id.asc())
+    meetings = query.limit(limit + 1).all()
+    has_more = len(meetings) > limit
+    meetings = meetings[:limit]
+    if after:
+        meetings.reverse()
+
+    latest_sources = _latest_source_ids(db, [meeting.id for meeting in meetings])
     timeline = []
     for meeting in meetings:
-        source = (
-            db.query(SourceRecord)
-            .filter(SourceRecord.meeting_id == meeting.id)
-            .order_by(SourceRecord.captured_at.desc())
-            .first()
-        )
+        source_id = latest_sources.get(meeting.id)
         timeline.append(
             {
                 "occurred_at": meeting.starts_at,
                 "meeting_id": meeting.id,
                 "meeting_title": meeting.title,
                 "meeting_starts_at": meeting.starts_at,
-                "source_id": source.id if source else None,
-                "source_missing": source is None,
+                "source_id": source_id,
+                "source_missing": source_id is None,
             }
         )
 
@@ -122,4 +178,10 @@ def person_timeline(person_id: str, db: Session = Depends(get_db)) -> dict:
             "last_interaction_at": person.last_interaction_at,
         },
         "timeline": timeline,
+        "page": {
+            "limit": limit,
+            "has_more": has_more,
+            "next_before": _encode_cursor(meetings[-1]) if meetings else None,
+            "next_after": _encode_cursor(meetings[0]) if meetings else None,
+        },
     }
@@ -1,20 +1,24 @@
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from uuid import uuid4
 
 import json
+import math
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import func, text
+from sqlalchemy import and_, case, func, literal, or_, select, text, union_all
 from sqlalchemy.orm import Session
 
 from app.db import get_db
 from app.models.audit_log import AuditLog
 from app.models.meeting import Meeting
+from app.models.meeting_context_summary import MeetingContextSummary
 from app.models.meeting_participant import MeetingParticipant
 from app.models.person import Person
+from app.models.person_interaction_day import PersonInteractionDay
 from app.models.source_record import SourceRecord
 from app.models.ingestion_job import IngestionJob
+from app.ops.audit_archive import archive_audit_log
 from app.ops.backup import _status_path, create_backup
 from app.settings import allow_plaintext_db
 from app.calendar.status import read_status as read_calendar_status
@@ -48,6 +52,12 @@ def status(db: Session = Depends(get_db)) -> dict:
         .filter(IngestionJob.status == "failed")
         .scalar()
     )
+    index_counts = dict(
+        db.query(SourceRecord.index_status, func.count(SourceRecord.id))
+        .filter(SourceRecord.index_status != None)  # noqa: E711
+        .group_by(SourceRecord.index_status)
+        .all()
+    )
     calendar_status = read_calendar_status()
     calendar_error = calendar_status.get("last_error")
     health = "attention" if error_count or calendar_error else "healthy"
@@ -65,6 +75,11 @@ def status(db: Session = Depends(get_db)) -> dict:
         "ingestion_last_success": last_success,
         "backup_last_status": backup_status,
         "calendar_status": calendar_status,
+        "memory_index": {
+            "pending": index_counts.get("pending", 0),
+            "indexed": index_counts.get("indexed", 0),
+            "failed": index_counts.get("failed", 0),
+        },
         "error_count": error_count,
         "updated_at": now,
     }
@@ -78,11 +93,10 @@ def context_gaps(db: Session = Depends(get_db)) -> dict:
         db.query(
             Meeting.id,
             Meeting.title,
-            func.max(SourceRecord.captured_at).label("last_captured"),
+            MeetingContextSummary.last_captured_at,
         )
-        .outerjoin(SourceRecord, SourceRecord.meeting_id == Meeting.id)
-        .group_by(Meeting.id)
-        .order_by(func.max(SourceRecord.captured_at).asc().nulls_first(), Meeting.starts_at.asc())
+        .outerjoin(MeetingContextSummary, MeetingContextSummary.meeting_id == Meeting.id)
+        .order_by(MeetingContextSummary.last_captured_at.asc().nulls_first(), Meeting.starts_at.asc())
         .limit(5)
         .all()
     )
@@ -124,27 +138,92 @@ def context_gaps(db: Session = Depends(get_db)) -> dict:
     return {"updated_at": now.isoformat(), "meetings": meetings, "people": people}
 
 
+RELATIONSHIP_MAX_LIMIT = 1000
+
+
+def _validate_page(limit: int | None, offset: int, sort: str, sorts: tuple[str, ...]) -> None:
+    # Without a limit every person is returned, as before paging was added.
+    if limit is not None and (limit < 1 or limit > RELATIONSHIP_MAX_LIMIT):
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {RELATIONSHIP_MAX_LIMIT}")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must be non-negative")
+    if sort not in sorts:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(sorts)}")
+
+
+def _page(db: Session, limit: int | None, offset: int, returned: int) -> dict:
+    total = db.query(func.count(Person.id)).scalar() or 0
+    return {"limit": limit, "offset": offset, "total": total, "has_more": offset + returned < total}
+
+
+def _interaction_counts(since: datetime, split: datetime):
+    """Per-person captures from `since` to `split` (prior) and from `split` on (recent).
+
+    Whole days come from the day buckets. The days containing `since` and `split` only
+    partly fall in the window, so those are counted from the source records instead.
+    """
+    edge_days = {since.date(), split.date()}
+    buckets = select(
+        PersonInteractionDay.person_id,
+        case((PersonInteractionDay.day >= split.date(), PersonInteractionDay.count), else_=0).label("recent"),
+        case((PersonInteractionDay.day < split.date(), PersonInteractionDay.count), else_=0).label("prior"),
+    ).where(PersonInteractionDay.day >= since.date(), PersonInteractionDay.day.notin_(edge_days))
+    in_edge_day = or_(
+        *[
+            and_(
+                SourceRecord.captured_at >= datetime.combine(day, time.min),
+                SourceRecord.captured_at < datetime.combine(day + timedelta(days=1), time.min),
+            )
+            for day in edge_days
+        ]
+    )
+    edges = (
+        select(
+            MeetingParticipant.person_id,
+            case((SourceRecord.captured_at >= split, literal(1)), else_=0).label("recent"),
+            case((SourceRecord.captured_at < split, literal(1)), else_=0).label("prior"),
+        )
+        .join(SourceRecord, SourceRecord.meeting_id == MeetingParticipant.meeting_id)
+        .where(SourceRecord.captured_at >= since, in_edge_day)
+    )
+    rows = union_all(buckets, edges).subquery()
+    return (
+        select(
+            rows.c.person_id,
+            func.sum(rows.c.recent).label("recent"),
+            func.sum(rows.c.prior).label("prior"),
+        )
+        .group_by(rows.c.person_id)
+        .subquery()
+    )
+
+
 @router.get("/status/relationship-signals")
-def relationship_signals(db: Session = Depends(get_db)) -> dict:
+def relationship_signals(
+    limit: int | None = None,
+    offset: int = 0,
+    sort: str = "name",
+    db: Session = Depends(get_db),
+) -> dict:
+    _validate_page(limit, offset, sort, ("name", "recent", "stale"))
     now = datetime.utcnow()
     since = now - timedelta(days=30)
-    people_rows = (
-        db.query(Person.id, Person.name, Person.last_interaction_at)
-        .order_by(Person.name.asc())
-        .all()
-    )
 
-    counts = (
-        db.query(MeetingParticipant.person_id, func.count(SourceRecord.id))
-        .join(SourceRecord, SourceRecord.meeting_id == MeetingParticipant.meeting_id)
-        .filter(SourceRecord.captured_at >= since)
-        .group_by(MeetingParticipant.person_id)
-        .all()
+    counts = _interaction_counts(since, since)
+    recent = func.coalesce(counts.c.recent, 0)
+    query = db.query(Person.id, Person.name, Person.last_interaction_at, recent).outerjoin(
+        counts, counts.c.person_id == Person.id
     )
-    count_map = {person_id: count for person_id, count in counts}
+    if sort == "recent":
+        query = query.order_by(recent.desc(), Person.name.asc())
+    elif sort == "stale":
+        query = query.order_by(Person.last_interaction_at.asc().nulls_first(), Person.name.asc())
+    else:
+        query = query.order_by(Person.name.asc())
+    rows = query.order_by(Person.id.asc()).offset(offset).limit(limit).all()
 
     items = []
-    for person_id, name, last_interaction_at in people_rows:
+    for person_id, name, last_interaction_at, recent_count in rows:
         days_since = None
         if last_interaction_at:
             days_since = (now - last_interaction_at).days
@@ -154,47 +233,48 @@ def relationship_signals(db: Session = Depends(get_db)) -> dict:
                 "name": name,
                 "last_updated": last_interaction_at,
                 "days_since": days_since,
-                "recent_context_count": count_map.get(person_id, 0),
+                "recent_context_count": recent_count,
             }
         )
 
-    return {"updated_at": now.isoformat(), "since": since.isoformat(), "items": items}
+    return {
+        "updated_at": now.isoformat(),
+        "since": since.isoformat(),
+        "items": items,
+        "page": _page(db, limit, offset, len(items)),
+    }
 
 
 @router.get("/status/relationship-trajectories")
-def relationship_trajectories(db: Session = Depends(get_db)) -> dict:
+def relationship_trajectories(
+    limit: int | None = None,
+    offset: int = 0,
+    sort: str = "name",
+    db: Session = Depends(get_db),
+) -> dict:
+    _validate_page(limit, offset, sort, ("name", "recent", "rising", "falling"))
     now = datetime.utcnow()
     recent_since = now - timedelta(days=30)
     prior_since = now - timedelta(days=60)
 
-    people_rows = (
-        db.query(Person.id, Person.name, Person.last_interaction_at)
-        .order_by(Person.name.asc())
-        .all()
+    counts = _interaction_counts(prior_since, recent_since)
+    recent = func.coalesce(counts.c.recent, 0)
+    prior = func.coalesce(counts.c.prior, 0)
+    query = db.query(Person.id, Person.name, Person.last_interaction_at, recent, prior).outerjoin(
+        counts, counts.c.person_id == Person.id
     )
-
-    recent_counts = (
-        db.query(MeetingParticipant.person_id, func.count(SourceRecord.id))
-        .join(SourceRecord, SourceRecord.meeting_id == MeetingParticipant.meeting_id)
-        .filter(SourceRecord.captured_at >= recent_since)
-        .group_by(MeetingParticipant.person_id)
-        .all()
-    )
-    prior_counts = (
-        db.query(MeetingParticipant.person_id, func.count(SourceRecord.id))
-        .join(SourceRecord, SourceRecord.meeting_id == MeetingParticipant.meeting_id)
-        .filter(SourceRecord.captured_at >= prior_since)
-        .filter(SourceRecord.captured_at < recent_since)
-        .group_by(MeetingParticipant.person_id)
-        .all()
-    )
-    recent_map = {person_id: count for person_id, count in recent_counts}
-    prior_map = {person_id: count for person_id, count in prior_counts}
+    if sort == "recent":
+        query = query.order_by(recent.desc(), Person.name.asc())
+    elif sort == "rising":
+        query = query.order_by((recent - prior).desc(), Person.name.asc())
+    elif sort == "falling":
+        query = query.order_by((recent - prior).asc(), Person.name.asc())
+    else:
+        query = query.order_by(Person.name.asc())
+    rows = query.order_by(Person.id.asc()).offset(offset).limit(limit).all()
 
     items = []
-    for person_id, name, last_interaction_at in people_rows:
-        recent_count = recent_map.get(person_id, 0)
-        prior_count = prior_map.get(person_id, 0)
+    for person_id, name, last_interaction_at, recent_count, prior_count in rows:
         if recent_count > prior_count:
             trajectory = "More present"
         elif recent_count < prior_count:
@@ -217,9 +297,49 @@ def relationship_trajectories(db: Session = Depends(get_db)) -> dict:
         "recent_since": recent_since.isoformat(),
         "prior_since": prior_since.isoformat(),
         "items": items,
+        "page": _page(db, limit, offset, len(items)),
     }
 
 
+def _percentile(values: list[float], pct: float) -> float:
+    # Nearest-rank percentile over an already sorted list.
+    rank = math.ceil(pct / 100 * len(values))
+    return values[max(0, min(len(values), rank) - 1)]
+
+
+@router.get("/status/ingestion-stages")
+def ingestion_stages(limit: int = 500, db: Session = Depends(get_db)) -> dict:
+    if limit < 1 or limit > 5000:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 5000")
+    rows = (
+        db.query(IngestionJob.stage_timings)
+        .filter(IngestionJob.status == "succeeded")
+        .filter(IngestionJob.stage_timings != None)  # noqa: E711
+        .order_by(IngestionJob.completed_at.desc())
+        .limit(limit)
+        .all()
+    )
+    samples: dict[str, list[float]] = {}
+    for (raw,) in rows:
+        try:
+            timings = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        for stage, duration in timings.items():
+            samples.setdefault(stage, []).append(float(duration))
+
+    stages = {}
+    for stage, values in samples.items():
+        values.sort()
+        stages[stage] = {
+            "count": len(values),
+            "p50_ms": _percentile(values, 50),
+            "p95_ms": _percentile(values, 95),
+            "p99_ms": _percentile(values, 99),
+        }
+    return {"updated_at": datetime.utcnow().isoformat(), "sample_size": len(rows), "stages": stages}
+
+
 class StatusAction(BaseModel):
     action: str
 
@@ -239,4 +359,6 @@ def status_actions(request: StatusAction, db: Session = Depends(get_db)) -> dict
         )
         db.commit()
         return {"queued": False, "result": result}
+    if request.action == "archive_audit":
+        return {"queued": False, "result": archive_audit_log()}
     return {"queued": False, "result": {"status": "ignored"}}
@@ -0,0 +1,193 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy.dialects.sqlite import insert
+
+from app.models.audit_log import AuditLog
+from app.settings import get_audit_batch_size, get_audit_flush_seconds, get_data_dir
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_DIR = "audit"
+
+
+def audit_entries(session) -> list[dict]:
+    now = datetime.utcnow()
+    entries = []
+    for action, objects in (("create", session.new), ("delete", session.deleted)):
+        entries.extend(_entry(action, obj, now) for obj in objects if not isinstance(obj, AuditLog))
+    for obj in session.dirty:
+        if isinstance(obj, AuditLog):
+            continue
+        if session.is_modified(obj, include_collections=False):
+            entries.append(_entry("update", obj, now))
+    return entries
+
+
+def _entry(action: str, obj, now: datetime) -> dict:
+    return {
+        "id": f"al_{uuid4().hex}",
+        "actor": "system",
+        "action": action,
+        "entity_type": obj.__class__.__name__,
+        "entity_id": getattr(obj, "id", "unknown"),
+        "payload": None,
+        "created_at": now,
+    }
+
+
+def insert_entries(connection, entries: list[dict]) -> None:
+    # Ids are assigned at capture time, so replaying a segment after a crash is idempotent.
+    statement = insert(AuditLog.__table__).on_conflict_do_nothing(index_elements=["id"])
+    batch_size = get_audit_batch_size()
+    for start in range(0, len(entries), batch_size):
+        connection.execute(statement, entries[start : start + batch_size])
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AuditWriter:
+    """Writes committed audit entries outside the request transaction.
+
+    "async" entries only live in memory until the next flush. "batched" entries are first
+    appended to a per-process segment file, so a crashed process's entries are loaded by
+    the next writer to start.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._buffer: list[dict] = []
+        # Entries appended to this process's segment since it was last rotated.
+        self._segment_pending = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def _segment_dir(self) -> Path:
+        return Path(get_data_dir()) / SEGMENT_DIR
+
+    @property
+    def _segment_path(self) -> Path:
+        return self._segment_dir / f"segment-{os.getpid()}.jsonl"
+
+    def submit(self, entries: list[dict], mode: str) -> None:
+        # Runs after the commit, so it must never raise into the caller of session.commit().
+        try:
+            with self._lock:
+                if mode == "batched":
+                    try:
+                        self._append_segment(entries)
+                        self._segment_pending += len(entries)
+                    except OSError:
+                        # Keep the entries rather than lose them; they flush like "async" ones.
+                        logger.warning("Audit segment write failed, buffering in memory", exc_info=True)
+                        self._buffer.extend(entries)
+                else:
+                    self._buffer.extend(entries)
+                pending = len(self._buffer) + self._segment_pending
+            self._start()
+            if pending >= get_audit_batch_size():
+                self._wake.set()
+        except Exception:
+            logger.error("Audit writer submit failed", exc_info=True)
+
+    def _append_segment(self, entries: list[dict]) -> None:
+        self._segment_dir.mkdir(parents=True, exist_ok=True)
+        lines = "".join(
+            json.dumps({**entry, "created_at": entry["created_at"].isoformat()}) + "\n" for entry in entries
+        )
+        with self._segment_path.open("a", encoding="utf-8") as handle:
+            handle.write(lines)
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _adopt_orphaned_segments(self) -> None:
+        if not self._segment_dir.exists():
+            return
+        for path in self._segment_dir.glob("segment-*"):
+            try:
+                pid = int(path.name.split("-")[1].split(".")[0])
+            except (IndexError, ValueError):
+                continue
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+            try:
+                path.rename(self._segment_dir / f"segment-{os.getpid()}-{uuid4().hex}.loading")
+            except FileNotFoundError:
+                # Another process adopted it first.
+                continue
+
+    def _run(self) -> None:
+        try:
+            self._adopt_orphaned_segments()
+        except OSError:
+            logger.error("Audit segment adoption failed", exc_info=True)
+        while not self._stopped.is_set():
+            self._wake.wait(get_audit_flush_seconds())
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Entries stay buffered or on disk and are retried on the next tick.
+                logger.error("Audit writer flush failed", exc_info=True)
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                buffered, self._buffer = self._buffer, []
+                self._segment_pending = 0
+                if self._segment_path.exists():
+                    self._segment_path.rename(
+                        self._segment_dir / f"segment-{os.getpid()}-{uuid4().hex}.loading"
+                    )
+            loading = sorted(self._segment_dir.glob(f"segment-{os.getpid()}-*.loading"))
+            entries = list(buffered)
+            for path in loading:
+                for line in path.read_text(encoding="utf-8").splitlines():
+                    if line:
+                        entry = json.loads(line)
+                        entry["created_at"] = datetime.fromisoformat(entry["created_at"])
+                        entries.append(entry)
+            if not entries:
+                return 0
+            try:
+                with self.engine.begin() as connection:
+                    insert_entries(connection, entries)
+            except Exception:
+                # Segment files are kept until loaded; only the in-memory part needs requeueing.
+                with self._lock:
+                    self._buffer[:0] = buffered
+                raise
+            for path in loading:
+                path.unlink(missing_ok=True)
+            return len(entries)
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
@@ -0,0 +1,139 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from uuid import uuid4
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import inspect, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.models.cache_generation import CacheGeneration
+from app.models.commitment import Commitment
+from app.models.meeting import Meeting
+from app.models.meeting_participant import MeetingParticipant
+from app.models.person import Person
+from app.models.source_record import SourceRecord
+from app.settings import get_response_cache_seconds
+
+GENERATION_NAME = "responses"
+MAX_ENTRIES = 256
+INVALIDATING_MODELS = (Meeting, SourceRecord, Commitment, MeetingParticipant, Person)
+# Models whose updates only matter for some columns; the rest invalidate on any change.
+# The indexer's index_* bookkeeping on SourceRecord never reaches a cached response.
+_TRACKED_ATTRIBUTES = {
+    SourceRecord: (
+        "meeting_id",
+        "captured_at",
+        "capture_type",
+        "uri",
+        "relevant_at",
+        "excerpt",
+        "payload_length",
+        "line_count",
+    ),
+}
+# For the standalone sqlcipher3 maintenance scripts.
+BUMP_GENERATION_SQL = "UPDATE cache_generation SET token = lower(hex(randomblob(16)))"
+
+
+def bump_generation(connection) -> None:
+    # A random token rather than a counter, so a restored or recreated database never
+    # reuses a generation that cached entries were built against.
+    statement = insert(CacheGeneration.__table__).values(name=GENERATION_NAME, token=uuid4().hex)
+    connection.execute(
+        statement.on_conflict_do_update(index_elements=["name"], set_={"token": statement.excluded.token})
+    )
+
+
+def ensure_generation(connection) -> None:
+    connection.execute(
+        insert(CacheGeneration.__table__)
+        .values(name=GENERATION_NAME, token=uuid4().hex)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+
+
+def invalidate_on_flush(session) -> None:
+    for obj in [*session.new, *session.deleted]:
+        if isinstance(obj, INVALIDATING_MODELS):
+            bump_generation(session.connection())
+            return
+    for obj in session.dirty:
+        if isinstance(obj, INVALIDATING_MODELS) and _response_fields_modified(session, obj):
+            bump_generation(session.connection())
+            return
+
+
+def _response_fields_modified(session, obj) -> bool:
+    attributes = _TRACKED_ATTRIBUTES.get(type(obj))
+    if attributes is None:
+        return session.is_modified(obj, include_collections=False)
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+def current_generation(db: Session) -> str | None:
+    return db.execute(
+        select(CacheGeneration.token).where(CacheGeneration.name == GENERATION_NAME)
+    ).scalar()
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[str, float, bytes, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, generation: str, ttl: float) -> tuple[bytes, str] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry_generation, stored_at, body, etag = entry
+            if entry_generation != generation or time.monotonic() - stored_at > ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body, etag
+
+    def put(self, key: tuple, generation: str, body: bytes, etag: str) -> None:
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic(), body, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+RESPONSE_CACHE = ResponseCache()
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in [value.strip() for value in header.split(",")]
+
+
+def cached_response(request: Request, db: Session, build: Callable[[], dict]) -> Response:
+    ttl = get_response_cache_seconds()
+    # Read the generation before building so a concurrent write invalidates what we store.
+    generation = current_generation(db) if ttl else None
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+    cached = RESPONSE_CACHE.get(key, generation, ttl) if generation else None
+    if cached:
+        body, etag = cached
+    else:
+        body = JSONResponse(jsonable_encoder(build())).body
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if generation:
+            RESPONSE_CACHE.put(key, generation, body, etag)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,18 +1,62 @@
-from uuid import uuid4
+import atexit
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from . import models
 from .models import Base
-from .models.audit_log import AuditLog
-from .settings import allow_plaintext_db, get_database_key, get_database_url
+from .audit import AuditWriter, audit_entries, insert_entries
+from .cache import ensure_generation, invalidate_on_flush
+from .summaries import refresh_summaries
+from .settings import (
+    allow_plaintext_db,
+    get_audit_mode,
+    get_database_key,
+    get_database_url,
+    get_db_path,
+    get_db_pool_max_overflow,
+    get_db_pool_prewarm,
+    get_db_pool_size,
+    get_db_profile,
+)
+from .sqlcipher import connection_key_pragmas, key_pragmas, read_salt
+
+# Applied on every new connection. WAL lets the API read while the worker writes, and
+# busy_timeout makes the remaining writer/writer collisions wait instead of failing.
+DB_PROFILES = {
+    "none": (),
+    "balanced": (
+        "PRAGMA journal_mode = WAL;",
+        "PRAGMA synchronous = NORMAL;",
+        "PRAGMA busy_timeout = 5000;",
+        "PRAGMA cache_size = -65536;",
+        "PRAGMA temp_store = MEMORY;",
+        "PRAGMA mmap_size = 268435456;",
+    ),
+    "durable": (
+        "PRAGMA journal_mode = WAL;",
+        "PRAGMA synchronous = FULL;",
+        "PRAGMA busy_timeout = 5000;",
+        "PRAGMA cache_size = -16384;",
+        "PRAGMA temp_store = MEMORY;",
+    ),
+}
+
+
+def _file_backed(database_url: str) -> bool:
+    path = database_url.split(":///", 1)[1] if ":///" in database_url else ""
+    return bool(path) and path != ":memory:" and "mode=memory" not in path
 
 
 def create_db_engine():
     database_url = get_database_url()
     connect_args = {"check_same_thread": False}
     engine_kwargs = {"connect_args": connect_args}
+    if _file_backed(database_url):
+        # Only file databases get a QueuePool; in-memory ones use pools without sizing.
+        engine_kwargs["pool_size"] = get_db_pool_size()
+        engine_kwargs["max_overflow"] = get_db_pool_max_overflow()
+    module = None
     if database_url.startswith("sqlite+pysqlcipher:///") and not allow_plaintext_db():
         key = get_database_key()
         if not key:
@@ -24,36 +68,95 @@ def create_db_engine():
                 "SQLCipher driver missing. Install sqlcipher3-binary and avoid conda base."
             ) from exc
         database_url = database_url.replace("sqlite+pysqlcipher:///", "sqlite:///", 1)
-        engine_kwargs["module"] = sqlcipher3.dbapi2
+        module = sqlcipher3.dbapi2
+        engine_kwargs["module"] = module
     engine = create_engine(database_url, **engine_kwargs)
     if not allow_plaintext_db():
-        _attach_sqlcipher_key(engine)
+        _attach_sqlcipher_key(engine, module)
+    _attach_profile(engine)
     return engine
 
 
-def _attach_sqlcipher_key(engine):
-    key = get_database_key()
-    if not key:
+def _attach_sqlcipher_key(engine, module):
+    if not get_database_key():
         raise RuntimeError("CUSTOS_DATABASE_KEY is required for SQLCipher encryption.")
+    db_path = get_db_path()
+    # Key statements per database salt: a restore or a freshly created file changes the
+    # salt, and with it the raw key, without recreating the engine.
+    resolved: dict[bytes | None, list[str]] = {}
+    salts: dict[str, bytes | None] = {}
+    verified = []
+
+    @event.listens_for(engine, "first_connect")
+    def _reset_salt(_dbapi_connection, _connection_record):
+        # Fires once per pool, so engine.dispose() (as restore does) re-reads the header.
+        salts.clear()
 
     @event.listens_for(engine, "connect")
     def _set_sqlcipher_key(dbapi_connection, _connection_record):
+        salt = None
+        if module:
+            salt = salts.get("salt")
+            if salt is None:
+                # A database that has not been written yet has no salt, so keep looking.
+                salt = salts["salt"] = read_salt(db_path)
+        statements = resolved.get(salt)
+        if statements is None:
+            statements = connection_key_pragmas(module, db_path, salt) if module else key_pragmas()
+            resolved[salt] = statements
         cursor = dbapi_connection.cursor()
-        cursor.execute(f"PRAGMA key = '{key}';")
-        cursor.execute("PRAGMA cipher_version;")
-        cipher_version = cursor.fetchone()
-        if not cipher_version or not cipher_version[0]:
-            raise RuntimeError("SQLCipher is not active. Encryption check failed.")
+        for statement in statements:
+            cursor.execute(statement)
+        if not verified:
+            cursor.execute("PRAGMA cipher_version;")
+            cipher_version = cursor.fetchone()
+            if not cipher_version or not cipher_version[0]:
+                raise RuntimeError("SQLCipher is not active. Encryption check failed.")
+            verified.append(True)
+        cursor.close()
+
+
+def _attach_profile(engine):
+    profile = get_db_profile()
+    if profile not in DB_PROFILES:
+        expected = ", ".join(DB_PROFILES)
+        raise RuntimeError(f"Unknown CUSTOS_DB_PROFILE {profile!r}; expected one of {expected}.")
+    statements = DB_PROFILES[profile]
+    if not statements:
+        return
+
+    # Registered after the key listener, so SQLCipher is keyed before the first read.
+    @event.listens_for(engine, "connect")
+    def _apply_profile(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
         cursor.close()
 
 
 engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+audit_writer = AuditWriter(engine)
+atexit.register(audit_writer.close)
 
 
 def init_db():
     _ = models
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        ensure_generation(connection)
+    if get_db_pool_prewarm():
+        prewarm_pool()
+
+
+def prewarm_pool():
+    # Opens the whole pool up front so key setup and pragmas are paid at startup,
+    # not by the first requests.
+    if not _file_backed(str(engine.url)):
+        return
+    connections = [engine.connect() for _ in range(get_db_pool_size())]
+    for connection in connections:
+        connection.close()
 
 
 def get_db():
@@ -68,34 +171,33 @@ def get_db():
 def write_audit_log(session, _flush_context):
     if session.info.get("audit_skip"):
         return
-    entries = []
-    for obj in session.new:
-        if isinstance(obj, AuditLog):
-            continue
-        entries.append(_audit_entry("create", obj))
-    for obj in session.dirty:
-        if isinstance(obj, AuditLog):
-            continue
-        if session.is_modified(obj, include_collections=False):
-            entries.append(_audit_entry("update", obj))
-    for obj in session.deleted:
-        if isinstance(obj, AuditLog):
-            continue
-        entries.append(_audit_entry("delete", obj))
+    entries = audit_entries(session)
+    if not entries:
+        return
+    if get_audit_mode() == "sync":
+        insert_entries(session.connection(), entries)
+    else:
+        # Held until commit so rolled-back changes are never audited.
+        session.info.setdefault("audit_pending", []).extend(entries)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def submit_audit_log(session):
+    entries = session.info.pop("audit_pending", None)
     if entries:
-        session.info["audit_skip"] = True
-        for entry in entries:
-            session.add(entry)
-        session.info["audit_skip"] = False
-
-
-def _audit_entry(action, obj):
-    entity_type = obj.__class__.__name__
-    entity_id = getattr(obj, "id", "unknown")
-    return AuditLog(
-        id=f"al_{uuid4().hex}",
-        actor="system",
-        action=action,
-        entity_type=entity_type,
-        entity_id=entity_id,
-    )
+        audit_writer.submit(entries, get_audit_mode())
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def discard_audit_log(session):
+    session.info.pop("audit_pending", None)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def maintain_summaries(session, _flush_context):
+    refresh_summaries(session)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def invalidate_response_cache(session, _flush_context):
+    invalidate_on_flush(session)
@@ -0,0 +1,154 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal
+from app.models.ingestion_job import IngestionJob
+from app.models.meeting import Meeting
+from app.models.source_record import SourceRecord
+from app.ops.payload_store import load_payloads
+from app.ops.qdrant_store import add_documents
+from app.settings import get_index_batch_size, get_worker_lease_seconds
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+RETRY_SECONDS = 30
+POLL_SECONDS = 5
+
+
+def _make_excerpt(payload: str | None, limit: int = 200) -> str:
+    excerpt = (payload or "").strip()
+    if len(excerpt) > limit:
+        excerpt = f"{excerpt[: limit - 3]}…"
+    return excerpt or "No capture excerpt available."
+
+
+def _claim_sources(session: Session, now: datetime, limit: int) -> list[SourceRecord]:
+    # Every worker process runs an indexer, so pending sources are leased before embedding.
+    # The lease reuses index_retry_at: a claimed source stays invisible to other indexers
+    # until the lease lapses, which also brings it back if this process dies mid-batch.
+    due = or_(SourceRecord.index_retry_at == None, SourceRecord.index_retry_at <= now)  # noqa: E711
+    pending_ids = (
+        select(SourceRecord.id)
+        .where(SourceRecord.index_status == "pending", due)
+        .order_by(SourceRecord.captured_at.asc())
+        .limit(limit)
+    )
+    claimed_ids = (
+        session.execute(
+            update(SourceRecord)
+            .where(SourceRecord.id.in_(pending_ids), SourceRecord.index_status == "pending", due)
+            .values(index_retry_at=now + timedelta(seconds=get_worker_lease_seconds()))
+            .returning(SourceRecord.id),
+            execution_options={"synchronize_session": False},
+        )
+        .scalars()
+        .all()
+    )
+    session.commit()
+    if not claimed_ids:
+        return []
+    return (
+        session.query(SourceRecord)
+        .filter(SourceRecord.id.in_(claimed_ids))
+        .order_by(SourceRecord.captured_at.asc())
+        .all()
+    )
+
+
+def _source_payloads(session: Session, sources: list[SourceRecord]) -> dict[str, str]:
+    blobs = load_payloads(session, [source.payload_digest for source in sources])
+    payloads = {source.id: blobs[source.payload_digest] for source in sources if source.payload_digest in blobs}
+    # Sources created before the blob store still resolve through their job's inline payload.
+    legacy_ids = [source.id for source in sources if source.id not in payloads]
+    if legacy_ids:
+        rows = (
+            session.query(IngestionJob.source_id, IngestionJob.payload)
+            .filter(IngestionJob.source_id.in_(legacy_ids))
+            .filter(or_(IngestionJob.error == None, IngestionJob.error != "deduped"))  # noqa: E711
+            .all()
+        )
+        for source_id, payload in rows:
+            payloads.setdefault(source_id, payload or "")
+    return payloads
+
+
+def _mark_retry(sources: list[SourceRecord], now: datetime, error: str) -> None:
+    for source in sources:
+        source.index_attempts = (source.index_attempts or 0) + 1
+        source.index_error = error[:500]
+        if source.index_attempts >= MAX_ATTEMPTS:
+            source.index_status = "failed"
+            source.index_retry_at = None
+        else:
+            source.index_retry_at = now + timedelta(seconds=RETRY_SECONDS * source.index_attempts)
+
+
+def run_once(batch_size: int | None = None) -> int:
+    session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        sources = _claim_sources(session, now, batch_size or get_index_batch_size())
+        if not sources:
+            return 0
+        payloads = _source_payloads(session, sources)
+        meeting_ids = {source.meeting_id for source in sources}
+        titles = dict(session.query(Meeting.id, Meeting.title).filter(Meeting.id.in_(meeting_ids)).all())
+
+        documents = []
+        metadata = []
+        for source in sources:
+            payload = payloads.get(source.id, "")
+            documents.append(payload)
+            metadata.append(
+                {
+                    "source_id": source.id,
+                    "meeting_id": source.meeting_id,
+                    "meeting_title": titles.get(source.meeting_id, "Context"),
+                    "captured_at": source.captured_at.isoformat(),
+                    "capture_type": source.capture_type,
+                    "excerpt": _make_excerpt(payload),
+                }
+            )
+        try:
+            add_documents(documents=documents, metadata=metadata, ids=[source.id for source in sources])
+        except Exception as exc:
+            # Vector indexing is best-effort; the batch is retried with backoff.
+            logger.warning("Vector indexing failed for %d sources", len(sources), exc_info=True)
+            _mark_retry(sources, now, str(exc))
+        else:
+            for source in sources:
+                source.index_status = "indexed"
+                source.index_retry_at = None
+                source.index_error = None
+        session.commit()
+        return len(sources)
+    finally:
+        session.close()
+
+
+def run_forever():
+    while True:
+        try:
+            processed = run_once()
+        except Exception:
+            # A transient database error must not stop the background thread for good.
+            logger.error("Memory indexer pass failed", exc_info=True)
+            processed = 0
+        if not processed:
+            time.sleep(POLL_SECONDS)
+
+
+def start_background() -> threading.Thread:
+    thread = threading.Thread(target=run_forever, name="memory-indexer", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    run_forever()
@@ -0,0 +1,78 @@
+import logging
+import select
+import socket
+import time
+
+from app.settings import get_worker_wake_port
+
+logger = logging.getLogger(__name__)
+
+WAKE_HOST = "127.0.0.1"
+WAKE_MESSAGE = b"wake"
+
+
+def notify_worker() -> None:
+    port = get_worker_wake_port()
+    if not port:
+        return
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(WAKE_MESSAGE, (WAKE_HOST, port))
+    except OSError:
+        # Wake-ups only cut latency; the worker's fallback poll still picks the job up.
+        pass
+
+
+class WakeListener:
+    def __init__(self, port: int | None = None):
+        self.port = get_worker_wake_port() if port is None else port
+        self._sock = None
+        if not self.port:
+            return
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if hasattr(socket, "SO_REUSEPORT"):
+            # Worker processes of one pool share the port; the kernel hands each wake-up
+            # to one of them, and any worker can claim the job.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        try:
+            sock.bind((WAKE_HOST, self.port))
+        except OSError as exc:
+            logger.warning(
+                "Worker wake-up listener unavailable on %s:%s, falling back to polling: %s. "
+                "Give each worker pool its own CUSTOS_WORKER_WAKE_PORT, or set it to 0.",
+                WAKE_HOST,
+                self.port,
+                exc,
+            )
+            sock.close()
+            return
+        sock.setblocking(False)
+        self._sock = sock
+
+    @property
+    def active(self) -> bool:
+        return self._sock is not None
+
+    def wait(self, timeout: float) -> bool:
+        if self._sock is None:
+            time.sleep(timeout)
+            return False
+        ready, _, _ = select.select([self._sock], [], [], timeout)
+        if not ready:
+            return False
+        self._drain()
+        return True
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._sock.recv(64)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
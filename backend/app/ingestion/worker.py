@@ -1,11 +1,18 @@
+import os
+import socket
+import threading
 import time
 from datetime import datetime, timedelta
 from uuid import uuid4
 
+from sqlalchemy import and_, or_, select, text, update
 from sqlalchemy.orm import Session
 
-from app.db import SessionLocal, init_db
+from app.db import SessionLocal, engine, init_db
+from app.ingestion import indexer
 from app.ingestion.rules import extract_commitments, extract_risk_flags
+from app.ingestion.wakeup import WakeListener
+from app.metrics import ingestion_batch_duration, ingestion_jobs, start_metrics_server
 import hashlib
 from app.models.commitment import Commitment
 from app.models.ingestion_job import IngestionJob
@@ -14,37 +21,138 @@ import json
 from app.models.meeting_participant import MeetingParticipant
 from app.models.person import Person
 from app.models.risk_flag import RiskFlag
-from app.models.meeting import Meeting
-from app.ops.qdrant_store import add_documents
 from app.models.source_record import SourceRecord
+from app.ops.payload_store import load_payload
+from app.settings import (
+    get_worker_batch_size,
+    get_worker_concurrency,
+    get_worker_lease_seconds,
+    get_worker_max_poll_seconds,
+    get_worker_metrics_port,
+)
 
 BACKOFF_SECONDS = 30
 POLL_SECONDS = 2
+EXCERPT_LENGTH = 240
 
+_ready_engine = None
+_ready_lock = threading.Lock()
 
-def _eligible_failed_jobs(session: Session, now: datetime):
+
+def _ensure_ready():
+    # Schema check, SQLCipher keying and pool warm-up happen once per engine,
+    # not on every loop tick.
+    global _ready_engine
+    if _ready_engine is engine:
+        return
+    with _ready_lock:
+        if _ready_engine is engine:
+            return
+        init_db()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        _ready_engine = engine
+
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def _requeue_failed_jobs(session: Session, now: datetime) -> int:
     cutoff = now - timedelta(seconds=BACKOFF_SECONDS)
-    return (
-        session.query(IngestionJob)
-        .filter(IngestionJob.status == "failed", IngestionJob.completed_at <= cutoff)
-        .all()
+    result = session.execute(
+        update(IngestionJob)
+        .where(IngestionJob.status == "failed", IngestionJob.completed_at <= cutoff)
+        .values(status="queued", error=None),
+        execution_options={"synchronize_session": False},
     )
+    return result.rowcount
 
 
-def _next_queued_job(session: Session):
+def _reclaim_expired_leases(session: Session, now: datetime) -> int:
+    # Jobs left running by a crashed worker go back to the queue once their lease lapses.
+    legacy_cutoff = now - timedelta(seconds=get_worker_lease_seconds())
+    result = session.execute(
+        update(IngestionJob)
+        .where(
+            IngestionJob.status == "running",
+            or_(
+                IngestionJob.lease_expires_at < now,
+                and_(IngestionJob.lease_expires_at == None, IngestionJob.started_at < legacy_cutoff),  # noqa: E711
+            ),
+        )
+        .values(status="queued", lease_owner=None, lease_expires_at=None),
+        execution_options={"synchronize_session": False},
+    )
+    return result.rowcount
+
+
+def _claim_queued_jobs(session: Session, limit: int, owner: str) -> list[IngestionJob]:
+    # Compare-and-set on status so concurrent workers never lease the same job.
+    now = datetime.utcnow()
+    queued_ids = (
+        select(IngestionJob.id)
+        .where(IngestionJob.status == "queued")
+        .order_by(IngestionJob.created_at.asc())
+        .limit(limit)
+    )
+    claimed_ids = (
+        session.execute(
+            update(IngestionJob)
+            .where(IngestionJob.id.in_(queued_ids), IngestionJob.status == "queued")
+            .values(
+                status="running",
+                started_at=now,
+                lease_owner=owner,
+                lease_expires_at=now + timedelta(seconds=get_worker_lease_seconds()),
+            )
+            .returning(IngestionJob.id),
+            execution_options={"synchronize_session": False},
+        )
+        .scalars()
+        .all()
+    )
+    session.commit()
+    if not claimed_ids:
+        return []
     return (
         session.query(IngestionJob)
-        .filter(IngestionJob.status == "queued")
+        .filter(IngestionJob.id.in_(claimed_ids))
         .order_by(IngestionJob.created_at.asc())
-        .first()
+        .all()
     )
 
+
+def _release_leases(session: Session, jobs: list[IngestionJob], owner: str) -> bool:
+    # Runs inside the job transaction: if another worker reclaimed a job, the caller rolls back.
+    job_ids = [job.id for job in jobs]
+    session.flush()
+    result = session.execute(
+        update(IngestionJob)
+        .where(IngestionJob.id.in_(job_ids), IngestionJob.lease_owner == owner)
+        .values(lease_owner=None, lease_expires_at=None),
+        execution_options={"synchronize_session": False},
+    )
+    return result.rowcount == len(job_ids)
+
+
 def _normalize_payload(payload: str | None) -> str:
     if not payload:
         return ""
     return " ".join(payload.strip().split()).lower()
 
 
+def _source_excerpt(payload: str | None) -> str | None:
+    excerpt = (payload or "").strip()[:EXCERPT_LENGTH]
+    return excerpt or None
+
+
+def _line_count(payload: str | None) -> int:
+    if not payload:
+        return 0
+    return payload.rstrip("\n").count("\n") + 1
+
+
 def _dedupe_key(job: IngestionJob, normalized_payload: str) -> str:
     parts = [
         job.meeting_id,
@@ -57,198 +165,254 @@ def _dedupe_key(job: IngestionJob, normalized_payload: str) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
-def _find_recent_duplicate(session: Session, job: IngestionJob, window_seconds: int = 300):
-    if not job.payload:
-        return None
-    cutoff = datetime.utcnow() - timedelta(seconds=window_seconds)
-    normalized = _normalize_payload(job.payload)
-    dedupe_key = _dedupe_key(job, normalized)
-    candidates = (
-        session.query(IngestionJob)
-        .filter(IngestionJob.status == "succeeded")
-        .filter(IngestionJob.completed_at != None)  # noqa: E711
-        .filter(IngestionJob.completed_at >= cutoff)
-        .filter(IngestionJob.meeting_id == job.meeting_id)
-        .filter(IngestionJob.capture_type == job.capture_type)
-        .filter(IngestionJob.people_ids == job.people_ids)
-        .filter(IngestionJob.relevant_at == job.relevant_at)
-        .filter(IngestionJob.dedupe_key == dedupe_key)
-        .order_by(IngestionJob.completed_at.desc())
-        .all()
-    )
-    for candidate in candidates:
-        if _normalize_payload(candidate.payload) == normalized:
-            return candidate
-    return None
+class _StageTimer:
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+        self._last = time.perf_counter()
 
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.timings[stage] = round((now - self._last) * 1000, 3)
+        self._last = now
 
-def _process_job(session: Session, job: IngestionJob):
-    job.status = "running"
-    job.started_at = datetime.utcnow()
-    session.commit()
 
-    try:
-        duplicate = _find_recent_duplicate(session, job)
-        if duplicate and duplicate.source_id:
-            job.status = "succeeded"
-            job.completed_at = datetime.utcnow()
-            job.source_id = duplicate.source_id
-            job.error = "deduped"
-            session.commit()
-            return
+def _apply_job(session: Session, job: IngestionJob):
+    timer = _StageTimer()
+    _apply_job_stages(session, job, timer)
+    job.stage_timings = json.dumps(timer.timings)
+
+
+def _apply_job_stages(session: Session, job: IngestionJob, timer: _StageTimer):
+    payload = load_payload(session, job) or ""
+    dedupe_key = job.dedupe_key or _dedupe_key(job, _normalize_payload(payload))
+    # Job keys are unique, so the capture can only collide with an existing source.
+    existing_source = (
+        session.query(SourceRecord)
+        .filter(SourceRecord.dedupe_key == dedupe_key)
+        .first()
+    )
+    timer.mark("dedupe")
+    if existing_source:
+        job.status = "succeeded"
+        job.completed_at = datetime.utcnow()
+        job.source_id = existing_source.id
+        job.error = "deduped"
+        return
+    source_id = f"s_{uuid4().hex}"
+    source = SourceRecord(
+        id=source_id,
+        meeting_id=job.meeting_id,
+        captured_at=datetime.utcnow(),
+        capture_type=job.capture_type,
+        uri=f"local://sources/{source_id}",
+        relevant_at=job.relevant_at,
+        dedupe_key=dedupe_key,
+        payload_digest=job.payload_digest,
+        excerpt=_source_excerpt(payload),
+        payload_length=len(payload),
+        line_count=_line_count(payload),
+        index_in_memory=bool(job.index_in_memory),
+    )
+    session.add(source)
+    job.source_id = source_id
 
-        normalized_payload = _normalize_payload(job.payload)
-        dedupe_key = _dedupe_key(job, normalized_payload)
-        existing_source = (
-            session.query(SourceRecord)
-            .filter(SourceRecord.dedupe_key == dedupe_key)
+    should_index = job.index_in_memory if job.index_in_memory is not None else job.capture_type == "reflection"
+    if should_index:
+        # Embedding happens in the indexer queue so it never holds up this transaction.
+        source.index_status = "pending"
+    timer.mark("source_build")
+
+    commitments = [] if job.capture_type == "reflection" else extract_commitments(payload)
+    for item in commitments:
+        existing_commitment = (
+            session.query(Commitment)
+            .filter(Commitment.source_id == source_id, Commitment.text == item.text)
             .first()
         )
-        if existing_source:
-            job.status = "succeeded"
-            job.completed_at = datetime.utcnow()
-            job.source_id = existing_source.id
-            job.error = "deduped"
-            job.dedupe_key = dedupe_key
-            session.commit()
-            return
-        source_id = f"s_{uuid4().hex}"
-        source = SourceRecord(
-            id=source_id,
-            meeting_id=job.meeting_id,
-            captured_at=datetime.utcnow(),
-            capture_type=job.capture_type,
-            uri=f"local://sources/{source_id}",
-            relevant_at=job.relevant_at,
-            dedupe_key=dedupe_key,
-            index_in_memory=bool(job.index_in_memory),
+        if existing_commitment:
+            continue
+        commitment = Commitment(
+            id=f"c_{uuid4().hex}",
+            text=item.text,
+            due_at=job.commitment_relevant_by,
+            acknowledged=False,
+            source_id=source_id,
+            rule_id=item.rule_id,
         )
-        session.add(source)
-        job.source_id = source_id
-        job.dedupe_key = dedupe_key
-
-        meeting = session.query(Meeting).filter(Meeting.id == job.meeting_id).first()
-        meeting_title = meeting.title if meeting else "Context"
-        excerpt = (job.payload or "").strip()
-        if len(excerpt) > 200:
-            excerpt = f"{excerpt[:197]}…"
-        should_index = job.index_in_memory if job.index_in_memory is not None else job.capture_type == "reflection"
-        if should_index:
-            try:
-                add_documents(
-                    documents=[job.payload or ""],
-                    metadata=[
-                        {
-                            "source_id": source_id,
-                            "meeting_id": job.meeting_id,
-                            "meeting_title": meeting_title,
-                            "captured_at": source.captured_at.isoformat(),
-                            "capture_type": job.capture_type,
-                            "excerpt": excerpt or "No capture excerpt available.",
-                        }
-                    ],
-                    ids=[source_id],
-                )
-            except Exception as exc:
-                # Vector indexing is best-effort and must never block ingestion.
-                print(f"Vector indexing failed for {source_id}: {exc}")
-
-        commitments = [] if job.capture_type == "reflection" else extract_commitments(job.payload)
-        for item in commitments:
-            existing_commitment = (
-                session.query(Commitment)
-                .filter(Commitment.source_id == source_id, Commitment.text == item.text)
-                .first()
-            )
-            if existing_commitment:
+        session.add(commitment)
+
+    timer.mark("commitments")
+
+    flags = extract_risk_flags(payload)
+    for flag in flags:
+        risk_flag = RiskFlag(
+            id=f"rf_{uuid4().hex}",
+            source_id=source_id,
+            flag_type=flag.flag_type,
+            rule_id=flag.rule_id,
+            excerpt=flag.excerpt,
+            captured_at=source.captured_at,
+        )
+        session.add(risk_flag)
+    timer.mark("risk_flags")
+
+    session.flush()
+    timer.mark("source_insert")
+
+    if job.people_ids:
+        try:
+            people_ids = json.loads(job.people_ids)
+        except json.JSONDecodeError:
+            people_ids = []
+        for person_id in people_ids:
+            if not person_id:
                 continue
-            commitment = Commitment(
-                id=f"c_{uuid4().hex}",
-                text=item.text,
-                due_at=job.commitment_relevant_by,
-                acknowledged=False,
-                source_id=source_id,
-                rule_id=item.rule_id,
-            )
-            session.add(commitment)
-
-        flags = extract_risk_flags(job.payload)
-        for flag in flags:
-            risk_flag = RiskFlag(
-                id=f"rf_{uuid4().hex}",
-                source_id=source_id,
-                flag_type=flag.flag_type,
-                rule_id=flag.rule_id,
-                excerpt=flag.excerpt,
-                captured_at=source.captured_at,
+            person = session.get(Person, person_id)
+            if not person:
+                continue
+            link = (
+                session.query(MeetingParticipant)
+                .filter_by(meeting_id=job.meeting_id, person_id=person_id)
+                .first()
             )
-            session.add(risk_flag)
-
+            if not link:
+                session.add(MeetingParticipant(meeting_id=job.meeting_id, person_id=person_id))
         session.flush()
+    timer.mark("participants")
 
-        if job.people_ids:
-            try:
-                people_ids = json.loads(job.people_ids)
-            except json.JSONDecodeError:
-                people_ids = []
-            for person_id in people_ids:
-                if not person_id:
-                    continue
-                person = session.get(Person, person_id)
-                if not person:
-                    continue
-                link = (
-                    session.query(MeetingParticipant)
-                    .filter_by(meeting_id=job.meeting_id, person_id=person_id)
-                    .first()
-                )
-                if not link:
-                    session.add(MeetingParticipant(meeting_id=job.meeting_id, person_id=person_id))
-
-        participant_ids = (
-            session.query(MeetingParticipant.person_id)
-            .filter(MeetingParticipant.meeting_id == job.meeting_id)
-            .all()
+    participant_ids = (
+        session.query(MeetingParticipant.person_id)
+        .filter(MeetingParticipant.meeting_id == job.meeting_id)
+        .all()
+    )
+    if participant_ids:
+        now = datetime.utcnow()
+        session.query(Person).filter(Person.id.in_([pid for (pid,) in participant_ids])).update(
+            {Person.last_interaction_at: now}, synchronize_session=False
         )
-        if participant_ids:
-            now = datetime.utcnow()
-            session.query(Person).filter(Person.id.in_([pid for (pid,) in participant_ids])).update(
-                {Person.last_interaction_at: now}, synchronize_session=False
-            )
+    timer.mark("last_interaction")
 
-        job.status = "succeeded"
-        job.completed_at = datetime.utcnow()
+    job.status = "succeeded"
+    job.completed_at = datetime.utcnow()
+
+
+def _mark_failed(session: Session, job_id: str, owner: str):
+    session.execute(
+        update(IngestionJob)
+        .where(IngestionJob.id == job_id, IngestionJob.lease_owner == owner)
+        .values(
+            status="failed",
+            error="processing_error",
+            completed_at=datetime.utcnow(),
+            lease_owner=None,
+            lease_expires_at=None,
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    session.commit()
+
+
+def _process_job(session: Session, job: IngestionJob, owner: str):
+    job_id = job.id
+    try:
+        _apply_job(session, job)
+        if not _release_leases(session, [job], owner):
+            session.rollback()
+            ingestion_jobs.inc(outcome="lease_lost")
+            return
         session.commit()
+        ingestion_jobs.inc(outcome="succeeded")
     except Exception:
         session.rollback()
-        job.status = "failed"
-        job.error = "processing_error"
-        job.completed_at = datetime.utcnow()
+        _mark_failed(session, job_id, owner)
+        ingestion_jobs.inc(outcome="failed")
+
+
+def _process_batch(session: Session, jobs: list[IngestionJob], owner: str):
+    try:
+        for job in jobs:
+            _apply_job(session, job)
+        if not _release_leases(session, jobs, owner):
+            raise RuntimeError("lease lost")
         session.commit()
+        ingestion_jobs.inc(len(jobs), outcome="succeeded")
+    except Exception:
+        # One bad job must not fail its neighbours; replay the batch job by job.
+        session.rollback()
+        for job in jobs:
+            _process_job(session, job, owner)
 
 
-def run_once():
-    init_db()
+def run_once(batch_size: int = 1, worker_id: str | None = None) -> int:
+    _ensure_ready()
+    owner = worker_id or _worker_id()
     session = SessionLocal()
     try:
         now = datetime.utcnow()
-        for failed in _eligible_failed_jobs(session, now):
-            failed.status = "queued"
-            failed.error = None
+        _requeue_failed_jobs(session, now)
+        _reclaim_expired_leases(session, now)
         session.commit()
 
-        job = _next_queued_job(session)
-        if job:
-            _process_job(session, job)
+        jobs = _claim_queued_jobs(session, batch_size, owner)
+        start = time.perf_counter()
+        if len(jobs) == 1:
+            _process_job(session, jobs[0], owner)
+        elif jobs:
+            _process_batch(session, jobs, owner)
+        if jobs:
+            ingestion_batch_duration.observe(time.perf_counter() - start)
+        return len(jobs)
     finally:
         session.close()
 
 
-def run_forever():
+def run_forever(worker_id: str | None = None, listener: WakeListener | None = None):
+    batch_size = get_worker_batch_size()
+    owner = worker_id or _worker_id()
+    listener = listener or WakeListener()
+    max_wait = max(POLL_SECONDS, get_worker_max_poll_seconds())
+    wait = POLL_SECONDS
     while True:
-        run_once()
-        time.sleep(POLL_SECONDS)
+        # Drain the queue back-to-back; when idle, block on the wake-up socket and
+        # back the fallback poll off so an empty queue stops costing queries.
+        if run_once(batch_size, owner):
+            wait = POLL_SECONDS
+            continue
+        if listener.wait(wait):
+            wait = POLL_SECONDS
+        elif listener.active:
+            # Without a listener nothing can wake us early, so keep polling at the base rate.
+            wait = min(wait * 2, max_wait)
+
+
+def run_pool(concurrency: int):
+    listener = WakeListener()
+    threads = []
+    for index in range(concurrency):
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:w{index}"
+        thread = threading.Thread(
+            target=run_forever,
+            args=(worker_id, listener),
+            name=f"ingestion-{index}",
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+
+
+def main():
+    metrics_port = get_worker_metrics_port()
+    if metrics_port:
+        start_metrics_server(metrics_port)
+    indexer.start_background()
+    concurrency = get_worker_concurrency()
+    if concurrency > 1:
+        run_pool(concurrency)
+    else:
+        run_forever()
 
 
 if __name__ == "__main__":
-    run_forever()
+    main()
@@ -1,9 +1,12 @@
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.briefings import router as briefings_router
 from app.api.commitments import router as commitments_router
 from app.api.admin import router as admin_router
+from app.api.audit import router as audit_router
 from app.api.ingestion import router as ingestion_router
 from app.api.meetings import router as meetings_router
 from app.api.calendar import router as calendar_router
@@ -11,7 +14,9 @@ from app.api.status import router as status_router
 from app.api.people import router as people_router
 from app.api.sources import router as sources_router
 from app.api.memory import router as memory_router
+from app.api.metrics import router as metrics_router
 from app.db import init_db
+from app.metrics import db_queries_per_request, db_time_per_request, http_request_duration, start_request_stats
 from app.settings import get_cors_origins
 
 app = FastAPI(title="Custos Core API")
@@ -32,8 +37,27 @@ app.include_router(calendar_router)
 app.include_router(status_router)
 app.include_router(people_router)
 app.include_router(admin_router)
+app.include_router(audit_router)
 app.include_router(sources_router)
 app.include_router(memory_router)
+app.include_router(metrics_router)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    stats = start_request_stats()
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    http_request_duration.observe(
+        time.perf_counter() - start,
+        method=request.method,
+        route=route,
+        status=str(response.status_code),
+    )
+    db_queries_per_request.observe(stats["queries"], route=route)
+    db_time_per_request.observe(stats["seconds"], route=route)
+    return response
 
 
 @app.on_event("startup")
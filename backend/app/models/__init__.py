@@ -1,22 +1,30 @@
 from .audit_log import AuditLog
 from .base import Base
+from .cache_generation import CacheGeneration
 from .commitment import Commitment
 from .ingestion_job import IngestionJob
 from .calendar_connection import CalendarConnection
 from .meeting import Meeting
+from .meeting_context_summary import MeetingContextSummary
 from .meeting_participant import MeetingParticipant
+from .payload_blob import PayloadBlob
 from .person import Person
+from .person_interaction_day import PersonInteractionDay
 from .risk_flag import RiskFlag
 from .source_record import SourceRecord
 
 __all__ = [
     "AuditLog",
     "Base",
+    "CacheGeneration",
     "Commitment",
     "IngestionJob",
     "Meeting",
+    "MeetingContextSummary",
     "MeetingParticipant",
+    "PayloadBlob",
     "Person",
+    "PersonInteractionDay",
     "RiskFlag",
     "SourceRecord",
 ]
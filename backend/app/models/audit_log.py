@@ -1,12 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy import Column, DateTime, Index, String, Text
 
 from .base import Base
 
 
 class AuditLog(Base):
     __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_entity", "entity_type", "entity_id", "created_at", "id"),
+        Index("ix_audit_log_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True)
     actor = Column(String, nullable=False)
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String
+
+from .base import Base
+
+
+class CacheGeneration(Base):
+    __tablename__ = "cache_generation"
+
+    name = Column(String, primary_key=True)
+    token = Column(String, nullable=False)
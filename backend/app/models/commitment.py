@@ -1,12 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String
 
 from .base import Base
 
 
 class Commitment(Base):
     __tablename__ = "commitment"
+    __table_args__ = (Index("ix_commitment_due_at_created_at_id", "due_at", "created_at", "id"),)
 
     id = Column(String, primary_key=True)
     text = Column(String, nullable=False)
@@ -1,16 +1,19 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Index, String, Text
 
 from .base import Base
 
 
 class IngestionJob(Base):
     __tablename__ = "ingestion_job"
+    __table_args__ = (Index("ix_ingestion_job_status_created_at", "status", "created_at"),)
 
     id = Column(String, primary_key=True)
     meeting_id = Column(String, nullable=False)
-    payload = Column(Text, nullable=False)
+    # Legacy inline text; new jobs reference a payload_blob by digest instead.
+    payload = Column(Text, nullable=True)
+    payload_digest = Column(String, nullable=True, index=True)
     capture_type = Column(String, nullable=False)
     people_ids = Column(Text, nullable=True)
     source_id = Column(String, nullable=True)
@@ -19,7 +22,10 @@ class IngestionJob(Base):
     index_in_memory = Column(Boolean, nullable=False, default=False)
     dedupe_key = Column(String, nullable=True, index=True, unique=True)
     status = Column(String, nullable=False)
+    lease_owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     error = Column(Text, nullable=True)
+    stage_timings = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
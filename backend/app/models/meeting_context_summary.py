@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+
+from .base import Base
+
+
+class MeetingContextSummary(Base):
+    __tablename__ = "meeting_context_summary"
+
+    meeting_id = Column(String, ForeignKey("meeting.id"), primary_key=True)
+    last_source_id = Column(String, nullable=True)
+    last_captured_at = Column(DateTime, nullable=True, index=True)
+    source_count = Column(Integer, nullable=False, default=0)
+    commitment_count = Column(Integer, nullable=False, default=0)
+    open_commitment_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+
+from .base import Base
+
+
+class PayloadBlob(Base):
+    __tablename__ = "payload_blob"
+
+    digest = Column(String, primary_key=True)
+    codec = Column(String, nullable=False, default="raw")
+    data = Column(LargeBinary, nullable=False)
+    # Uncompressed size in bytes.
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer, String
+
+from .base import Base
+
+
+class PersonInteractionDay(Base):
+    __tablename__ = "person_interaction_day"
+
+    person_id = Column(String, ForeignKey("person.id"), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
 
 from .base import Base
 
@@ -15,5 +15,13 @@ class SourceRecord(Base):
     uri = Column(String, nullable=False)
     relevant_at = Column(DateTime, nullable=True)
     dedupe_key = Column(String, nullable=True, index=True, unique=True)
+    payload_digest = Column(String, nullable=True, index=True)
+    excerpt = Column(String, nullable=True)
+    payload_length = Column(Integer, nullable=True)
+    line_count = Column(Integer, nullable=True)
     index_in_memory = Column(Boolean, nullable=False, default=False)
+    index_status = Column(String, nullable=True, index=True)
+    index_attempts = Column(Integer, nullable=False, default=0)
+    index_retry_at = Column(DateTime, nullable=True)
+    index_error = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,94 @@
+import gzip
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+from app import db
+from app.models.audit_log import AuditLog
+from app.settings import get_audit_retention_days, get_data_dir
+
+ARCHIVE_DIR = "audit-archive"
+FETCH_SIZE = 5000
+
+
+def _archive_path(month: str) -> Path:
+    return Path(get_data_dir()) / ARCHIVE_DIR / f"audit-{month}.jsonl.gz"
+
+
+def _month_bounds(month: str) -> tuple[datetime, datetime]:
+    start = datetime.strptime(month, "%Y-%m")
+    end = (start + timedelta(days=32)).replace(day=1)
+    return start, end
+
+
+def _archived_ids(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        return {json.loads(line)["id"] for line in archive if line.strip()}
+
+
+def _append_archive(path: Path, rows) -> int:
+    # Gzip members concatenate, so the existing archive is copied as-is and the new rows
+    # are added as one more member; the swap is atomic either way. Rows already in the
+    # file (from a run whose delete never committed) are skipped, so reruns never duplicate.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.partial")
+    archived_ids = _archived_ids(path)
+    count = 0
+    with partial.open("wb") as raw:
+        if path.exists():
+            with path.open("rb") as existing:
+                shutil.copyfileobj(existing, raw)
+        with gzip.GzipFile(fileobj=raw, mode="wb") as archive:
+            for row in rows:
+                count += 1
+                if row.id in archived_ids:
+                    continue
+                record = dict(row._mapping)
+                record["created_at"] = record["created_at"].isoformat()
+                archive.write((json.dumps(record) + "\n").encode("utf-8"))
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(partial, path)
+    return count
+
+
+def archive_audit_log(now: datetime | None = None) -> dict:
+    retention_days = get_audit_retention_days()
+    if not retention_days:
+        return {"status": "disabled", "archived": 0, "months": []}
+    cutoff = (now or datetime.utcnow()) - timedelta(days=retention_days)
+    # Only whole months older than the retention window move out, one archive file each.
+    boundary = cutoff.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    table = AuditLog.__table__
+    archived = 0
+    months = []
+    month_column = func.strftime("%Y-%m", table.c.created_at)
+    with db.engine.connect() as connection:
+        old_months = connection.execute(
+            select(month_column)
+            .where(table.c.created_at < boundary)
+            .group_by(month_column)
+            .order_by(month_column)
+        ).scalars().all()
+    for month in old_months:
+        # One transaction per month: a failure later on leaves earlier months fully moved.
+        start, end = _month_bounds(month)
+        in_month = (table.c.created_at >= start) & (table.c.created_at < end)
+        with db.engine.begin() as connection:
+            rows = connection.execute(
+                select(table).where(in_month).order_by(table.c.created_at, table.c.id)
+            ).yield_per(FETCH_SIZE)
+            archived += _append_archive(_archive_path(month), rows)
+            connection.execute(table.delete().where(in_month))
+        months.append(month)
+    return {"status": "succeeded", "archived": archived, "months": months}
+
+
+if __name__ == "__main__":
+    print(json.dumps(archive_audit_log(), indent=2))
@@ -1,13 +1,35 @@
+import fcntl
 import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from hashlib import sha256
 from pathlib import Path
-from shutil import copy2
 
-from app.settings import get_data_dir, get_db_path
+from app.metrics import backup_duration
+from app.settings import (
+    allow_plaintext_db,
+    get_backup_chunk_pages,
+    get_backup_keep_daily,
+    get_backup_keep_weekly,
+    get_backup_step_pages,
+    get_data_dir,
+    get_db_path,
+)
+from app.sqlcipher import key_pragmas
 
 STATUS_FILE = "backup_status.json"
-BACKUP_VERSION = "1"
+BACKUP_VERSION = "2"
+# Full-copy backups (backup-*.db plus backup-*.meta.json) written before the chunk store.
+LEGACY_BACKUP_VERSION = "1"
+MANIFEST_SUFFIX = ".manifest.json"
+TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+LOCK_FILE = "backup.lock"
+SNAPSHOT_GLOB = "snapshot-*.db.partial"
+PROGRESS_INTERVAL_SECONDS = 1.0
+READ_SIZE = 1024 * 1024
 
 
 def _status_path() -> Path:
@@ -21,21 +43,255 @@ def _write_status(payload: dict) -> None:
         json.dump(payload, handle, indent=2)
 
 
-def _checksum(path: Path) -> str:
-    digest = sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+def _backup_dir() -> Path:
+    return Path(get_data_dir()) / "backups"
+
+
+def _chunk_path(digest: str) -> Path:
+    return _backup_dir() / "chunks" / digest[:2] / digest
+
+
+def _read_status() -> dict:
+    try:
+        with _status_path().open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def _connect(path: Path):
+    if allow_plaintext_db():
+        return sqlite3.connect(str(path))
+    statements = key_pragmas()
+    import sqlcipher3
+
+    connection = sqlcipher3.dbapi2.connect(str(path))
+    # The backup API copies decrypted pages, so the target must carry the same key.
+    for statement in statements:
+        connection.execute(statement)
+    return connection
+
+
+def _table_counts(connection) -> dict[str, int]:
+    tables = [
+        name
+        for (name,) in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+    ]
+    return {name: connection.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0] for name in tables}
+
+
+def _store_chunks(snapshot_path: Path, chunk_size: int) -> dict:
+    # One pass over the snapshot: hash the whole file and store each page-aligned chunk
+    # under its own digest, skipping chunks an earlier backup already holds.
+    checksum = sha256()
+    chunks = []
+    written = 0
+    bytes_written = 0
+    with snapshot_path.open("rb") as handle:
+        for data in iter(lambda: handle.read(chunk_size), b""):
+            checksum.update(data)
+            digest = sha256(data).hexdigest()
+            chunks.append(digest)
+            path = _chunk_path(digest)
+            if path.exists():
+                # Refresh the mtime so garbage collection treats a reused chunk as in use.
+                os.utime(path)
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{digest}.partial")
+            partial.write_bytes(data)
+            os.replace(partial, path)
+            written += 1
+            bytes_written += len(data)
+    return {
+        "checksum": checksum.hexdigest(),
+        "chunks": chunks,
+        "written": written,
+        "bytes_written": bytes_written,
+    }
+
+
+def _store_whole(snapshot_path: Path) -> dict:
+    # SQLCipher re-encrypts every page with a fresh IV, so two snapshots never share a
+    # chunk. The encrypted snapshot is kept whole, as a single chunk, instead.
+    checksum = sha256()
+    with snapshot_path.open("rb") as handle:
+        for data in iter(lambda: handle.read(READ_SIZE), b""):
+            checksum.update(data)
+    digest = checksum.hexdigest()
+    size = snapshot_path.stat().st_size
+    path = _chunk_path(digest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(snapshot_path, path)
+    return {"checksum": digest, "chunks": [digest], "written": 1, "bytes_written": size}
+
+
+def _read_manifest(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _backup_points() -> list[tuple[datetime, list[Path]]]:
+    # Every restorable backup with the files that make it up, newest first.
+    points = []
+    backup_dir = _backup_dir()
+    for path in backup_dir.glob(f"backup-*{MANIFEST_SUFFIX}"):
+        stamp = path.name[len("backup-") : -len(MANIFEST_SUFFIX)]
+        points.append((stamp, [path]))
+    for path in backup_dir.glob("backup-*.db"):
+        points.append((path.stem[len("backup-") :], [path, path.with_suffix(".meta.json")]))
+    parsed = []
+    for stamp, paths in points:
+        try:
+            parsed.append((datetime.strptime(stamp, TIMESTAMP_FORMAT), paths))
+        except ValueError:
+            continue
+    return sorted(parsed, key=lambda point: point[0], reverse=True)
+
+
+def _retained(stamps: list[datetime], keep_daily: int, keep_weekly: int) -> set[datetime]:
+    # Newest backup of each of the last `keep_daily` days and `keep_weekly` ISO weeks;
+    # the most recent backup is always kept.
+    keep = set(stamps[:1])
+    days: set = set()
+    weeks: set = set()
+    for stamp in stamps:
+        day = stamp.date()
+        if day not in days and len(days) < keep_daily:
+            days.add(day)
+            keep.add(stamp)
+        week = stamp.isocalendar()[:2]
+        if week not in weeks and len(weeks) < keep_weekly:
+            weeks.add(week)
+            keep.add(stamp)
+    return keep
+
+
+@contextmanager
+def _backup_lock():
+    # One backup, retention and GC pass at a time across the CLI, scheduler and API.
+    backup_dir = _backup_dir()
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    with (backup_dir / LOCK_FILE).open("a") as handle:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _remove_stale_partials() -> None:
+    # Only called with the lock held, so any partial file is left over from a crashed run.
+    backup_dir = _backup_dir()
+    for path in [*backup_dir.glob(SNAPSHOT_GLOB), *backup_dir.glob("chunks/*/*.partial")]:
+        path.unlink(missing_ok=True)
+
+
+def _in_progress_since() -> float | None:
+    started = [path.stat().st_mtime for path in _backup_dir().glob(SNAPSHOT_GLOB)]
+    return min(started) if started else None
+
+
+def apply_retention() -> dict:
+    # Callers hold the backup lock.
+    points = _backup_points()
+    keep = _retained([stamp for stamp, _ in points], get_backup_keep_daily(), get_backup_keep_weekly())
+    removed = 0
+    for stamp, paths in points:
+        if stamp in keep:
+            continue
+        for path in paths:
+            path.unlink(missing_ok=True)
+        removed += 1
+    return {"backups_removed": removed, "chunks_removed": collect_garbage()}
+
+
+def collect_garbage() -> int:
+    chunk_dir = _backup_dir() / "chunks"
+    if not chunk_dir.exists():
+        return 0
+    referenced: set[str] = set()
+    for path in _backup_dir().glob(f"backup-*{MANIFEST_SUFFIX}"):
+        referenced.update(_read_manifest(path)["chunks"])
+    # Chunks written since a still-running backup started may belong to its unwritten manifest.
+    in_progress_since = _in_progress_since()
+    removed = 0
+    for path in chunk_dir.glob("*/*"):
+        if path.name in referenced or path.name.endswith(".partial"):
+            continue
+        if in_progress_since is not None and path.stat().st_mtime >= in_progress_since:
+            continue
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def _throughput(size: int, elapsed: float) -> float:
+    return round(size / (1024 * 1024) / elapsed, 2) if elapsed > 0 else 0.0
+
+
+def _carried_over(previous: dict) -> dict:
+    # Keep the last good backup visible on the status page while a new one runs or fails.
+    keys = ("last_success", "last_restore", "path", "checksum")
+    return {key: previous[key] for key in keys if key in previous}
+
+
+class _BackupProgress:
+    def __init__(self, previous: dict, started_at: str):
+        self.previous = previous
+        self.started_at = started_at
+        self.start = time.perf_counter()
+        self.last_written = 0.0
+
+    def __call__(self, _status: int, remaining: int, total: int) -> None:
+        now = time.perf_counter()
+        if remaining and now - self.last_written < PROGRESS_INTERVAL_SECONDS:
+            return
+        self.last_written = now
+        copied = total - remaining
+        elapsed = now - self.start
+        _write_status(
+            {
+                **_carried_over(self.previous),
+                "status": "running",
+                "last_attempt": self.started_at,
+                "progress": {
+                    "pages_copied": copied,
+                    "pages_total": total,
+                    "percent": round(100 * copied / total, 1) if total else 100.0,
+                    "pages_per_second": round(copied / elapsed, 1) if elapsed > 0 else 0.0,
+                },
+            }
+        )
 
 
 def create_backup() -> dict:
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    start = time.perf_counter()
+    with _backup_lock() as acquired:
+        if not acquired:
+            # The running backup owns backup_status.json; leave its progress in place.
+            return {
+                "status": "failed",
+                "last_attempt": datetime.utcnow().isoformat(),
+                "error": "backup_in_progress",
+            }
+        _remove_stale_partials()
+        result = _create_backup()
+    backup_duration.observe(time.perf_counter() - start, status=result.get("status", "unknown"))
+    return result
+
+
+def _create_backup() -> dict:
+    timestamp = datetime.utcnow().strftime(TIMESTAMP_FORMAT)
     db_path = Path(get_db_path())
-    backup_dir = Path(get_data_dir()) / "backups"
+    backup_dir = _backup_dir()
     backup_dir.mkdir(parents=True, exist_ok=True)
-    backup_path = backup_dir / f"backup-{timestamp}.db"
-    meta_path = backup_dir / f"backup-{timestamp}.meta.json"
+    manifest_path = backup_dir / f"backup-{timestamp}{MANIFEST_SUFFIX}"
 
     if not db_path.exists():
         payload = {
@@ -46,24 +302,85 @@ def create_backup() -> dict:
         _write_status(payload)
         return payload
 
-    copy2(db_path, backup_path)
-    checksum = _checksum(backup_path)
-    meta = {
+    started_at = datetime.utcnow().isoformat()
+    previous = _read_status()
+    progress = _BackupProgress(previous, started_at)
+    manifests = [paths[0] for _, paths in _backup_points() if paths[0].name.endswith(MANIFEST_SUFFIX)]
+    parent = manifests[0] if manifests else None
+    snapshot_path = backup_dir / f"snapshot-{timestamp}.db.partial"
+    start = time.perf_counter()
+    source = _connect(db_path)
+    try:
+        target = _connect(snapshot_path)
+        try:
+            # Each step holds the source read lock for at most `pages` pages, so writers
+            # interleave between steps; a write from another connection restarts the copy.
+            source.backup(target, pages=get_backup_step_pages(), progress=progress)
+            # sqlcipher3 returns pragma values as strings.
+            page_size = int(target.execute("PRAGMA page_size").fetchone()[0])
+            page_count = int(target.execute("PRAGMA page_count").fetchone()[0])
+            # Recorded so a restore can check it brought back this exact point in time.
+            row_counts = _table_counts(target)
+        finally:
+            target.close()
+    except Exception as exc:
+        source.close()
+        snapshot_path.unlink(missing_ok=True)
+        payload = {
+            **_carried_over(previous),
+            "status": "failed",
+            "last_attempt": started_at,
+            "error": f"backup_failed: {exc}",
+        }
+        _write_status(payload)
+        return payload
+    source.close()
+    size = page_size * page_count
+    # Chunks are page-aligned so a page rewritten in place dirties exactly one chunk.
+    chunk_size = page_size * get_backup_chunk_pages() if allow_plaintext_db() else size
+    try:
+        if allow_plaintext_db():
+            stored = _store_chunks(snapshot_path, chunk_size)
+        else:
+            stored = _store_whole(snapshot_path)
+    finally:
+        snapshot_path.unlink(missing_ok=True)
+    elapsed = time.perf_counter() - start
+    manifest = {
         "version": BACKUP_VERSION,
         "created_at": datetime.utcnow().isoformat(),
-        "db_path": str(backup_path),
-        "checksum": checksum,
+        "parent": parent.name if parent else None,
+        "checksum": stored["checksum"],
+        "size": size,
+        "page_size": page_size,
+        "chunk_size": chunk_size,
+        "row_counts": row_counts,
+        "chunks": stored["chunks"],
     }
-    with meta_path.open("w", encoding="utf-8") as handle:
-        json.dump(meta, handle, indent=2)
+    # The manifest is written last, so a crash never leaves a backup that looks restorable
+    # but references chunks that were never stored.
+    partial_manifest = manifest_path.with_name(f"{manifest_path.name}.partial")
+    with partial_manifest.open("w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+    os.replace(partial_manifest, manifest_path)
+    retention = apply_retention()
     payload = {
         "status": "succeeded",
-        "last_attempt": datetime.utcnow().isoformat(),
+        "last_attempt": started_at,
         "last_success": datetime.utcnow().isoformat(),
-        "path": str(backup_path),
-        "checksum": checksum,
+        "path": str(manifest_path),
+        "checksum": stored["checksum"],
         "version": BACKUP_VERSION,
-        "meta_path": str(meta_path),
+        "parent": manifest["parent"],
+        "pages": page_count,
+        "page_size": page_size,
+        "bytes": size,
+        "chunks": len(stored["chunks"]),
+        "chunks_written": stored["written"],
+        "bytes_written": stored["bytes_written"],
+        "duration_seconds": round(elapsed, 3),
+        "throughput_mb_s": _throughput(size, elapsed),
+        **retention,
     }
     _write_status(payload)
     return payload
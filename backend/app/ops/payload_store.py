@@ -0,0 +1,105 @@
+import zlib
+from collections.abc import Iterable
+from hashlib import sha256
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.models.payload_blob import PayloadBlob
+from app.settings import get_payload_codec, get_payload_compress_min_bytes
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _zstd():
+    # zstd is optional; without a binding we fall back to zlib for new blobs.
+    try:
+        from compression import zstd
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    module = _zstd()
+    if hasattr(module, "ZstdCompressor"):
+        return module.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return module.compress(data, level=ZSTD_LEVEL)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    module = _zstd()
+    if module is None:
+        raise RuntimeError("Payload is zstd-compressed but no zstd module is installed (pip install zstandard).")
+    if hasattr(module, "ZstdDecompressor"):
+        return module.ZstdDecompressor().decompress(data)
+    return module.decompress(data)
+
+
+def _encode(data: bytes) -> tuple[str, bytes]:
+    codec = get_payload_codec()
+    if codec == "raw" or len(data) < get_payload_compress_min_bytes():
+        return "raw", data
+    if codec == "zstd" and _zstd() is not None:
+        compressed = _zstd_compress(data)
+        codec = "zstd"
+    else:
+        compressed = zlib.compress(data, ZLIB_LEVEL)
+        codec = "zlib"
+    if len(compressed) >= len(data):
+        return "raw", data
+    return codec, compressed
+
+
+def _decode(codec: str, data: bytes) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "zstd":
+        return _zstd_decompress(data)
+    return data
+
+
+def payload_digest(payload: str) -> str:
+    return sha256(payload.encode("utf-8")).hexdigest()
+
+
+def store_payloads(session: Session, payloads: Iterable[str]) -> list[str]:
+    # Digests cover the uncompressed text, so the codec never changes a blob's identity.
+    rows = {}
+    for payload in payloads:
+        data = payload.encode("utf-8")
+        rows.setdefault(sha256(data).hexdigest(), data)
+    if rows:
+        values = []
+        for digest, data in rows.items():
+            codec, stored = _encode(data)
+            values.append({"digest": digest, "codec": codec, "data": stored, "size": len(data)})
+        session.execute(insert(PayloadBlob.__table__).on_conflict_do_nothing(index_elements=["digest"]), values)
+    return list(rows)
+
+
+def load_payloads(session: Session, digests: Iterable[str | None]) -> dict[str, str]:
+    # Decompression happens here only; listings read excerpts and never load blobs.
+    wanted = {digest for digest in digests if digest}
+    if not wanted:
+        return {}
+    rows = session.execute(
+        select(PayloadBlob.digest, PayloadBlob.codec, PayloadBlob.data).where(PayloadBlob.digest.in_(wanted))
+    ).all()
+    return {digest: _decode(codec, bytes(data)).decode("utf-8") for digest, codec, data in rows}
+
+
+def load_payload(session: Session, item) -> str | None:
+    # Accepts anything with payload/payload_digest attributes (jobs or query rows).
+    if item.payload is not None or not item.payload_digest:
+        return item.payload
+    return load_payloads(session, [item.payload_digest]).get(item.payload_digest)
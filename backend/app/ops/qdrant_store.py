@@ -1,10 +1,12 @@
 import os
+import time
 import uuid
 from functools import lru_cache
 from typing import Any
 
 from qdrant_client import QdrantClient
 
+from app.metrics import qdrant_call_duration
 from app.settings import get_qdrant_path, get_qdrant_url
 
 COLLECTION_NAME = "custos_captures"
@@ -33,16 +35,33 @@ def add_documents(documents: list[str], metadata: list[dict[str, Any]], ids: lis
     if not documents:
         return
     point_ids = [_to_point_id(item) for item in ids]
-    client = get_client()
-    client.add(
-        collection_name=COLLECTION_NAME,
-        documents=documents,
-        metadata=metadata,
-        ids=point_ids,
-    )
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        client = get_client()
+        client.add(
+            collection_name=COLLECTION_NAME,
+            documents=documents,
+            metadata=metadata,
+            ids=point_ids,
+        )
+        outcome = "ok"
+    finally:
+        qdrant_call_duration.observe(time.perf_counter() - start, operation="add", outcome=outcome)
 
 
 def query_documents(query_text: str, limit: int = 5) -> list[dict[str, Any]]:
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        items = _query_documents(query_text, limit)
+        outcome = "ok"
+        return items
+    finally:
+        qdrant_call_duration.observe(time.perf_counter() - start, operation="query", outcome=outcome)
+
+
+def _query_documents(query_text: str, limit: int) -> list[dict[str, Any]]:
     client = get_client()
     try:
         results = client.query(
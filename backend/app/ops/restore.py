@@ -1,55 +1,164 @@
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from hashlib import sha256
 from pathlib import Path
-from shutil import copy2
 
 from sqlalchemy import text
 
+from app import db
 from app.db import create_db_engine
-from app.ops.backup import BACKUP_VERSION, _write_status
+from app.ops.backup import (
+    BACKUP_VERSION,
+    LEGACY_BACKUP_VERSION,
+    MANIFEST_SUFFIX,
+    _chunk_path,
+    _connect,
+    _read_manifest,
+    _table_counts,
+    _write_status,
+)
 from app.settings import get_db_path
 
+READ_SIZE = 1024 * 1024
+# SQLite sidecar files that belong to the database being replaced.
+SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
 
-def _checksum(path: Path) -> str:
-    digest = sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+
+def _failed(error: str) -> dict:
+    payload = {
+        "status": "failed",
+        "last_attempt": datetime.utcnow().isoformat(),
+        "error": error,
+    }
+    _write_status(payload)
+    return payload
+
+
+def _stream_file(backup_path: Path, handle) -> str:
+    checksum = sha256()
+    with backup_path.open("rb") as source:
+        for data in iter(lambda: source.read(READ_SIZE), b""):
+            checksum.update(data)
+            handle.write(data)
+    return checksum.hexdigest()
+
+
+def _stream_chunks(manifest: dict, handle) -> str:
+    checksum = sha256()
+    for digest in manifest["chunks"]:
+        path = _chunk_path(digest)
+        if not path.exists():
+            raise ValueError("chunk_missing")
+        # Read in slices: an encrypted backup is stored as one chunk the size of the database.
+        chunk_checksum = sha256()
+        with path.open("rb") as source:
+            for data in iter(lambda: source.read(READ_SIZE), b""):
+                chunk_checksum.update(data)
+                checksum.update(data)
+                handle.write(data)
+        if chunk_checksum.hexdigest() != digest:
+            raise ValueError("chunk_corrupt")
+    return checksum.hexdigest()
+
+
+def _integrity_check(path: Path) -> str | None:
+    connection = _connect(path)
+    try:
+        rows = connection.execute("PRAGMA integrity_check").fetchall()
+    finally:
+        connection.close()
+    return None if rows == [("ok",)] else "integrity_check_failed"
+
+
+def _row_count_check(path: Path, expected: dict | None) -> str | None:
+    connection = _connect(path)
+    try:
+        counts = _table_counts(connection)
+    finally:
+        connection.close()
+    if expected is not None and counts != expected:
+        return "row_count_mismatch"
+    return None
+
+
+def _verify(path: Path, expected_counts: dict | None) -> str | None:
+    # Both checks only read the staged file, so they run side by side on their own connections.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        checks = [
+            pool.submit(_integrity_check, path),
+            pool.submit(_row_count_check, path, expected_counts),
+        ]
+        for check in checks:
+            try:
+                error = check.result()
+            except Exception as exc:
+                # A missing key or driver is a setup problem, not a damaged backup.
+                error = f"verify_error: {exc}"
+            if error:
+                return error
+    return None
+
+
+def _swap_into_place(staging_path: Path, db_path: Path) -> None:
+    # A WAL or journal left by the old database would be replayed onto the restored one.
+    for suffix in SIDECAR_SUFFIXES:
+        db_path.with_name(f"{db_path.name}{suffix}").unlink(missing_ok=True)
+    os.replace(staging_path, db_path)
+    # Pooled connections still point at the replaced file.
+    db.engine.dispose()
 
 
 def restore_backup(backup_path: Path) -> dict:
     if not backup_path.exists():
-        payload = {
-            "status": "failed",
-            "last_attempt": datetime.utcnow().isoformat(),
-            "error": "backup_missing",
-        }
-        _write_status(payload)
-        return payload
-
-    meta_path = backup_path.with_suffix(".meta.json")
-    if meta_path.exists():
-        meta = json.loads(meta_path.read_text(encoding="utf-8"))
-        if meta.get("version") != BACKUP_VERSION:
-            payload = {
-                "status": "failed",
-                "last_attempt": datetime.utcnow().isoformat(),
-                "error": "version_mismatch",
-            }
-            _write_status(payload)
-            return payload
-
-    checksum = _checksum(backup_path)
+        return _failed("backup_missing")
+
+    if backup_path.name.endswith(MANIFEST_SUFFIX):
+        meta_path = backup_path
+        meta = _read_manifest(backup_path)
+        version = BACKUP_VERSION
+    else:
+        meta_path = backup_path.with_suffix(".meta.json")
+        version = LEGACY_BACKUP_VERSION
+        meta = {"version": version}
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if meta.get("version") != version:
+        return _failed("version_mismatch")
+
     db_path = Path(get_db_path())
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    copy2(backup_path, db_path)
+    # Staged next to the live database so the final rename stays on one filesystem.
+    staging_path = db_path.with_name(f"{db_path.name}.restore")
+    try:
+        with staging_path.open("wb") as handle:
+            if version == BACKUP_VERSION:
+                checksum = _stream_chunks(meta, handle)
+            else:
+                checksum = _stream_file(backup_path, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+    except ValueError as exc:
+        staging_path.unlink(missing_ok=True)
+        return _failed(str(exc))
+
+    expected = meta.get("checksum")
+    error = "checksum_mismatch" if expected and checksum != expected else None
+    if not error:
+        error = _verify(staging_path, meta.get("row_counts"))
+    if error:
+        staging_path.unlink(missing_ok=True)
+        return _failed(error)
+    _swap_into_place(staging_path, db_path)
 
     engine = create_db_engine()
-    with engine.connect() as connection:
-        connection.execute(text("SELECT 1"))
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    finally:
+        engine.dispose()
 
     payload = {
         "status": "restored",
@@ -58,7 +167,7 @@ def restore_backup(backup_path: Path) -> dict:
         "last_restore": datetime.utcnow().isoformat(),
         "path": str(backup_path),
         "checksum": checksum,
-        "version": BACKUP_VERSION,
+        "version": version,
         "meta_path": str(meta_path),
     }
     _write_status(payload)
@@ -67,7 +176,7 @@ def restore_backup(backup_path: Path) -> dict:
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python -m app.ops.restore /path/to/backup.db")
+        print("Usage: python -m app.ops.restore /path/to/backup-<timestamp>.manifest.json")
         raise SystemExit(1)
     result = restore_backup(Path(sys.argv[1]))
     print(json.dumps(result, indent=2))
@@ -1,11 +1,14 @@
 from collections import defaultdict
 from datetime import datetime
 
+from app.cache import bump_generation
 from app.db import SessionLocal, init_db
 from app.models.commitment import Commitment
 from app.models.ingestion_job import IngestionJob
 from app.models.source_record import SourceRecord
 from app.models.meeting import Meeting
+from app.ops.payload_store import load_payloads
+from app.summaries import rebuild_summaries
 
 
 def _normalize_payload(payload: str | None) -> str:
@@ -38,12 +41,14 @@ def dedupe_ingestion() -> dict:
             .filter(IngestionJob.source_id != None)  # noqa: E711
             .all()
         )
+        blobs = load_payloads(session, [job.payload_digest for job in jobs])
         groups: dict[tuple[str, str, str, str], list[IngestionJob]] = defaultdict(list)
         for job in jobs:
+            payload = job.payload if job.payload is not None else blobs.get(job.payload_digest)
             key = (
                 job.meeting_id,
                 job.capture_type,
-                _normalize_payload(job.payload),
+                _normalize_payload(payload),
                 (job.people_ids or "").strip(),
                 job.relevant_at.isoformat() if job.relevant_at else "",
             )
@@ -120,6 +125,9 @@ def dedupe_ingestion() -> dict:
                 .filter(SourceRecord.id.in_(orphan_ids))
                 .delete(synchronize_session=False)
             )
+        # Bulk deletes bypass the flush hooks that keep the summaries current.
+        rebuild_summaries(session.connection())
+        bump_generation(session.connection())
         session.commit()
         return summary
     finally:
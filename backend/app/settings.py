@@ -49,6 +49,109 @@ def get_calendar_poll_seconds() -> int:
     return int(os.getenv("CUSTOS_CALENDAR_POLL_SECONDS", "900"))
 
 
+def get_worker_batch_size() -> int:
+    return max(1, int(os.getenv("CUSTOS_WORKER_BATCH_SIZE", "25")))
+
+
+def get_worker_concurrency() -> int:
+    return max(1, int(os.getenv("CUSTOS_WORKER_CONCURRENCY", "1")))
+
+
+def get_worker_lease_seconds() -> int:
+    return max(1, int(os.getenv("CUSTOS_WORKER_LEASE_SECONDS", "300")))
+
+
+def get_worker_wake_port() -> int:
+    return int(os.getenv("CUSTOS_WORKER_WAKE_PORT", "8766"))
+
+
+def get_worker_max_poll_seconds() -> float:
+    return float(os.getenv("CUSTOS_WORKER_MAX_POLL_SECONDS", "30"))
+
+
+def get_index_batch_size() -> int:
+    return max(1, int(os.getenv("CUSTOS_INDEX_BATCH_SIZE", "32")))
+
+
+def get_worker_metrics_port() -> int:
+    return int(os.getenv("CUSTOS_WORKER_METRICS_PORT", "0"))
+
+
+def get_response_cache_seconds() -> int:
+    return max(0, int(os.getenv("CUSTOS_RESPONSE_CACHE_SECONDS", "30")))
+
+
+def get_payload_codec() -> str:
+    return os.getenv("CUSTOS_PAYLOAD_CODEC", "zstd").strip().lower()
+
+
+def get_payload_compress_min_bytes() -> int:
+    return max(0, int(os.getenv("CUSTOS_PAYLOAD_COMPRESS_MIN_BYTES", "1024")))
+
+
+def get_backup_step_pages() -> int:
+    return max(1, int(os.getenv("CUSTOS_BACKUP_STEP_PAGES", "256")))
+
+
+def get_backup_chunk_pages() -> int:
+    return max(1, int(os.getenv("CUSTOS_BACKUP_CHUNK_PAGES", "16")))
+
+
+def get_backup_keep_daily() -> int:
+    return max(0, int(os.getenv("CUSTOS_BACKUP_KEEP_DAILY", "7")))
+
+
+def get_backup_keep_weekly() -> int:
+    return max(0, int(os.getenv("CUSTOS_BACKUP_KEEP_WEEKLY", "4")))
+
+
+def get_audit_mode() -> str:
+    mode = os.getenv("CUSTOS_AUDIT_MODE", "sync").strip().lower()
+    return mode if mode in {"sync", "batched", "async"} else "sync"
+
+
+def get_audit_batch_size() -> int:
+    return max(1, int(os.getenv("CUSTOS_AUDIT_BATCH_SIZE", "500")))
+
+
+def get_audit_flush_seconds() -> float:
+    return max(0.05, float(os.getenv("CUSTOS_AUDIT_FLUSH_SECONDS", "1.0")))
+
+
+def get_audit_retention_days() -> int:
+    return max(0, int(os.getenv("CUSTOS_AUDIT_RETENTION_DAYS", "90")))
+
+
+def get_db_profile() -> str:
+    return os.getenv("CUSTOS_DB_PROFILE", "balanced").strip().lower()
+
+
+def get_sqlcipher_kdf_iter() -> int | None:
+    value = os.getenv("CUSTOS_SQLCIPHER_KDF_ITER")
+    return int(value) if value else None
+
+
+def get_sqlcipher_page_size() -> int | None:
+    value = os.getenv("CUSTOS_SQLCIPHER_PAGE_SIZE")
+    return int(value) if value else None
+
+
+def get_sqlcipher_key_mode() -> str:
+    return os.getenv("CUSTOS_SQLCIPHER_KEY_MODE", "raw").strip().lower()
+
+
+def get_db_pool_size() -> int:
+    return max(1, int(os.getenv("CUSTOS_DB_POOL_SIZE", "8")))
+
+
+def get_db_pool_max_overflow() -> int:
+    return max(0, int(os.getenv("CUSTOS_DB_POOL_MAX_OVERFLOW", "8")))
+
+
+def get_db_pool_prewarm() -> bool:
+    return os.getenv("CUSTOS_DB_POOL_PREWARM", "1") == "1"
+
+
 def get_env() -> str:
     return os.getenv("CUSTOS_ENV", "prod").lower()
 
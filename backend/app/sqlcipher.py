@@ -0,0 +1,91 @@
+import hashlib
+
+from app.settings import (
+    get_database_key,
+    get_sqlcipher_kdf_iter,
+    get_sqlcipher_key_mode,
+    get_sqlcipher_page_size,
+)
+
+SALT_BYTES = 16
+KEY_BYTES = 32
+PLAINTEXT_HEADER = b"SQLite format 3\x00"
+# SQLCipher's default passphrase KDF (PBKDF2 digest, iterations) per major version.
+KDF_DEFAULTS = {3: ("sha1", 64000), 4: ("sha512", 256000)}
+
+
+def key_pragmas() -> list[str]:
+    key = get_database_key()
+    if not key:
+        raise RuntimeError("CUSTOS_DATABASE_KEY is required for SQLCipher encryption.")
+    statements = [f"PRAGMA key = '{key}';"]
+    # These must match how the database file was created, or it will not open; they are
+    # only sent when configured so existing databases keep the SQLCipher defaults.
+    kdf_iter = get_sqlcipher_kdf_iter()
+    if kdf_iter:
+        statements.append(f"PRAGMA kdf_iter = {kdf_iter};")
+    page_size = get_sqlcipher_page_size()
+    if page_size:
+        statements.append(f"PRAGMA cipher_page_size = {page_size};")
+    return statements
+
+
+def read_salt(db_path: str) -> bytes | None:
+    try:
+        with open(db_path, "rb") as handle:
+            salt = handle.read(SALT_BYTES)
+    except OSError:
+        return None
+    return salt if len(salt) == SALT_BYTES and salt != PLAINTEXT_HEADER else None
+
+
+def _cipher_major_version(module) -> int:
+    connection = module.connect(":memory:")
+    try:
+        row = connection.execute("PRAGMA cipher_version;").fetchone()
+    finally:
+        connection.close()
+    if not row or not row[0]:
+        raise RuntimeError("SQLCipher is not active. Encryption check failed.")
+    return int(str(row[0]).split(".")[0])
+
+
+def _opens_with(module, db_path: str, statements: list[str]) -> bool:
+    connection = module.connect(db_path)
+    try:
+        for statement in statements:
+            connection.execute(statement)
+        connection.execute("SELECT count(*) FROM sqlite_master;").fetchone()
+        return True
+    except module.DatabaseError:
+        return False
+    finally:
+        connection.close()
+
+
+def connection_key_pragmas(module, db_path: str, salt: bytes | None) -> list[str]:
+    """Key statements for pooled connections, deriving a raw key once where possible.
+
+    A passphrase makes SQLCipher run its PBKDF2 on every new connection. The raw
+    x'<key><salt>' form skips that, so the derivation is done here, once, with the salt
+    read from the database header. New databases, non-default KDFs and keys that fail to
+    open the file fall back to the passphrase.
+    """
+    statements = key_pragmas()
+    if get_sqlcipher_key_mode() != "raw":
+        return statements
+    kdf = KDF_DEFAULTS.get(_cipher_major_version(module))
+    if salt is None or kdf is None:
+        return statements
+    algorithm, iterations = kdf
+    raw_key = hashlib.pbkdf2_hmac(
+        algorithm,
+        get_database_key().encode("utf-8"),
+        salt,
+        get_sqlcipher_kdf_iter() or iterations,
+        KEY_BYTES,
+    )
+    raw_statements = [f"PRAGMA key = \"x'{raw_key.hex()}{salt.hex()}'\";", *statements[1:]]
+    if not _opens_with(module, db_path, raw_statements):
+        return statements
+    return raw_statements
@@ -0,0 +1,251 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import and_, case, func, inspect, select
+from sqlalchemy.dialects.sqlite import insert
+
+from app.models.commitment import Commitment
+from app.models.meeting_context_summary import MeetingContextSummary
+from app.models.meeting_participant import MeetingParticipant
+from app.models.person_interaction_day import PersonInteractionDay
+from app.models.source_record import SourceRecord
+
+
+# Only these attributes feed the summaries, so unrelated updates (e.g. index status) are skipped.
+_TRACKED_ATTRIBUTES = {
+    SourceRecord: ("meeting_id", "captured_at"),
+    Commitment: ("source_id", "acknowledged"),
+    MeetingParticipant: ("meeting_id", "person_id"),
+}
+
+
+def _history_values(obj, attribute: str) -> set:
+    state = inspect(obj)
+    history = state.attrs[attribute].history
+    values = {value for value in [*history.added, *history.deleted, *history.unchanged] if value}
+    if not values and not state.deleted:
+        value = getattr(obj, attribute)
+        if value:
+            values.add(value)
+    return values
+
+
+def _changed_objects(session) -> list:
+    changed = [obj for obj in [*session.new, *session.deleted] if type(obj) in _TRACKED_ATTRIBUTES]
+    for obj in session.dirty:
+        attributes = _TRACKED_ATTRIBUTES.get(type(obj))
+        if attributes and any(inspect(obj).attrs[name].history.has_changes() for name in attributes):
+            changed.append(obj)
+    return changed
+
+
+def _affected_meeting_ids(connection, changed: list) -> set[str]:
+    meeting_ids: set[str] = set()
+    source_ids: set[str] = set()
+    for obj in changed:
+        if isinstance(obj, SourceRecord):
+            # A moved capture touches both the old and the new meeting.
+            meeting_ids |= _history_values(obj, "meeting_id")
+        elif isinstance(obj, Commitment):
+            source_ids |= _history_values(obj, "source_id")
+    if source_ids:
+        rows = connection.execute(
+            select(SourceRecord.meeting_id).where(SourceRecord.id.in_(source_ids))
+        ).all()
+        meeting_ids |= {meeting_id for (meeting_id,) in rows}
+    return meeting_ids
+
+
+def _affected_interaction_days(connection, changed: list) -> dict[str, set[date]]:
+    meeting_days: dict[str, set[date]] = defaultdict(set)
+    participants: set[tuple[str, str]] = set()
+    for obj in changed:
+        if isinstance(obj, SourceRecord):
+            days = {value.date() for value in _history_values(obj, "captured_at")}
+            for meeting_id in _history_values(obj, "meeting_id"):
+                meeting_days[meeting_id] |= days
+        elif isinstance(obj, MeetingParticipant):
+            for meeting_id in _history_values(obj, "meeting_id"):
+                for person_id in _history_values(obj, "person_id"):
+                    participants.add((person_id, meeting_id))
+
+    person_days: dict[str, set[date]] = defaultdict(set)
+    if meeting_days:
+        rows = connection.execute(
+            select(MeetingParticipant.person_id, MeetingParticipant.meeting_id).where(
+                MeetingParticipant.meeting_id.in_(list(meeting_days))
+            )
+        )
+        for person_id, meeting_id in rows:
+            person_days[person_id] |= meeting_days[meeting_id]
+    if participants:
+        source_days: dict[str, set[date]] = defaultdict(set)
+        rows = connection.execute(
+            select(SourceRecord.meeting_id, func.date(SourceRecord.captured_at))
+            .where(SourceRecord.meeting_id.in_({meeting_id for _, meeting_id in participants}))
+            .distinct()
+        )
+        for meeting_id, day in rows:
+            source_days[meeting_id].add(date.fromisoformat(day))
+        for person_id, meeting_id in participants:
+            person_days[person_id] |= source_days[meeting_id]
+    return {person_id: days for person_id, days in person_days.items() if days}
+
+
+def refresh_summaries(session) -> None:
+    changed = _changed_objects(session)
+    if not changed:
+        return
+    connection = session.connection()
+    refresh_meeting_summaries(connection, _affected_meeting_ids(connection, changed))
+    refresh_interaction_days(connection, _affected_interaction_days(connection, changed))
+
+
+def refresh_meeting_summaries(connection, meeting_ids) -> None:
+    meeting_ids = list(meeting_ids)
+    if not meeting_ids:
+        return
+    ranked = (
+        select(
+            SourceRecord.meeting_id,
+            SourceRecord.id,
+            SourceRecord.captured_at,
+            func.row_number()
+            .over(
+                partition_by=SourceRecord.meeting_id,
+                order_by=(SourceRecord.captured_at.desc(), SourceRecord.id.desc()),
+            )
+            .label("rank"),
+            func.count().over(partition_by=SourceRecord.meeting_id).label("source_count"),
+        )
+        .where(SourceRecord.meeting_id.in_(meeting_ids))
+        .subquery()
+    )
+    sources = {
+        row.meeting_id: row
+        for row in connection.execute(select(ranked).where(ranked.c.rank == 1))
+    }
+    commitments = {
+        row.meeting_id: row
+        for row in connection.execute(
+            select(
+                SourceRecord.meeting_id,
+                func.count(Commitment.id).label("total"),
+                func.sum(case((Commitment.acknowledged == False, 1), else_=0)).label("open"),  # noqa: E712
+            )
+            .join(Commitment, Commitment.source_id == SourceRecord.id)
+            .where(SourceRecord.meeting_id.in_(meeting_ids))
+            .group_by(SourceRecord.meeting_id)
+        )
+    }
+
+    now = datetime.utcnow()
+    rows = []
+    for meeting_id in meeting_ids:
+        source = sources.get(meeting_id)
+        commitment = commitments.get(meeting_id)
+        rows.append(
+            {
+                "meeting_id": meeting_id,
+                "last_source_id": source.id if source else None,
+                "last_captured_at": source.captured_at if source else None,
+                "source_count": source.source_count if source else 0,
+                "commitment_count": commitment.total if commitment else 0,
+                "open_commitment_count": (commitment.open or 0) if commitment else 0,
+                "updated_at": now,
+            }
+        )
+    statement = insert(MeetingContextSummary.__table__)
+    connection.execute(
+        statement.on_conflict_do_update(
+            index_elements=["meeting_id"],
+            set_={
+                column: statement.excluded[column]
+                for column in (
+                    "last_source_id",
+                    "last_captured_at",
+                    "source_count",
+                    "commitment_count",
+                    "open_commitment_count",
+                    "updated_at",
+                )
+            },
+        ),
+        rows,
+    )
+
+
+def refresh_interaction_days(connection, person_days: dict[str, set[date]]) -> None:
+    if not person_days:
+        return
+    # Recompute every (person, day) cell in the touched rectangle; it stays small per flush.
+    person_ids = list(person_days)
+    days = set().union(*person_days.values())
+    day_column = func.date(SourceRecord.captured_at)
+    rows = connection.execute(
+        select(MeetingParticipant.person_id, day_column, func.count(SourceRecord.id))
+        .join(SourceRecord, SourceRecord.meeting_id == MeetingParticipant.meeting_id)
+        .where(MeetingParticipant.person_id.in_(person_ids))
+        .where(SourceRecord.captured_at >= datetime.combine(min(days), time.min))
+        .where(SourceRecord.captured_at < datetime.combine(max(days) + timedelta(days=1), time.min))
+        .group_by(MeetingParticipant.person_id, day_column)
+    )
+    buckets = [
+        {"person_id": person_id, "day": date.fromisoformat(day), "count": count}
+        for person_id, day, count in rows
+        if date.fromisoformat(day) in days
+    ]
+    table = PersonInteractionDay.__table__
+    connection.execute(
+        table.delete().where(and_(table.c.person_id.in_(person_ids), table.c.day.in_(days)))
+    )
+    if buckets:
+        connection.execute(insert(table), buckets)
+
+
+# Plain SQL so the standalone sqlcipher3 maintenance scripts can run it on their own cursor.
+REBUILD_SUMMARIES_SQL = (
+    "DELETE FROM meeting_context_summary",
+    """
+    INSERT INTO meeting_context_summary (
+        meeting_id, last_source_id, last_captured_at, source_count,
+        commitment_count, open_commitment_count, updated_at
+    )
+    SELECT
+        s.meeting_id,
+        (
+            SELECT latest.id FROM source_record latest
+            WHERE latest.meeting_id = s.meeting_id
+            ORDER BY latest.captured_at DESC, latest.id DESC
+            LIMIT 1
+        ),
+        MAX(s.captured_at),
+        COUNT(*),
+        (
+            SELECT COUNT(*) FROM commitment c
+            JOIN source_record cs ON cs.id = c.source_id
+            WHERE cs.meeting_id = s.meeting_id
+        ),
+        (
+            SELECT COUNT(*) FROM commitment c
+            JOIN source_record cs ON cs.id = c.source_id
+            WHERE cs.meeting_id = s.meeting_id AND c.acknowledged = 0
+        ),
+        CURRENT_TIMESTAMP
+    FROM source_record s
+    GROUP BY s.meeting_id
+    """,
+    "DELETE FROM person_interaction_day",
+    """
+    INSERT INTO person_interaction_day (person_id, day, count)
+    SELECT mp.person_id, date(s.captured_at), COUNT(*)
+    FROM meeting_participant mp
+    JOIN source_record s ON s.meeting_id = mp.meeting_id
+    GROUP BY mp.person_id, date(s.captured_at)
+    """,
+)
+
+
+def rebuild_summaries(connection) -> None:
+    for statement in REBUILD_SUMMARIES_SQL:
+        connection.exec_driver_sql(statement)
@@ -8,6 +8,7 @@ from app.models import Base
 from sqlalchemy import text
 
 from app.settings import allow_plaintext_db, get_database_key, get_database_url, get_env
+from app.sqlcipher import key_pragmas
 
 config = context.config
 fileConfig(config.config_file_name)
@@ -53,7 +54,8 @@ def run_migrations_online():
             key = get_database_key()
             if not key:
                 raise RuntimeError("CUSTOS_DATABASE_KEY is required for migrations.")
-            connection.execute(text(f"PRAGMA key = '{key}';"))
+            for statement in key_pragmas():
+                connection.execute(text(statement))
             connection.execute(text("PRAGMA cipher_version;"))
         connection.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY);"))
         table_count = connection.execute(
@@ -0,0 +1,26 @@
+"""Add lease columns to ingestion_job
+
+Revision ID: 0010_job_leases
+Revises: 0009_commitment_relevant_by
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_job_leases"
+down_revision = "0009_commitment_relevant_by"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("ingestion_job", sa.Column("lease_owner", sa.String(), nullable=True))
+    op.add_column("ingestion_job", sa.Column("lease_expires_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_ingestion_job_status_created_at", "ingestion_job", ["status", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingestion_job_status_created_at", table_name="ingestion_job")
+    op.drop_column("ingestion_job", "lease_expires_at")
+    op.drop_column("ingestion_job", "lease_owner")
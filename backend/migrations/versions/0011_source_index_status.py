@@ -0,0 +1,30 @@
+"""Add vector index queue columns to source_record
+
+Revision ID: 0011_source_index_status
+Revises: 0010_job_leases
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011_source_index_status"
+down_revision = "0010_job_leases"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("source_record", sa.Column("index_status", sa.String(), nullable=True))
+    op.add_column("source_record", sa.Column("index_attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("source_record", sa.Column("index_retry_at", sa.DateTime(), nullable=True))
+    op.add_column("source_record", sa.Column("index_error", sa.Text(), nullable=True))
+    op.create_index("ix_source_record_index_status", "source_record", ["index_status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_source_record_index_status", table_name="source_record")
+    op.drop_column("source_record", "index_error")
+    op.drop_column("source_record", "index_retry_at")
+    op.drop_column("source_record", "index_attempts")
+    op.drop_column("source_record", "index_status")
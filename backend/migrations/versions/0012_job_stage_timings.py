@@ -0,0 +1,22 @@
+"""Add per-stage timings to ingestion_job
+
+Revision ID: 0012_job_stage_timings
+Revises: 0011_source_index_status
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012_job_stage_timings"
+down_revision = "0011_source_index_status"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("ingestion_job", sa.Column("stage_timings", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("ingestion_job", "stage_timings")
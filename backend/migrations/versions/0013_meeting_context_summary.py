@@ -0,0 +1,68 @@
+"""Add meeting_context_summary
+
+Revision ID: 0013_meeting_context_summary
+Revises: 0012_job_stage_timings
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013_meeting_context_summary"
+down_revision = "0012_job_stage_timings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "meeting_context_summary",
+        sa.Column("meeting_id", sa.String(), sa.ForeignKey("meeting.id"), primary_key=True),
+        sa.Column("last_source_id", sa.String(), nullable=True),
+        sa.Column("last_captured_at", sa.DateTime(), nullable=True),
+        sa.Column("source_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("commitment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("open_commitment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_meeting_context_summary_last_captured_at",
+        "meeting_context_summary",
+        ["last_captured_at"],
+    )
+    op.execute(
+        """
+        INSERT INTO meeting_context_summary (
+            meeting_id, last_source_id, last_captured_at, source_count,
+            commitment_count, open_commitment_count, updated_at
+        )
+        SELECT
+            s.meeting_id,
+            (
+                SELECT latest.id FROM source_record latest
+                WHERE latest.meeting_id = s.meeting_id
+                ORDER BY latest.captured_at DESC, latest.id DESC
+                LIMIT 1
+            ),
+            MAX(s.captured_at),
+            COUNT(*),
+            (
+                SELECT COUNT(*) FROM commitment c
+                JOIN source_record cs ON cs.id = c.source_id
+                WHERE cs.meeting_id = s.meeting_id
+            ),
+            (
+                SELECT COUNT(*) FROM commitment c
+                JOIN source_record cs ON cs.id = c.source_id
+                WHERE cs.meeting_id = s.meeting_id AND c.acknowledged = 0
+            ),
+            CURRENT_TIMESTAMP
+        FROM source_record s
+        GROUP BY s.meeting_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_meeting_context_summary_last_captured_at", table_name="meeting_context_summary")
+    op.drop_table("meeting_context_summary")
@@ -0,0 +1,38 @@
+"""Add person_interaction_day buckets
+
+Revision ID: 0014_person_interaction_day
+Revises: 0013_meeting_context_summary
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0014_person_interaction_day"
+down_revision = "0013_meeting_context_summary"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "person_interaction_day",
+        sa.Column("person_id", sa.String(), sa.ForeignKey("person.id"), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_person_interaction_day_day", "person_interaction_day", ["day"])
+    op.execute(
+        """
+        INSERT INTO person_interaction_day (person_id, day, count)
+        SELECT mp.person_id, date(s.captured_at), COUNT(*)
+        FROM meeting_participant mp
+        JOIN source_record s ON s.meeting_id = mp.meeting_id
+        GROUP BY mp.person_id, date(s.captured_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_person_interaction_day_day", table_name="person_interaction_day")
+    op.drop_table("person_interaction_day")
@@ -0,0 +1,29 @@
+"""Add cache_generation
+
+Revision ID: 0015_cache_generation
+Revises: 0014_person_interaction_day
+Create Date: 2026-10-18
+"""
+
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0015_cache_generation"
+down_revision = "0014_person_interaction_day"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "cache_generation",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("token", sa.String(), nullable=False),
+    )
+    op.bulk_insert(table, [{"name": "responses", "token": uuid4().hex}])
+
+
+def downgrade() -> None:
+    op.drop_table("cache_generation")
@@ -0,0 +1,40 @@
+"""Add precomputed excerpt to source_record
+
+Revision ID: 0016_source_excerpt
+Revises: 0015_cache_generation
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0016_source_excerpt"
+down_revision = "0015_cache_generation"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("source_record", sa.Column("excerpt", sa.String(), nullable=True))
+    op.create_index(
+        "ix_commitment_due_at_created_at_id",
+        "commitment",
+        ["due_at", "created_at", "id"],
+    )
+    op.execute(
+        """
+        UPDATE source_record
+        SET excerpt = (
+            SELECT NULLIF(substr(trim(j.payload, ' ' || char(9) || char(10) || char(13)), 1, 240), '')
+            FROM ingestion_job j
+            WHERE j.source_id = source_record.id
+            ORDER BY j.created_at ASC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_commitment_due_at_created_at_id", table_name="commitment")
+    op.drop_column("source_record", "excerpt")
@@ -0,0 +1,42 @@
+"""Add payload length and line count to source_record
+
+Revision ID: 0017_source_payload_stats
+Revises: 0016_source_excerpt
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0017_source_payload_stats"
+down_revision = "0016_source_excerpt"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("source_record", sa.Column("payload_length", sa.Integer(), nullable=True))
+    op.add_column("source_record", sa.Column("line_count", sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE source_record
+        SET (payload_length, line_count) = (
+            SELECT
+                length(coalesce(j.payload, '')),
+                CASE
+                    WHEN coalesce(j.payload, '') = '' THEN 0
+                    ELSE length(rtrim(j.payload, char(10)))
+                        - length(replace(rtrim(j.payload, char(10)), char(10), '')) + 1
+                END
+            FROM ingestion_job j
+            WHERE j.source_id = source_record.id
+            ORDER BY j.created_at ASC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("source_record", "line_count")
+    op.drop_column("source_record", "payload_length")
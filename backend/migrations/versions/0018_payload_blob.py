@@ -0,0 +1,86 @@
+"""Move ingestion payloads into a content-addressed payload_blob table
+
+Revision ID: 0018_payload_blob
+Revises: 0017_source_payload_stats
+Create Date: 2026-10-18
+"""
+
+from hashlib import sha256
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0018_payload_blob"
+down_revision = "0017_source_payload_stats"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payload_blob",
+        sa.Column("digest", sa.String(), primary_key=True),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.current_timestamp()),
+    )
+    with op.batch_alter_table("ingestion_job") as batch_op:
+        batch_op.alter_column("payload", existing_type=sa.Text(), nullable=True)
+        batch_op.add_column(sa.Column("payload_digest", sa.String(), nullable=True))
+        batch_op.create_index("ix_ingestion_job_payload_digest", ["payload_digest"])
+    op.add_column("source_record", sa.Column("payload_digest", sa.String(), nullable=True))
+    op.create_index("ix_source_record_payload_digest", "source_record", ["payload_digest"])
+
+    bind = op.get_bind()
+    while True:
+        rows = bind.execute(
+            sa.text("SELECT id, payload FROM ingestion_job WHERE payload IS NOT NULL LIMIT :limit"),
+            {"limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        blobs = {}
+        updates = []
+        for job_id, payload in rows:
+            data = payload.encode("utf-8")
+            digest = sha256(data).hexdigest()
+            blobs[digest] = data
+            updates.append({"id": job_id, "digest": digest})
+        bind.execute(
+            sa.text("INSERT OR IGNORE INTO payload_blob (digest, data, size) VALUES (:digest, :data, :size)"),
+            [{"digest": digest, "data": data, "size": len(data)} for digest, data in blobs.items()],
+        )
+        bind.execute(
+            sa.text("UPDATE ingestion_job SET payload_digest = :digest, payload = NULL WHERE id = :id"),
+            updates,
+        )
+    op.execute(
+        """
+        UPDATE source_record
+        SET payload_digest = (
+            SELECT j.payload_digest FROM ingestion_job j
+            WHERE j.source_id = source_record.id
+            ORDER BY j.created_at ASC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE ingestion_job
+        SET payload = (SELECT CAST(b.data AS TEXT) FROM payload_blob b WHERE b.digest = ingestion_job.payload_digest)
+        WHERE payload IS NULL AND payload_digest IS NOT NULL
+        """
+    )
+    op.drop_index("ix_source_record_payload_digest", table_name="source_record")
+    op.drop_column("source_record", "payload_digest")
+    with op.batch_alter_table("ingestion_job") as batch_op:
+        batch_op.drop_index("ix_ingestion_job_payload_digest")
+        batch_op.drop_column("payload_digest")
+        batch_op.alter_column("payload", existing_type=sa.Text(), nullable=False)
+    op.drop_table("payload_blob")
@@ -0,0 +1,63 @@
+"""Add codec to payload_blob and compress large payloads
+
+Revision ID: 0019_payload_codec
+Revises: 0018_payload_blob
+Create Date: 2026-10-18
+"""
+
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0019_payload_codec"
+down_revision = "0018_payload_blob"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 200
+MIN_BYTES = 1024
+
+
+def upgrade() -> None:
+    op.add_column("payload_blob", sa.Column("codec", sa.String(), nullable=False, server_default="raw"))
+
+    # Existing blobs use zlib so the migration never depends on an optional zstd binding.
+    bind = op.get_bind()
+    last_digest = ""
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT digest, data FROM payload_blob "
+                "WHERE codec = 'raw' AND size >= :min_bytes AND digest > :last "
+                "ORDER BY digest LIMIT :limit"
+            ),
+            {"min_bytes": MIN_BYTES, "last": last_digest, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        updates = []
+        for digest, data in rows:
+            compressed = zlib.compress(bytes(data), 6)
+            if len(compressed) < len(data):
+                updates.append({"digest": digest, "data": compressed})
+        if updates:
+            bind.execute(
+                sa.text("UPDATE payload_blob SET codec = 'zlib', data = :data WHERE digest = :digest"),
+                updates,
+            )
+        last_digest = rows[-1][0]
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.execute(sa.text("SELECT COUNT(*) FROM payload_blob WHERE codec = 'zstd'")).scalar():
+        raise RuntimeError("zstd-compressed payloads must be rewritten before downgrading.")
+    rows = bind.execute(sa.text("SELECT digest, data FROM payload_blob WHERE codec = 'zlib'")).all()
+    for digest, data in rows:
+        bind.execute(
+            sa.text("UPDATE payload_blob SET data = :data WHERE digest = :digest"),
+            {"digest": digest, "data": zlib.decompress(bytes(data))},
+        )
+    with op.batch_alter_table("payload_blob") as batch_op:
+        batch_op.drop_column("codec")
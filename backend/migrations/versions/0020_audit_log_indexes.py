@@ -0,0 +1,27 @@
+"""Index audit_log for entity lookups and time-ordered archiving
+
+Revision ID: 0020_audit_log_indexes
+Revises: 0019_payload_codec
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0020_audit_log_indexes"
+down_revision = "0019_payload_codec"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_log_entity",
+        "audit_log",
+        ["entity_type", "entity_id", "created_at", "id"],
+    )
+    op.create_index("ix_audit_log_created_at_id", "audit_log", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_created_at_id", table_name="audit_log")
+    op.drop_index("ix_audit_log_entity", table_name="audit_log")
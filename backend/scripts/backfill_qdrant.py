@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from sqlalchemy import or_
+
 from app.db import SessionLocal, init_db
 from app.models.ingestion_job import IngestionJob
 from app.models.meeting import Meeting
+from app.ops.payload_store import load_payload
 from app.ops.qdrant_store import add_documents
 
 
@@ -27,7 +30,7 @@ def main() -> None:
             session.query(IngestionJob)
             .filter(IngestionJob.status == "succeeded")
             .filter(IngestionJob.source_id != None)  # noqa: E711
-            .filter(IngestionJob.payload != None)  # noqa: E711
+            .filter(or_(IngestionJob.payload != None, IngestionJob.payload_digest != None))  # noqa: E711
             .order_by(
                 IngestionJob.completed_at.asc().nulls_last(),
                 IngestionJob.created_at.asc(),
@@ -35,14 +38,15 @@ def main() -> None:
             .all()
         )
         for job in jobs:
-            if not job.payload or not job.source_id:
+            payload = load_payload(session, job)
+            if not payload or not job.source_id:
                 skipped += 1
                 continue
             meeting = session.query(Meeting).filter(Meeting.id == job.meeting_id).first()
             meeting_title = meeting.title if meeting else "Context"
             captured_at = job.completed_at or job.created_at or datetime.utcnow()
             add_documents(
-                documents=[job.payload],
+                documents=[payload],
                 metadata=[
                     {
                         "source_id": job.source_id,
@@ -50,7 +54,7 @@ def main() -> None:
                         "meeting_title": meeting_title,
                         "captured_at": captured_at.isoformat(),
                         "capture_type": job.capture_type,
-                        "excerpt": _make_excerpt(job.payload),
+                        "excerpt": _make_excerpt(payload),
                     }
                 ],
                 ids=[job.source_id],
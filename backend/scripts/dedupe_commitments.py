@@ -1,6 +1,7 @@
 import argparse
 import os
 import sys
+from pathlib import Path
 
 try:
     import sqlcipher3
@@ -8,6 +9,13 @@ except Exception as exc:
     print(f"sqlcipher3 import failed: {exc}")
     sys.exit(1)
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.cache import BUMP_GENERATION_SQL
+from app.summaries import REBUILD_SUMMARIES_SQL
+
 DB_PATH = os.getenv("CUSTOS_DB_PATH", "/srv/custos-core/backend/custos.db")
 KEY = os.getenv("CUSTOS_DATABASE_KEY", "")
 if not KEY:
@@ -66,4 +74,11 @@ if args.remove_orphans:
         conn.commit()
         print(f"Removed {len(orphan_ids)} orphan sources")
 
+# Raw deletes bypass the app's flush hooks, so rebuild the summary tables and
+# invalidate cached API responses.
+for statement in REBUILD_SUMMARIES_SQL:
+    cur.execute(statement)
+cur.execute(BUMP_GENERATION_SQL)
+conn.commit()
+
 conn.close()
@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.db import DB_PROFILES, create_db_engine
+
+READERS = 4
+WRITERS = 2
+DURATION_SECONDS = 5.0
+SEED_ROWS = 20000
+
+
+def _seed(engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE note (id INTEGER PRIMARY KEY, meeting TEXT, body TEXT)"))
+        connection.execute(text("CREATE INDEX ix_note_meeting ON note (meeting)"))
+        connection.execute(
+            text("INSERT INTO note (meeting, body) VALUES (:meeting, :body)"),
+            [{"meeting": f"m_{i % 200}", "body": "x" * 400} for i in range(SEED_ROWS)],
+        )
+
+
+def _reader(engine, deadline: float, counts: dict, lock: threading.Lock) -> None:
+    reads = errors = 0
+    index = 0
+    while time.perf_counter() < deadline:
+        try:
+            with engine.connect() as connection:
+                connection.execute(
+                    text("SELECT COUNT(*), MAX(id) FROM note WHERE meeting = :meeting"),
+                    {"meeting": f"m_{index % 200}"},
+                ).one()
+            reads += 1
+        except OperationalError:
+            errors += 1
+        index += 1
+    with lock:
+        counts["reads"] += reads
+        counts["read_errors"] += errors
+
+
+def _writer(engine, deadline: float, counts: dict, lock: threading.Lock) -> None:
+    writes = errors = 0
+    while time.perf_counter() < deadline:
+        try:
+            with engine.begin() as connection:
+                connection.execute(
+                    text("INSERT INTO note (meeting, body) VALUES (:meeting, :body)"),
+                    {"meeting": f"m_{writes % 200}", "body": "y" * 400},
+                )
+            writes += 1
+        except OperationalError:
+            errors += 1
+    with lock:
+        counts["writes"] += writes
+        counts["write_errors"] += errors
+
+
+def measure_profile(profile: str, directory: Path) -> dict:
+    os.environ["CUSTOS_DB_PROFILE"] = profile
+    os.environ["CUSTOS_DATABASE_URL"] = f"sqlite:///{directory / f'{profile}.db'}"
+    engine = create_db_engine()
+    try:
+        _seed(engine)
+        counts = {"reads": 0, "read_errors": 0, "writes": 0, "write_errors": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + DURATION_SECONDS
+        threads = [
+            threading.Thread(target=_reader, args=(engine, deadline, counts, lock)) for _ in range(READERS)
+        ] + [threading.Thread(target=_writer, args=(engine, deadline, counts, lock)) for _ in range(WRITERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        engine.dispose()
+    return {
+        "profile": profile,
+        "reads_per_sec": round(counts["reads"] / DURATION_SECONDS, 1),
+        "writes_per_sec": round(counts["writes"] / DURATION_SECONDS, 1),
+        "read_errors": counts["read_errors"],
+        "write_errors": counts["write_errors"],
+    }
+
+
+if __name__ == "__main__":
+    # Uses the configured key and plaintext settings, so run it the way the API runs.
+    profiles = sys.argv[1:] or list(DB_PROFILES)
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in profiles:
+            print(measure_profile(profile, Path(directory)))
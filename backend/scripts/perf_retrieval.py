@@ -5,12 +5,13 @@ from pathlib import Path
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from app.db import SessionLocal, init_db
+from app.db import SessionLocal, engine, init_db
 from app.main import app
 from app.models.meeting import Meeting
 from app.models.meeting_participant import MeetingParticipant
@@ -64,6 +65,20 @@ def measure_endpoint(client, path, iterations=25):
     return p95
 
 
+def count_queries(client, path):
+    statements = []
+
+    def _record(*_args):
+        statements.append(1)
+
+    event.listen(engine, "after_cursor_execute", _record)
+    try:
+        client.get(path)
+    finally:
+        event.remove(engine, "after_cursor_execute", _record)
+    return len(statements)
+
+
 def run():
     seed_data()
     client = TestClient(app)
@@ -74,6 +89,8 @@ def run():
         "p95_briefings_next_sec": p95_next,
         "p95_briefings_today_sec": p95_today,
         "p95_people_timeline_sec": p95_timeline,
+        "queries_briefings_today": count_queries(client, "/api/briefings/today"),
+        "queries_people_timeline": count_queries(client, "/api/people/p_perf/timeline"),
     })
 
 
@@ -1,5 +1,6 @@
 import os
 import sys
+from pathlib import Path
 from datetime import datetime
 from uuid import uuid4
 
@@ -9,6 +10,13 @@ except Exception as exc:
     print(f"sqlcipher3 import failed: {exc}")
     sys.exit(1)
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.cache import BUMP_GENERATION_SQL
+from app.summaries import REBUILD_SUMMARIES_SQL
+
 DB_PATH = os.getenv("CUSTOS_DB_PATH", "/srv/custos-core/backend/custos.db")
 KEY = os.getenv("CUSTOS_DATABASE_KEY", "")
 if not KEY:
@@ -67,6 +75,11 @@ for job_id, meeting_id, capture_type, relevant_at, created_at, completed_at, ded
     cur.execute("UPDATE ingestion_job SET source_id = ? WHERE id = ?", (new_source_id, job_id))
     created += 1
 
+# Raw inserts bypass the app's flush hooks, so rebuild the summary tables and
+# invalidate cached API responses.
+for statement in REBUILD_SUMMARIES_SQL:
+    cur.execute(statement)
+cur.execute(BUMP_GENERATION_SQL)
 conn.commit()
 print({"missing_jobs": len(missing), "sources_created": created, "jobs_relinked": relinked})
 conn.close()
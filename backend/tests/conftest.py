@@ -15,7 +15,13 @@ os.environ.setdefault("CUSTOS_DATABASE_KEY", "test-key")
 
 
 def reload_app_modules():
-    for module_name in ["app.settings", "app.db", "app.main"]:
+    for module_name in [
+        "app.settings",
+        "app.db",
+        "app.ingestion.indexer",
+        "app.ingestion.worker",
+        "app.main",
+    ]:
         if module_name in sys.modules:
             importlib.reload(sys.modules[module_name])
 
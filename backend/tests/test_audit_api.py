@@ -0,0 +1,112 @@
+def test_audit_history_pages_by_entity_and_archives_old_months(test_app, tmp_path, monkeypatch):
+    import gzip
+    import json
+    from datetime import datetime, timedelta
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.audit_log import AuditLog
+    from app.ops.audit_archive import archive_audit_log
+
+    monkeypatch.setenv("CUSTOS_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("CUSTOS_AUDIT_RETENTION_DAYS", "30")
+    init_db()
+    now = datetime(2026, 10, 18, 12)
+    session = SessionLocal()
+    try:
+        for index in range(5):
+            session.add(
+                AuditLog(
+                    id=f"al_{index}",
+                    actor="system",
+                    action="update",
+                    entity_type="Commitment",
+                    entity_id="c_1" if index % 2 == 0 else "c_2",
+                    created_at=now - timedelta(days=index * 20),
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    response = client.get("/api/audit", params={"entity_type": "Commitment", "entity_id": "c_1", "limit": 2})
+    assert response.status_code == 200
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == ["al_0", "al_2"]
+    response = client.get(
+        "/api/audit",
+        params={"entity_type": "Commitment", "entity_id": "c_1", "limit": 2, "cursor": page["next_cursor"]},
+    )
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == ["al_4"]
+    assert page["next_cursor"] is None
+    assert client.get("/api/audit", params={"entity_id": "c_1"}).status_code == 400
+
+    # The cutoff is 2026-09-18, so August and July move out; September stays hot.
+    result = archive_audit_log(now)
+    assert result["months"] == ["2026-07", "2026-08"]
+    assert result["archived"] == 2
+    archive = tmp_path / "data" / "audit-archive" / "audit-2026-07.jsonl.gz"
+    with gzip.open(archive, "rt", encoding="utf-8") as handle:
+        assert [json.loads(line)["id"] for line in handle] == ["al_4"]
+    remaining = client.get("/api/audit", params={"entity_type": "Commitment"}).json()["items"]
+    assert [item["id"] for item in remaining] == ["al_0", "al_1", "al_2"]
+
+
+def test_audit_archive_rerun_after_failure_does_not_duplicate(test_app, tmp_path, monkeypatch):
+    import gzip
+    import json
+    from datetime import datetime
+
+    import pytest
+
+    from app.db import SessionLocal, init_db
+    from app.models.audit_log import AuditLog
+    from app.ops import audit_archive
+
+    monkeypatch.setenv("CUSTOS_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("CUSTOS_AUDIT_RETENTION_DAYS", "30")
+    init_db()
+    session = SessionLocal()
+    try:
+        for entry_id, created_at in (("al_jul", datetime(2026, 7, 10)), ("al_aug", datetime(2026, 8, 10))):
+            session.add(
+                AuditLog(
+                    id=entry_id,
+                    actor="system",
+                    action="update",
+                    entity_type="Commitment",
+                    entity_id="c_1",
+                    created_at=created_at,
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+
+    append_archive = audit_archive._append_archive
+
+    def fail_on_august(path, rows):
+        count = append_archive(path, rows)
+        if "2026-08" in path.name:
+            raise OSError("disk full")
+        return count
+
+    # August's archive is written but its delete rolls back; July stays moved.
+    monkeypatch.setattr(audit_archive, "_append_archive", fail_on_august)
+    with pytest.raises(OSError):
+        audit_archive.archive_audit_log(datetime(2026, 10, 18))
+    session = SessionLocal()
+    try:
+        assert [entry.id for entry in session.query(AuditLog).all()] == ["al_aug"]
+    finally:
+        session.close()
+
+    monkeypatch.setattr(audit_archive, "_append_archive", append_archive)
+    result = audit_archive.archive_audit_log(datetime(2026, 10, 18))
+    assert result["months"] == ["2026-08"]
+    archive = tmp_path / "data" / "audit-archive" / "audit-2026-08.jsonl.gz"
+    with gzip.open(archive, "rt", encoding="utf-8") as handle:
+        assert [json.loads(line)["id"] for line in handle] == ["al_aug"]
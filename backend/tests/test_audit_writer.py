@@ -0,0 +1,111 @@
+def test_batched_audit_entries_are_written_after_commit(test_app, tmp_path, monkeypatch):
+    from datetime import datetime
+
+    from app import db
+    from app.models.audit_log import AuditLog
+    from app.models.person import Person
+
+    monkeypatch.setenv("CUSTOS_AUDIT_MODE", "batched")
+    monkeypatch.setenv("CUSTOS_AUDIT_FLUSH_SECONDS", "60")
+    monkeypatch.setenv("CUSTOS_DATA_DIR", str(tmp_path / "data"))
+    db.init_db()
+    session = db.SessionLocal()
+    try:
+        session.add(
+            Person(id="p_rolled_back", name="Ghost", type="person", last_interaction_at=datetime.utcnow())
+        )
+        session.flush()
+        session.rollback()
+        session.add(Person(id="p_1", name="Northwind", type="org", last_interaction_at=datetime.utcnow()))
+        session.commit()
+        # Nothing is written inline; the entry waits in this process's segment file.
+        assert session.query(AuditLog).count() == 0
+        assert list((tmp_path / "data" / "audit").glob("segment-*.jsonl"))
+
+        assert db.audit_writer.flush() == 1
+        entries = session.query(AuditLog).all()
+        assert [(entry.action, entry.entity_id) for entry in entries] == [("create", "p_1")]
+        assert not list((tmp_path / "data" / "audit").iterdir())
+    finally:
+        session.close()
+        db.audit_writer.close()
+
+
+def test_async_audit_entries_drain_on_close(test_app, monkeypatch):
+    from datetime import datetime
+
+    from app import db
+    from app.models.audit_log import AuditLog
+    from app.models.person import Person
+
+    monkeypatch.setenv("CUSTOS_AUDIT_MODE", "async")
+    monkeypatch.setenv("CUSTOS_AUDIT_FLUSH_SECONDS", "60")
+    db.init_db()
+    session = db.SessionLocal()
+    try:
+        session.add(Person(id="p_1", name="Northwind", type="org", last_interaction_at=datetime.utcnow()))
+        session.commit()
+        db.audit_writer.close()
+        assert session.query(AuditLog).filter(AuditLog.entity_id == "p_1").count() == 1
+    finally:
+        session.close()
+
+
+def test_audit_submit_never_fails_a_committed_write(test_app, tmp_path, monkeypatch, caplog):
+    from datetime import datetime
+
+    from app import audit, db
+    from app.models.audit_log import AuditLog
+    from app.models.person import Person
+
+    data_dir = tmp_path / "data"
+    (data_dir / "audit").mkdir(parents=True)
+    (data_dir / "audit" / "segment-notes.txt").write_text("stray", encoding="utf-8")
+    monkeypatch.setenv("CUSTOS_AUDIT_MODE", "batched")
+    monkeypatch.setenv("CUSTOS_AUDIT_FLUSH_SECONDS", "60")
+    monkeypatch.setenv("CUSTOS_DATA_DIR", str(data_dir))
+
+    def broken_segment(_entries):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(db.audit_writer, "_append_segment", broken_segment)
+    # Alembic's fileConfig in the migration tests disables loggers that already exist.
+    monkeypatch.setattr(audit.logger, "disabled", False)
+    db.init_db()
+    session = db.SessionLocal()
+    try:
+        session.add(Person(id="p_1", name="Northwind", type="org", last_interaction_at=datetime.utcnow()))
+        with caplog.at_level("WARNING", logger="app.audit"):
+            session.commit()
+        assert "disk full" in caplog.text
+        db.audit_writer.close()
+        assert session.query(AuditLog).filter(AuditLog.entity_id == "p_1").count() == 1
+    finally:
+        session.close()
+
+
+def test_batched_audit_wakes_writer_at_batch_size(test_app, tmp_path, monkeypatch):
+    from datetime import datetime
+
+    from app import db
+    from app.models.person import Person
+
+    monkeypatch.setenv("CUSTOS_AUDIT_MODE", "batched")
+    monkeypatch.setenv("CUSTOS_AUDIT_FLUSH_SECONDS", "60")
+    monkeypatch.setenv("CUSTOS_AUDIT_BATCH_SIZE", "2")
+    monkeypatch.setenv("CUSTOS_DATA_DIR", str(tmp_path / "data"))
+    db.init_db()
+    woken = []
+    wake = db.audit_writer._wake.set
+    monkeypatch.setattr(db.audit_writer._wake, "set", lambda: (woken.append(True), wake()))
+    session = db.SessionLocal()
+    try:
+        for index in range(2):
+            session.add(
+                Person(id=f"p_{index}", name="Northwind", type="org", last_interaction_at=datetime.utcnow())
+            )
+            session.commit()
+        assert woken == [True]
+    finally:
+        session.close()
+        db.audit_writer.close()
@@ -0,0 +1,189 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from hashlib import sha256
+from pathlib import Path
+
+
+def _configure(tmp_path, monkeypatch) -> Path:
+    db_path = Path(tmp_path) / "custos.db"
+    monkeypatch.setenv("CUSTOS_DB_PATH", str(db_path))
+    monkeypatch.setenv("CUSTOS_DATA_DIR", str(Path(tmp_path) / "data"))
+    monkeypatch.setenv("CUSTOS_ALLOW_PLAINTEXT_DB", "1")
+    monkeypatch.setenv("CUSTOS_DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.setenv("CUSTOS_BACKUP_STEP_PAGES", "4")
+    monkeypatch.setenv("CUSTOS_BACKUP_CHUNK_PAGES", "2")
+    return db_path
+
+
+def _count(db_path: Path) -> int:
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM note").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_backup_chain_dedupes_chunks_and_restores_each_point(tmp_path, monkeypatch):
+    from app.ops.backup import _status_path, create_backup
+    from app.ops.restore import restore_backup
+
+    db_path = _configure(tmp_path, monkeypatch)
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE note (id INTEGER PRIMARY KEY, body TEXT)")
+    connection.executemany("INSERT INTO note (body) VALUES (?)", [("x" * 500,)] * 200)
+    connection.commit()
+    try:
+        # The open connection holds no lock, so the backup runs alongside it.
+        first = create_backup()
+        # Date the first point back a day so both survive retention and names never collide.
+        first_path = Path(first["path"]).with_name("backup-20261017-120000.manifest.json")
+        Path(first["path"]).rename(first_path)
+        connection.execute("UPDATE note SET body = 'changed' WHERE id = 200")
+        connection.commit()
+        second = create_backup()
+    finally:
+        connection.close()
+
+    assert first["status"] == "succeeded"
+    assert first["chunks_written"] == first["chunks"]
+    assert first["pages"] * first["page_size"] == first["bytes"]
+    assert first["throughput_mb_s"] >= 0
+    assert second["parent"] == first_path.name
+    assert 0 < second["chunks_written"] < second["chunks"]
+    assert json.loads(_status_path().read_text(encoding="utf-8"))["status"] == "succeeded"
+    assert not list(db_path.parent.glob("data/backups/*.partial"))
+
+    db_path.write_bytes(b"")
+    db_path.with_name(f"{db_path.name}-wal").write_bytes(b"stale")
+    restored = restore_backup(first_path)
+    assert restored["status"] == "restored"
+    assert restored["checksum"] == first["checksum"]
+    assert _count(db_path) == 200
+    assert not db_path.with_name(f"{db_path.name}-wal").exists()
+
+    manifest = json.loads(first_path.read_text(encoding="utf-8"))
+    manifest["row_counts"]["note"] = 199
+    first_path.write_text(json.dumps(manifest), encoding="utf-8")
+    assert restore_backup(first_path)["error"] == "row_count_mismatch"
+
+    restored = restore_backup(Path(second["path"]))
+    assert restored["status"] == "restored"
+    connection = sqlite3.connect(db_path)
+    try:
+        assert connection.execute("SELECT body FROM note WHERE id = 200").fetchone()[0] == "changed"
+    finally:
+        connection.close()
+
+
+def test_encrypted_backup_is_stored_whole_and_restores(tmp_path, monkeypatch):
+    import sqlcipher3
+
+    from app.ops.backup import create_backup
+    from app.ops.restore import restore_backup
+
+    db_path = _configure(tmp_path, monkeypatch)
+    monkeypatch.setenv("CUSTOS_ALLOW_PLAINTEXT_DB", "0")
+    monkeypatch.setenv("CUSTOS_DATABASE_URL", f"sqlite+pysqlcipher:///{db_path}")
+    monkeypatch.setenv("CUSTOS_DATABASE_KEY", "backup-key")
+    connection = sqlcipher3.dbapi2.connect(str(db_path))
+    connection.execute("PRAGMA key = 'backup-key'")
+    connection.execute("CREATE TABLE note (id INTEGER PRIMARY KEY, body TEXT)")
+    connection.executemany("INSERT INTO note (body) VALUES (?)", [("x" * 500,)] * 200)
+    connection.commit()
+    connection.close()
+
+    first = create_backup()
+    assert first["status"] == "succeeded"
+    assert isinstance(first["page_size"], int) and isinstance(first["pages"], int)
+    assert first["chunks"] == first["chunks_written"] == 1
+    assert first["bytes_written"] == first["bytes"]
+    assert not list(db_path.parent.glob("data/backups/*.partial"))
+    first_path = Path(first["path"]).with_name("backup-20261017-120000.manifest.json")
+    Path(first["path"]).rename(first_path)
+    assert json.loads(first_path.read_text(encoding="utf-8"))["chunk_size"] == first["bytes"]
+
+    db_path.write_bytes(b"")
+    restored = restore_backup(first_path)
+    assert restored["status"] == "restored"
+    assert restored["checksum"] == first["checksum"]
+    connection = sqlcipher3.dbapi2.connect(str(db_path))
+    try:
+        connection.execute("PRAGMA key = 'backup-key'")
+        assert connection.execute("SELECT COUNT(*) FROM note").fetchone()[0] == 200
+    finally:
+        connection.close()
+
+
+def test_backup_retention_prunes_old_points_and_unreferenced_chunks(tmp_path, monkeypatch):
+    from app.ops.backup import _backup_points, _chunk_path, _retained, apply_retention
+
+    _configure(tmp_path, monkeypatch)
+    monkeypatch.setenv("CUSTOS_BACKUP_KEEP_DAILY", "2")
+    monkeypatch.setenv("CUSTOS_BACKUP_KEEP_WEEKLY", "2")
+
+    now = datetime(2026, 10, 18, 12)
+    offsets = [timedelta(0), timedelta(hours=1), timedelta(days=1), timedelta(days=3), timedelta(days=30)]
+    stamps = [now - offset for offset in offsets]
+    # Two newest days (the 18th and 17th) plus the newest point of the two newest ISO weeks.
+    assert _retained(stamps, 2, 2) == {stamps[0], stamps[2], stamps[4]}
+
+    for index, stamp in enumerate(stamps):
+        digest = sha256(str(index).encode()).hexdigest()
+        path = _chunk_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(str(index).encode())
+        manifest = path.parents[2] / f"backup-{stamp:%Y%m%d-%H%M%S}.manifest.json"
+        manifest.write_text(json.dumps({"version": "2", "chunks": [digest]}), encoding="utf-8")
+
+    assert apply_retention() == {"backups_removed": 2, "chunks_removed": 2}
+    assert [stamp for stamp, _ in _backup_points()] == [stamps[0], stamps[2], stamps[4]]
+    assert not _chunk_path(sha256(b"3").hexdigest()).exists()
+    assert _chunk_path(sha256(b"4").hexdigest()).exists()
+
+
+def test_restore_rejects_corrupt_backup_and_keeps_live_database(tmp_path, monkeypatch):
+    from app.ops.restore import restore_backup
+
+    db_path = _configure(tmp_path, monkeypatch)
+    db_path.write_bytes(b"live")
+    backup_path = Path(tmp_path) / "backup-20261017-120000.db"
+    backup_path.write_bytes(b"not a database")
+    meta_path = backup_path.with_suffix(".meta.json")
+    meta_path.write_text(json.dumps({"version": "1", "checksum": "0" * 64}), encoding="utf-8")
+
+    result = restore_backup(backup_path)
+    assert result["error"] == "checksum_mismatch"
+
+    meta_path.write_text(json.dumps({"version": "1"}), encoding="utf-8")
+    result = restore_backup(backup_path)
+    assert result["error"].startswith("verify_error: ")
+    assert "not a database" in result["error"]
+    assert db_path.read_bytes() == b"live"
+    assert list(db_path.parent.glob("*.restore")) == []
+
+
+def test_backup_lock_and_gc_protect_a_running_backup(tmp_path, monkeypatch):
+    import fcntl
+
+    from app.ops.backup import LOCK_FILE, _backup_dir, _chunk_path, collect_garbage, create_backup
+
+    db_path = _configure(tmp_path, monkeypatch)
+    sqlite3.connect(db_path).close()
+    _backup_dir().mkdir(parents=True)
+    with (_backup_dir() / LOCK_FILE).open("a") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        assert create_backup()["error"] == "backup_in_progress"
+
+    # An unlisted chunk written after a running snapshot started is left alone.
+    (_backup_dir() / "snapshot-20261018-120000.db.partial").write_bytes(b"")
+    digest = sha256(b"pending").hexdigest()
+    _chunk_path(digest).parent.mkdir(parents=True)
+    _chunk_path(digest).write_bytes(b"pending")
+    assert collect_garbage() == 0
+    assert _chunk_path(digest).exists()
+
+    # Holding the lock, a new run treats that snapshot as stale and collects the chunk.
+    result = create_backup()
+    assert result["status"] == "succeeded"
+    assert not _chunk_path(digest).exists()
@@ -0,0 +1,71 @@
+def test_commitment_closure_pages_with_cursor_and_filters(test_app):
+    from datetime import datetime, timedelta
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.commitment import Commitment
+    from app.models.meeting import Meeting
+    from app.models.meeting_participant import MeetingParticipant
+    from app.models.person import Person
+    from app.models.source_record import SourceRecord
+
+    init_db()
+    now = datetime.utcnow()
+    session = SessionLocal()
+    try:
+        session.add(Person(id="p_1", name="Alex", type="person"))
+        for meeting_id in ("m_1", "m_2"):
+            session.add(
+                Meeting(id=meeting_id, title=meeting_id, starts_at=now, ends_at=now, source="calendar")
+            )
+            session.add(
+                SourceRecord(
+                    id=f"s_{meeting_id}",
+                    meeting_id=meeting_id,
+                    captured_at=now,
+                    capture_type="notes",
+                    uri=f"local://sources/s_{meeting_id}",
+                    excerpt=f"Notes for {meeting_id}",
+                )
+            )
+        session.add(MeetingParticipant(meeting_id="m_2", person_id="p_1"))
+        due_dates = [now + timedelta(days=2), None, now + timedelta(days=1), None, now + timedelta(days=1)]
+        for index, due_at in enumerate(due_dates):
+            session.add(
+                Commitment(
+                    id=f"c_{index}",
+                    text=f"Commitment {index}",
+                    due_at=due_at,
+                    acknowledged=index == 4,
+                    source_id="s_m_2" if index % 2 else "s_m_1",
+                    created_at=now + timedelta(seconds=index),
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get("/api/commitments/closure", params=params).json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    assert seen == ["c_2", "c_4", "c_0", "c_1", "c_3"]
+
+    data = client.get("/api/commitments/closure", params={"person_id": "p_1"}).json()
+    assert [item["id"] for item in data["items"]] == ["c_1", "c_3"]
+    assert data["items"][0]["source"]["excerpt"] == "Notes for m_2"
+
+    data = client.get("/api/commitments/closure", params={"acknowledged": "false", "meeting_id": "m_1"}).json()
+    assert [item["id"] for item in data["items"]] == ["c_2", "c_0"]
+
+    assert client.get("/api/commitments/closure", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/commitments/closure", params={"limit": 0}).status_code == 400
@@ -28,3 +28,224 @@ def test_ingestion_endpoint_persists_payload(test_app):
         assert job.payload == "Sample meeting notes"
     finally:
         session.close()
+
+
+def test_ingestion_dedupes_repeat_capture(test_app):
+    from datetime import datetime
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.meeting import Meeting
+
+    init_db()
+    session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        session.add(Meeting(id="m_dedupe", title="Dedupe", starts_at=now, ends_at=now))
+        session.commit()
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    first = client.post(
+        "/api/ingestion",
+        json={"meeting_id": "m_dedupe", "capture_type": "notes", "payload": "Send the  deck"},
+    )
+    second = client.post(
+        "/api/ingestion",
+        json={"meeting_id": "m_dedupe", "capture_type": "notes", "payload": "send the deck "},
+    )
+    assert first.status_code == 202
+    assert second.status_code == 202
+    assert first.json()["job_id"] == second.json()["job_id"]
+
+
+def test_bulk_ingestion_ndjson(test_app):
+    import json
+    from datetime import datetime
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.ingestion_job import IngestionJob
+    from app.models.meeting import Meeting
+    from app.models.person import Person
+
+    init_db()
+    session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        session.add(Meeting(id="m_bulk", title="Bulk", starts_at=now, ends_at=now))
+        session.add(Person(id="p_bulk", name="Bulk Person", type="person"))
+        session.commit()
+    finally:
+        session.close()
+
+    lines = [
+        json.dumps({"meeting_id": "m_bulk", "capture_type": "notes", "payload": "First", "people_ids": ["p_bulk", "p_missing"]}),
+        "{not json",
+        json.dumps({"meeting_id": "m_unknown", "capture_type": "notes", "payload": "Lost"}),
+        json.dumps({"meeting_id": "m_bulk", "capture_type": "notes", "payload": "first "}),
+        json.dumps({"meeting_id": "m_bulk", "capture_type": "notes", "payload": "Second"}),
+    ]
+    client = TestClient(test_app)
+    response = client.post(
+        "/api/ingestion/bulk",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 202
+    data = response.json()
+    assert (data["queued"], data["deduped"], data["rejected"]) == (3, 0, 2)
+    statuses = [item["status"] for item in data["items"]]
+    assert statuses == ["queued", "rejected", "rejected", "queued", "queued"]
+
+    repeat = client.post("/api/ingestion/bulk", json=[{"meeting_id": "m_bulk", "capture_type": "notes", "payload": "Second"}])
+    assert repeat.status_code == 202
+    assert repeat.json()["items"][0]["status"] == "deduped"
+    assert repeat.json()["items"][0]["job_id"] == data["items"][4]["job_id"]
+
+    session = SessionLocal()
+    try:
+        job = session.get(IngestionJob, data["items"][0]["job_id"])
+        assert json.loads(job.people_ids) == ["p_bulk"]
+        assert session.query(IngestionJob).count() == 3
+    finally:
+        session.close()
+
+
+def test_bulk_and_single_ingestion_share_dedupe_rule(test_app):
+    from datetime import datetime, timedelta
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.ingestion import worker
+    from app.models.ingestion_job import IngestionJob
+    from app.models.meeting import Meeting
+
+    init_db()
+    session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        session.add(Meeting(id="m_window", title="Window", starts_at=now, ends_at=now))
+        session.commit()
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    capture = {"meeting_id": "m_window", "capture_type": "notes", "payload": "Ship the build"}
+    first_id = client.post("/api/ingestion", json=capture).json()["job_id"]
+    worker.run_once()
+    session = SessionLocal()
+    try:
+        job = session.get(IngestionJob, first_id)
+        source_id = job.source_id
+        job.created_at = datetime.utcnow() - timedelta(hours=1)
+        session.commit()
+    finally:
+        session.close()
+
+    # Outside the window the repeat is queued and takes over the key; within it, both
+    # endpoints dedupe onto the repeat. Empty captures are never deduped.
+    single = client.post("/api/ingestion", json=capture)
+    assert single.status_code == 202
+    assert single.json()["job_id"] != first_id
+    empty = {"meeting_id": "m_window", "capture_type": "notes", "payload": "  "}
+    bulk = client.post("/api/ingestion/bulk", json=[capture, empty, empty]).json()
+    assert [item["status"] for item in bulk["items"]] == ["deduped", "queued", "queued"]
+    assert bulk["items"][0]["job_id"] == single.json()["job_id"]
+    assert client.post("/api/ingestion", json=empty).json()["job_id"] != bulk["items"][1]["job_id"]
+
+    worker.run_once()
+    session = SessionLocal()
+    try:
+        repeat = session.get(IngestionJob, single.json()["job_id"])
+        assert repeat.status == "succeeded"
+        assert repeat.source_id == source_id
+    finally:
+        session.close()
+
+
+def test_recent_captures_return_excerpt_unless_full(test_app):
+    from datetime import datetime
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.ingestion import worker
+    from app.models.ingestion_job import IngestionJob
+    from app.models.meeting import Meeting
+    from app.models.payload_blob import PayloadBlob
+
+    init_db()
+    session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        session.add(Meeting(id="m_recent", title="Recent", starts_at=now, ends_at=now))
+        session.commit()
+    finally:
+        session.close()
+
+    payload = "Transcript line\n" * 100
+    client = TestClient(test_app)
+    response = client.post(
+        "/api/ingestion",
+        json={"meeting_id": "m_recent", "capture_type": "transcript", "payload": payload},
+    )
+    assert response.status_code == 202
+
+    session = SessionLocal()
+    try:
+        job = session.get(IngestionJob, response.json()["job_id"])
+        assert job.payload is None
+        blob = session.get(PayloadBlob, job.payload_digest)
+        assert blob.size == len(payload)
+    finally:
+        session.close()
+
+    worker.run_once()
+
+    item = client.get("/api/ingestion/recent").json()[0]
+    assert item["payload"] is None
+    assert item["excerpt"] == payload.strip()[:240]
+    assert item["payload_length"] == len(payload)
+    assert item["line_count"] == 100
+
+    item = client.get("/api/ingestion/recent?full=true").json()[0]
+    assert item["payload"] == payload
+
+
+def test_ingestion_people_order_keeps_dedupe_key_stable(test_app):
+    import json
+    from datetime import datetime
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.ingestion_job import IngestionJob
+    from app.models.meeting import Meeting
+    from app.models.person import Person
+
+    init_db()
+    session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        session.add(Meeting(id="m_people", title="People", starts_at=now, ends_at=now))
+        session.add_all([Person(id="p_a", name="A", type="person"), Person(id="p_b", name="B", type="person")])
+        session.commit()
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    capture = {"meeting_id": "m_people", "capture_type": "notes", "payload": "Order check"}
+    first = client.post("/api/ingestion", json={**capture, "people_ids": ["p_b", "p_a"]}).json()["job_id"]
+    second = client.post("/api/ingestion", json={**capture, "people_ids": ["p_a", "p_b", "p_a"]}).json()["job_id"]
+    assert first == second
+
+    session = SessionLocal()
+    try:
+        assert json.loads(session.get(IngestionJob, first).people_ids) == ["p_a", "p_b"]
+    finally:
+        session.close()
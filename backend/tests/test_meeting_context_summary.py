@@ -0,0 +1,79 @@
+def test_meeting_context_summary_tracks_sources_acks_and_moves(test_app):
+    from datetime import datetime, timedelta
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.commitment import Commitment
+    from app.models.meeting import Meeting
+    from app.models.meeting_context_summary import MeetingContextSummary
+    from app.models.source_record import SourceRecord
+
+    init_db()
+    now = datetime.utcnow()
+    midday = datetime(now.year, now.month, now.day, 12)
+    session = SessionLocal()
+    try:
+        for meeting_id in ("m_a", "m_b"):
+            session.add(
+                Meeting(
+                    id=meeting_id,
+                    title=f"Meeting {meeting_id}",
+                    starts_at=midday,
+                    ends_at=midday + timedelta(hours=1),
+                    source="calendar",
+                )
+            )
+        session.add(
+            SourceRecord(
+                id="s_old",
+                meeting_id="m_a",
+                captured_at=now - timedelta(days=2),
+                capture_type="notes",
+                uri="local://sources/s_old",
+            )
+        )
+        session.add(
+            SourceRecord(
+                id="s_new",
+                meeting_id="m_a",
+                captured_at=now - timedelta(hours=1),
+                capture_type="notes",
+                uri="local://sources/s_new",
+            )
+        )
+        session.add(Commitment(id="c_1", text="Send the deck", source_id="s_new"))
+        session.add(Commitment(id="c_2", text="Book the room", source_id="s_old"))
+        session.commit()
+
+        summary = session.get(MeetingContextSummary, "m_a")
+        assert summary.last_source_id == "s_new"
+        assert summary.source_count == 2
+        assert summary.commitment_count == 2
+        assert summary.open_commitment_count == 2
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    response = client.post("/api/commitments/c_1/ack", json={"acknowledged": True})
+    assert response.status_code == 200
+    response = client.patch("/api/sources/s_new/move", json={"meeting_id": "m_b"})
+    assert response.status_code == 200
+
+    session = SessionLocal()
+    try:
+        old = session.get(MeetingContextSummary, "m_a")
+        assert old.last_source_id == "s_old"
+        assert old.source_count == 1
+        assert old.commitment_count == 1
+        assert old.open_commitment_count == 1
+        moved = session.get(MeetingContextSummary, "m_b")
+        assert moved.last_source_id == "s_new"
+        assert moved.commitment_count == 1
+        assert moved.open_commitment_count == 0
+    finally:
+        session.close()
+
+    today = client.get("/api/briefings/today").json()
+    counts = {item["id"]: item["open_commitments"] for item in today["meetings"]}
+    assert counts == {"m_a": 1, "m_b": 1}
@@ -0,0 +1,137 @@
+def _queue_reflection(session, payload):
+    from uuid import uuid4
+
+    from app.models.ingestion_job import IngestionJob
+
+    job_id = f"j_{uuid4().hex}"
+    session.add(
+        IngestionJob(
+            id=job_id,
+            meeting_id="m_1",
+            payload=payload,
+            capture_type="reflection",
+            index_in_memory=True,
+            status="queued",
+        )
+    )
+    session.commit()
+    return job_id
+
+
+def test_indexer_batches_pending_sources(test_app, monkeypatch):
+    from app.db import SessionLocal, init_db
+    from app.ingestion import indexer, worker
+    from app.models.source_record import SourceRecord
+
+    calls = []
+    monkeypatch.setattr(indexer, "add_documents", lambda documents, metadata, ids: calls.append(ids))
+
+    init_db()
+    session = SessionLocal()
+    try:
+        _queue_reflection(session, "First reflection")
+        _queue_reflection(session, "Second reflection")
+    finally:
+        session.close()
+
+    assert worker.run_once(batch_size=5) == 2
+    session = SessionLocal()
+    try:
+        assert {source.index_status for source in session.query(SourceRecord).all()} == {"pending"}
+    finally:
+        session.close()
+
+    assert indexer.run_once() == 2
+    assert len(calls) == 1 and len(calls[0]) == 2
+    assert indexer.run_once() == 0
+
+    session = SessionLocal()
+    try:
+        assert {source.index_status for source in session.query(SourceRecord).all()} == {"indexed"}
+    finally:
+        session.close()
+
+
+def test_indexer_retries_failures(test_app, monkeypatch):
+    from app.db import SessionLocal, init_db
+    from app.ingestion import indexer, worker
+    from app.models.source_record import SourceRecord
+
+    def failing_add(documents, metadata, ids):
+        raise RuntimeError("qdrant offline")
+
+    monkeypatch.setattr(indexer, "add_documents", failing_add)
+
+    init_db()
+    session = SessionLocal()
+    try:
+        _queue_reflection(session, "Retry reflection")
+    finally:
+        session.close()
+
+    worker.run_once()
+    assert indexer.run_once() == 1
+    assert indexer.run_once() == 0
+
+    session = SessionLocal()
+    try:
+        source = session.query(SourceRecord).one()
+        assert source.index_status == "pending"
+        assert source.index_attempts == 1
+        assert source.index_retry_at is not None
+        assert "qdrant offline" in source.index_error
+    finally:
+        session.close()
+
+
+def test_indexer_claims_sources_once(test_app):
+    from datetime import datetime
+
+    from app.db import SessionLocal, init_db
+    from app.ingestion import indexer, worker
+
+    init_db()
+    session = SessionLocal()
+    try:
+        _queue_reflection(session, "Claimed reflection")
+    finally:
+        session.close()
+    worker.run_once()
+
+    first = SessionLocal()
+    second = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        assert len(indexer._claim_sources(first, now, 10)) == 1
+        assert indexer._claim_sources(second, now, 10) == []
+    finally:
+        first.close()
+        second.close()
+
+
+def test_indexer_loop_survives_errors(test_app, monkeypatch, caplog):
+    import pytest
+
+    from app.ingestion import indexer
+
+    # Alembic's fileConfig in the migration tests disables loggers that already exist.
+    monkeypatch.setattr(indexer.logger, "disabled", False)
+
+    passes = []
+
+    def flaky_run_once():
+        passes.append(1)
+        raise RuntimeError("database is locked")
+
+    def stop_after_two(seconds):
+        if len(passes) >= 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(indexer, "run_once", flaky_run_once)
+    monkeypatch.setattr(indexer.time, "sleep", stop_after_two)
+    with caplog.at_level("ERROR", logger="app.ingestion.indexer"):
+        with pytest.raises(KeyboardInterrupt):
+            indexer.run_forever()
+    assert len(passes) == 2
+    assert all(record.exc_info for record in caplog.records)
+    assert "database is locked" in caplog.text
@@ -0,0 +1,16 @@
+def test_metrics_exposition(test_app):
+    from fastapi.testclient import TestClient
+
+    from app.db import init_db
+
+    init_db()
+    client = TestClient(test_app)
+    assert client.get("/api/briefings/today").status_code == 200
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE custos_http_request_duration_seconds histogram" in body
+    assert 'route="/api/briefings/today"' in body
+    assert 'custos_db_queries_per_request_count{route="/api/briefings/today"}' in body
+    assert 'custos_ingestion_queue_depth{status="queued"} 0' in body
@@ -0,0 +1,27 @@
+def test_large_payloads_are_compressed_and_round_trip(test_app, monkeypatch):
+    from app.db import SessionLocal, init_db
+    from app.models.payload_blob import PayloadBlob
+    from app.ops.payload_store import load_payloads, store_payloads
+
+    monkeypatch.setenv("CUSTOS_PAYLOAD_CODEC", "zlib")
+    monkeypatch.setenv("CUSTOS_PAYLOAD_COMPRESS_MIN_BYTES", "256")
+    init_db()
+    transcript = "Speaker 1: we should ship the report by Friday.\n" * 200
+    note = "Short note"
+
+    session = SessionLocal()
+    try:
+        large_digest, small_digest = store_payloads(session, [transcript, note])
+        session.commit()
+
+        large = session.get(PayloadBlob, large_digest)
+        small = session.get(PayloadBlob, small_digest)
+        assert large.codec == "zlib"
+        assert large.size == len(transcript)
+        assert len(large.data) * 3 < large.size
+        assert small.codec == "raw"
+
+        loaded = load_payloads(session, [large_digest, small_digest])
+        assert loaded == {large_digest: transcript, small_digest: note}
+    finally:
+        session.close()
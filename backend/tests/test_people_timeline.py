@@ -54,3 +54,96 @@ def test_people_timeline_order_and_source(test_app):
     assert data["timeline"][0]["meeting_id"] == "m_new"
     assert data["timeline"][0]["source_id"] == "s_new"
     assert data["timeline"][1]["source_missing"] is True
+
+
+def test_people_timeline_cursor_pagination(test_app):
+    from datetime import datetime, timedelta
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.meeting import Meeting
+    from app.models.meeting_participant import MeetingParticipant
+    from app.models.person import Person
+    from app.models.source_record import SourceRecord
+
+    init_db()
+    session = SessionLocal()
+    try:
+        session.add(Person(id="p_page", name="Pat", type="person"))
+        base = datetime(2026, 1, 1, 9, 0)
+        for i in range(5):
+            meeting_id = f"m_page_{i}"
+            starts_at = base + timedelta(days=i)
+            session.add(Meeting(id=meeting_id, title=f"Meeting {i}", starts_at=starts_at, ends_at=starts_at))
+            session.add(MeetingParticipant(meeting_id=meeting_id, person_id="p_page"))
+            for j in range(2):
+                session.add(
+                    SourceRecord(
+                        id=f"s_page_{i}_{j}",
+                        meeting_id=meeting_id,
+                        captured_at=starts_at + timedelta(minutes=j),
+                        capture_type="notes",
+                        uri=f"local://sources/s_page_{i}_{j}",
+                    )
+                )
+        session.commit()
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    first = client.get("/api/people/p_page/timeline?limit=2").json()
+    assert [item["meeting_id"] for item in first["timeline"]] == ["m_page_4", "m_page_3"]
+    assert [item["source_id"] for item in first["timeline"]] == ["s_page_4_1", "s_page_3_1"]
+    assert first["page"]["has_more"] is True
+
+    second = client.get(
+        "/api/people/p_page/timeline", params={"limit": 2, "before": first["page"]["next_before"]}
+    ).json()
+    assert [item["meeting_id"] for item in second["timeline"]] == ["m_page_2", "m_page_1"]
+
+    newer = client.get(
+        "/api/people/p_page/timeline", params={"limit": 2, "after": second["page"]["next_after"]}
+    ).json()
+    assert [item["meeting_id"] for item in newer["timeline"]] == ["m_page_4", "m_page_3"]
+    assert newer["page"]["has_more"] is False
+
+
+def test_people_timeline_pages_through_shared_start_times(test_app):
+    from datetime import datetime
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.meeting import Meeting
+    from app.models.meeting_participant import MeetingParticipant
+    from app.models.person import Person
+
+    init_db()
+    session = SessionLocal()
+    try:
+        session.add(Person(id="p_same", name="Sam", type="person"))
+        starts_at = datetime(2026, 3, 2, 9, 0)
+        for i in range(5):
+            session.add(Meeting(id=f"m_same_{i}", title=f"Import {i}", starts_at=starts_at, ends_at=starts_at))
+            session.add(MeetingParticipant(meeting_id=f"m_same_{i}", person_id="p_same"))
+        session.commit()
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    seen = []
+    params = {"limit": 2}
+    while True:
+        page = client.get("/api/people/p_same/timeline", params=params).json()
+        seen.extend(item["meeting_id"] for item in page["timeline"])
+        if not page["page"]["has_more"]:
+            break
+        params = {"limit": 2, "before": page["page"]["next_before"]}
+    assert seen == [f"m_same_{i}" for i in range(5)]
+
+    newer = client.get(
+        "/api/people/p_same/timeline", params={"limit": 2, "after": page["page"]["next_after"]}
+    ).json()
+    assert [item["meeting_id"] for item in newer["timeline"]] == ["m_same_2", "m_same_3"]
+    assert client.get("/api/people/p_same/timeline", params={"before": "nope"}).status_code == 400
@@ -0,0 +1,103 @@
+def test_meetings_list_revalidates_with_etag(test_app):
+    from datetime import datetime, timedelta
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.meeting import Meeting
+
+    init_db()
+    client = TestClient(test_app)
+
+    first = client.get("/api/meetings")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    cached = client.get("/api/meetings", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    # Writes from another process (e.g. the worker) invalidate through the shared generation row.
+    now = datetime.utcnow()
+    session = SessionLocal()
+    try:
+        session.add(
+            Meeting(
+                id="m_cache",
+                title="Cache check",
+                starts_at=now + timedelta(hours=1),
+                ends_at=now + timedelta(hours=2),
+                source="calendar",
+            )
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    refreshed = client.get("/api/meetings", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert [item["id"] for item in refreshed.json()["meetings"]] == ["m_cache"]
+
+
+def test_response_cache_can_be_disabled(test_app, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.db import init_db
+
+    monkeypatch.setenv("CUSTOS_RESPONSE_CACHE_SECONDS", "0")
+    init_db()
+    client = TestClient(test_app)
+
+    first = client.get("/api/commitments/closure")
+    assert first.status_code == 200
+    second = client.get("/api/commitments/closure")
+    assert second.json()["updated_at"] != first.json()["updated_at"]
+
+
+def test_index_bookkeeping_keeps_cache_generation(test_app):
+    from datetime import datetime, timedelta
+
+    from app.cache import current_generation
+    from app.db import SessionLocal, init_db
+    from app.models.meeting import Meeting
+    from app.models.source_record import SourceRecord
+
+    init_db()
+    now = datetime.utcnow()
+    session = SessionLocal()
+    try:
+        session.add(
+            Meeting(
+                id="m_index",
+                title="Index check",
+                starts_at=now,
+                ends_at=now + timedelta(hours=1),
+                source="calendar",
+            )
+        )
+        session.add(
+            SourceRecord(
+                id="s_index",
+                meeting_id="m_index",
+                captured_at=now,
+                capture_type="reflection",
+                uri="custos://s_index",
+                index_status="pending",
+            )
+        )
+        session.commit()
+        generation = current_generation(session)
+
+        source = session.get(SourceRecord, "s_index")
+        source.index_status = "indexed"
+        source.index_attempts = 1
+        session.commit()
+        assert current_generation(session) == generation
+
+        source.excerpt = "Edited excerpt"
+        session.commit()
+        assert current_generation(session) != generation
+    finally:
+        session.close()
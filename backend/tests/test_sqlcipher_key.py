@@ -0,0 +1,90 @@
+def test_encrypted_engine_switches_to_derived_raw_key(tmp_path, monkeypatch):
+    import hashlib
+
+    import sqlcipher3
+    from sqlalchemy import text
+
+    from app.db import create_db_engine
+    from app.sqlcipher import connection_key_pragmas, read_salt
+
+    db_path = tmp_path / "custos.db"
+    monkeypatch.setenv("CUSTOS_ALLOW_PLAINTEXT_DB", "0")
+    monkeypatch.setenv("CUSTOS_DATABASE_URL", f"sqlite+pysqlcipher:///{db_path}")
+    monkeypatch.setenv("CUSTOS_DATABASE_KEY", "correct horse")
+
+    engine = create_db_engine()
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE note (id INTEGER PRIMARY KEY)"))
+            connection.execute(text("INSERT INTO note (id) VALUES (1)"))
+    finally:
+        engine.dispose()
+
+    salt = read_salt(str(db_path))
+    assert salt is not None
+    statements = connection_key_pragmas(sqlcipher3.dbapi2, str(db_path), salt)
+    raw_key = hashlib.pbkdf2_hmac("sha512", b"correct horse", salt, 256000, 32)
+    assert statements == [f"PRAGMA key = \"x'{raw_key.hex()}{salt.hex()}'\";"]
+
+    engine = create_db_engine()
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM note")).scalar_one() == 1
+    finally:
+        engine.dispose()
+
+    # A key that cannot open the file keeps the passphrase path.
+    monkeypatch.setenv("CUSTOS_DATABASE_KEY", "wrong")
+    assert connection_key_pragmas(sqlcipher3.dbapi2, str(db_path), salt) == ["PRAGMA key = 'wrong';"]
+
+
+def test_encrypted_engine_reads_salt_once_per_pool(tmp_path, monkeypatch):
+    from sqlalchemy import text
+
+    from app import db
+    from app.sqlcipher import read_salt
+
+    db_path = tmp_path / "custos.db"
+    monkeypatch.setenv("CUSTOS_ALLOW_PLAINTEXT_DB", "0")
+    monkeypatch.setenv("CUSTOS_DATABASE_URL", f"sqlite+pysqlcipher:///{db_path}")
+    monkeypatch.setenv("CUSTOS_DATABASE_KEY", "correct horse")
+    monkeypatch.setenv("CUSTOS_DB_PATH", str(db_path))
+    reads = []
+
+    def counting_read_salt(path):
+        reads.append(path)
+        return read_salt(path)
+
+    monkeypatch.setattr(db, "read_salt", counting_read_salt)
+    engine = db.create_db_engine()
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE note (id INTEGER PRIMARY KEY)"))
+        # The file had no salt when the first connection opened; the next one finds it.
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+        assert len(reads) == 2
+
+        engine.dispose()
+        with engine.connect() as first, engine.connect() as second:
+            assert first.execute(text("SELECT COUNT(*) FROM note")).scalar_one() == 0
+            second.execute(text("SELECT 1"))
+        assert len(reads) == 3
+    finally:
+        engine.dispose()
+
+
+def test_in_memory_database_url_skips_pool_sizing(monkeypatch):
+    from sqlalchemy import text
+
+    from app.db import create_db_engine
+
+    monkeypatch.setenv("CUSTOS_ALLOW_PLAINTEXT_DB", "1")
+    monkeypatch.setenv("CUSTOS_DATABASE_URL", "sqlite:///:memory:")
+    engine = create_db_engine()
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar_one() == 1
+    finally:
+        engine.dispose()
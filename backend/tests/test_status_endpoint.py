@@ -31,3 +31,106 @@ def test_status_endpoint_reports_health(test_app):
     data = response.json()
     assert data["health"] == "attention"
     assert data["db_encrypted"] is False
+
+
+def test_ingestion_stage_percentiles(test_app):
+    from datetime import datetime
+    from uuid import uuid4
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.ingestion import worker
+    from app.models.ingestion_job import IngestionJob
+
+    init_db()
+    session = SessionLocal()
+    try:
+        for i in range(3):
+            session.add(
+                IngestionJob(
+                    id=f"j_{uuid4().hex}",
+                    meeting_id="m_1",
+                    payload=f"Stage note {i}\n- Send update {i}\n",
+                    capture_type="notes",
+                    status="queued",
+                    created_at=datetime.utcnow(),
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+
+    assert worker.run_once(batch_size=3) == 3
+
+    client = TestClient(test_app)
+    response = client.get("/api/status/ingestion-stages")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sample_size"] == 3
+    for stage in ["dedupe", "commitments", "risk_flags", "source_insert", "participants", "last_interaction"]:
+        assert data["stages"][stage]["count"] == 3
+        assert data["stages"][stage]["p50_ms"] <= data["stages"][stage]["p99_ms"]
+
+
+def test_relationship_signals_use_interaction_buckets(test_app):
+    from datetime import datetime, time, timedelta
+
+    from fastapi.testclient import TestClient
+
+    from app.db import SessionLocal, init_db
+    from app.models.meeting import Meeting
+    from app.models.meeting_participant import MeetingParticipant
+    from app.models.person import Person
+    from app.models.person_interaction_day import PersonInteractionDay
+    from app.models.source_record import SourceRecord
+
+    init_db()
+    now = datetime.utcnow()
+    session = SessionLocal()
+    try:
+        session.add(Person(id="p_a", name="Alex", type="person"))
+        session.add(Person(id="p_b", name="Blake", type="person"))
+        session.add(
+            Meeting(id="m_1", title="Sync", starts_at=now, ends_at=now + timedelta(hours=1), source="calendar")
+        )
+        session.add(MeetingParticipant(meeting_id="m_1", person_id="p_b"))
+        session.commit()
+        # The last capture falls on the day the 30-day window starts, but before it.
+        edge = datetime.combine((now - timedelta(days=30)).date(), time.min)
+        captured = [now - timedelta(days=1), now - timedelta(days=2), now - timedelta(days=45), edge]
+        for index, captured_at in enumerate(captured):
+            session.add(
+                SourceRecord(
+                    id=f"s_{index}",
+                    meeting_id="m_1",
+                    captured_at=captured_at,
+                    capture_type="notes",
+                    uri=f"local://sources/s_{index}",
+                )
+            )
+        session.commit()
+        # A participant added after the sources picks up their existing days.
+        session.add(MeetingParticipant(meeting_id="m_1", person_id="p_a"))
+        session.commit()
+        assert session.query(PersonInteractionDay).filter_by(person_id="p_a").count() == 4
+    finally:
+        session.close()
+
+    client = TestClient(test_app)
+    signals = client.get("/api/status/relationship-signals?sort=recent&limit=1").json()
+    assert [item["recent_context_count"] for item in signals["items"]] == [2]
+    assert signals["page"] == {"limit": 1, "offset": 0, "total": 2, "has_more": True}
+
+    # Without a limit every person comes back, as before paging.
+    signals = client.get("/api/status/relationship-signals").json()
+    assert len(signals["items"]) == 2
+    assert signals["page"]["has_more"] is False
+
+    trajectories = client.get("/api/status/relationship-trajectories").json()
+    by_id = {item["id"]: item for item in trajectories["items"]}
+    assert by_id["p_a"]["recent_count"] == 2
+    assert by_id["p_a"]["prior_count"] == 2
+    assert by_id["p_b"]["trajectory"] == "Steady"
+
+    assert client.get("/api/status/relationship-signals?sort=bogus").status_code == 400
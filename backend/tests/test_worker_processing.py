@@ -36,6 +36,7 @@ def test_worker_processes_job(test_app):
         commitment = session.query(Commitment).first()
         flags = session.query(RiskFlag).all()
         assert source is not None
+        assert source.excerpt == "Blocked by vendor, due Friday\n- Send update"
         assert commitment is not None
         assert commitment.text == "Blocked by vendor, due Friday"
         assert len(flags) == 2
@@ -43,3 +44,108 @@ def test_worker_processes_job(test_app):
         assert flag_types == {"deadline_reference", "blocker_reference"}
     finally:
         session.close()
+
+
+def test_worker_claims_batch(test_app):
+    from datetime import datetime, timedelta
+    from uuid import uuid4
+
+    from app.db import SessionLocal, init_db
+    from app.ingestion import worker
+    from app.models.ingestion_job import IngestionJob
+    from app.models.source_record import SourceRecord
+
+    init_db()
+    session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        for i in range(5):
+            session.add(
+                IngestionJob(
+                    id=f"j_{uuid4().hex}",
+                    meeting_id="m_1",
+                    payload=f"Batch note {i}\n- Send update {i}\n",
+                    capture_type="notes",
+                    status="queued",
+                    created_at=now + timedelta(seconds=i),
+                )
+            )
+        session.commit()
+    finally:
+        session.close()
+
+    assert worker.run_once(batch_size=3) == 3
+    assert worker.run_once(batch_size=3) == 2
+    assert worker.run_once(batch_size=3) == 0
+
+    session = SessionLocal()
+    try:
+        statuses = {job.status for job in session.query(IngestionJob).all()}
+        assert statuses == {"succeeded"}
+        assert session.query(SourceRecord).count() == 5
+    finally:
+        session.close()
+
+
+def test_worker_leases_are_exclusive_and_reclaimed(test_app):
+    from datetime import datetime, timedelta
+    from uuid import uuid4
+
+    from app.db import SessionLocal, init_db
+    from app.ingestion import worker
+    from app.models.ingestion_job import IngestionJob
+
+    init_db()
+    session = SessionLocal()
+    try:
+        job_id = f"j_{uuid4().hex}"
+        session.add(
+            IngestionJob(
+                id=job_id,
+                meeting_id="m_1",
+                payload="Lease note\n- Send update\n",
+                capture_type="notes",
+                status="queued",
+            )
+        )
+        session.commit()
+
+        claimed = worker._claim_queued_jobs(session, 5, "worker-a")
+        assert [job.id for job in claimed] == [job_id]
+        assert worker._claim_queued_jobs(session, 5, "worker-b") == []
+
+        session.query(IngestionJob).filter_by(id=job_id).update(
+            {IngestionJob.lease_expires_at: datetime.utcnow() - timedelta(seconds=1)}
+        )
+        session.commit()
+        assert worker._reclaim_expired_leases(session, datetime.utcnow()) == 1
+        session.commit()
+
+        reclaimed = worker._claim_queued_jobs(session, 5, "worker-b")
+        assert [job.id for job in reclaimed] == [job_id]
+        assert worker._release_leases(session, reclaimed, "worker-a") is False
+        session.rollback()
+    finally:
+        session.close()
+
+    assert worker.run_once(batch_size=5, worker_id="worker-c") == 0
+    session = SessionLocal()
+    try:
+        job = session.get(IngestionJob, job_id)
+        assert job.status == "running"
+        assert job.lease_owner == "worker-b"
+    finally:
+        session.close()
+
+
+def test_worker_initializes_schema_once(test_app, monkeypatch):
+    from app.ingestion import worker
+
+    calls = []
+    original = worker.init_db
+    monkeypatch.setattr(worker, "init_db", lambda: calls.append(1) or original())
+
+    worker.run_once()
+    worker.run_once()
+    worker.run_once()
+    assert len(calls) == 1
@@ -0,0 +1,93 @@
+import os
+import socket
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_notify_wakes_listener():
+    from app.ingestion.wakeup import WakeListener, notify_worker
+
+    port = _free_port()
+    os.environ["CUSTOS_WORKER_WAKE_PORT"] = str(port)
+    listener = WakeListener()
+    try:
+        assert listener.active
+        assert listener.wait(0.01) is False
+        notify_worker()
+        notify_worker()
+        assert listener.wait(1.0) is True
+        assert listener.wait(0.01) is False
+    finally:
+        listener.close()
+        os.environ.pop("CUSTOS_WORKER_WAKE_PORT", None)
+
+
+def test_listener_disabled_falls_back_to_sleep():
+    from app.ingestion.wakeup import WakeListener
+
+    listener = WakeListener(port=0)
+    assert not listener.active
+    assert listener.wait(0.01) is False
+
+
+def test_poll_backs_off_only_with_active_listener(test_app, monkeypatch):
+    import pytest
+
+    from app.ingestion import worker
+
+    class _Stop(Exception):
+        pass
+
+    class _Listener:
+        def __init__(self, active):
+            self.active = active
+            self.waits = []
+
+        def wait(self, timeout):
+            self.waits.append(timeout)
+            if len(self.waits) == 4:
+                raise _Stop()
+            return False
+
+    monkeypatch.setattr(worker, "run_once", lambda *_args: 0)
+    monkeypatch.setenv("CUSTOS_WORKER_MAX_POLL_SECONDS", "30")
+    base = worker.POLL_SECONDS
+
+    polling = _Listener(active=False)
+    with pytest.raises(_Stop):
+        worker.run_forever("w_test", polling)
+    assert polling.waits == [base] * 4
+
+    listening = _Listener(active=True)
+    with pytest.raises(_Stop):
+        worker.run_forever("w_test", listening)
+    assert listening.waits == [base, base * 2, base * 4, base * 8]
+
+
+def test_worker_processes_share_wake_port(caplog, monkeypatch):
+    from app.ingestion import wakeup
+    from app.ingestion.wakeup import WakeListener
+
+    # Alembic's fileConfig in the migration tests disables loggers that already exist.
+    monkeypatch.setattr(wakeup.logger, "disabled", False)
+
+    port = _free_port()
+    first = WakeListener(port=port)
+    second = WakeListener(port=port)
+    try:
+        assert first.active and second.active
+    finally:
+        first.close()
+        second.close()
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as taken:
+        # A socket without SO_REUSEPORT keeps the port to itself.
+        taken.bind(("127.0.0.1", 0))
+        with caplog.at_level("WARNING", logger="app.ingestion.wakeup"):
+            listener = WakeListener(port=taken.getsockname()[1])
+        assert not listener.active
+    assert "falling back to polling" in caplog.text
@@ -413,7 +413,9 @@ function renderRecentCapture(item) {
   when.className = 'muted';
   when.textContent = formatDate(item.captured_at) || 'recent';
   const body = document.createElement('p');
-  body.textContent = item.payload;
+  const text = item.payload || item.excerpt || '';
+  const truncated = !item.payload && item.payload_length > text.length;
+  body.textContent = truncated ? `${text}…` : text;
   card.appendChild(header);
   card.appendChild(when);
   card.appendChild(body);
@@ -447,7 +449,7 @@ function renderReflections(items) {
     when.className = 'muted';
     when.textContent = item.captured_at ? `Captured ${formatDate(item.captured_at)}` : 'Captured recently';
     const text = document.createElement('p');
-    const payload = item.payload?.trim() || 'No reflection text available.';
+    const payload = (item.payload || item.excerpt)?.trim() || 'No reflection text available.';
     text.textContent = payload.length > 200 ? `${payload.slice(0, 197)}…` : payload;
     card.appendChild(title);
     card.appendChild(when);
@@ -973,7 +975,12 @@ async function loadBriefings() {
     }
   }
 
-  const closureResponse = await fetch(apiUrl('/api/commitments/closure'), { headers: getApiHeaders() });
+  // Mixed signals only look at the last week; day resolution keeps the URL cacheable.
+  const closureSince = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000).toISOString().slice(0, 10);
+  const closureResponse = await fetch(
+    apiUrl(`/api/commitments/closure?created_after=${closureSince}&limit=1000`),
+    { headers: getApiHeaders() },
+  );
   if (closureResponse.ok) {
     const closureData = await closureResponse.json();
     renderMixedRelationshipSignals(closureData.items || []);
@@ -286,15 +286,24 @@ async function loadClosure() {
   if (!getApiBase() || !isSetupComplete()) {
     return;
   }
-  const response = await fetch(apiUrl('/api/commitments/closure'), { headers: getApiHeaders() });
-  if (!response.ok) {
-    if (closureCards) {
-      closureCards.innerHTML = '<div class="card"><p class="muted">Unable to load commitment closure.</p></div>';
+  // The closure API pages with an opaque cursor; follow it so no commitments are dropped.
+  const items = [];
+  let cursor = null;
+  do {
+    const params = new URLSearchParams({ limit: '1000' });
+    if (cursor) params.set('cursor', cursor);
+    const response = await fetch(apiUrl(`/api/commitments/closure?${params}`), { headers: getApiHeaders() });
+    if (!response.ok) {
+      if (closureCards) {
+        closureCards.innerHTML = '<div class="card"><p class="muted">Unable to load commitment closure.</p></div>';
+      }
+      return;
     }
-    return;
-  }
-  const data = await response.json();
-  renderClosure(data.items || []);
+    const data = await response.json();
+    items.push(...(data.items || []));
+    cursor = data.next_cursor;
+  } while (cursor);
+  renderClosure(items);
 }
 
 function renderThreads(threads) {
@@ -385,7 +394,7 @@ function renderDecisions(items) {
     meta.className = 'muted';
     meta.textContent = item.captured_at ? `Captured ${formatDate(item.captured_at)}` : 'Captured time unknown';
     const excerpt = document.createElement('p');
-    const text = item.payload?.trim() || 'No capture excerpt available.';
+    const text = (item.payload || item.excerpt)?.trim() || 'No capture excerpt available.';
     excerpt.textContent = text.length > 160 ? `${text.slice(0, 157)}…` : text;
     card.appendChild(title);
     card.appendChild(meta);
@@ -507,15 +516,25 @@ async function loadRelationshipSignals() {
   if (!getApiBase() || !isSetupComplete()) {
     return;
   }
-  const response = await fetch(apiUrl('/api/status/relationship-signals'), { headers: getApiHeaders() });
-  if (!response.ok) {
-    if (relationshipSignalsCards) {
-      relationshipSignalsCards.innerHTML = '<div class="card"><p class="muted">Unable to load relationship signals.</p></div>';
+  // The endpoint is paged by offset; keep reading until the last page so nobody is dropped.
+  const limit = 1000;
+  const items = [];
+  let offset = 0;
+  let data = null;
+  do {
+    const params = new URLSearchParams({ limit: String(limit), offset: String(offset) });
+    const response = await fetch(apiUrl(`/api/status/relationship-signals?${params}`), { headers: getApiHeaders() });
+    if (!response.ok) {
+      if (relationshipSignalsCards) {
+        relationshipSignalsCards.innerHTML = '<div class="card"><p class="muted">Unable to load relationship signals.</p></div>';
+      }
+      return;
     }
-    return;
-  }
-  const data = await response.json();
-  renderRelationshipSignals(data);
+    data = await response.json();
+    items.push(...(data.items || []));
+    offset += limit;
+  } while (data.page?.has_more);
+  renderRelationshipSignals({ ...data, items });
 }
 
 async function refreshDemoMode() {